@@ -6,4 +6,8 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'  # Otomatik oluşturulan birincil anahtar tipi
-    name = 'accounts'  # Uygulama adı (INSTALLED_APPS'ta referans alınır)
\ No newline at end of file
+    name = 'accounts'  # Uygulama adı (INSTALLED_APPS'ta referans alınır)
+
+    def ready(self):
+        # Token önbelleği invalidasyon sinyallerini ve sistem kontrollerini bağla
+        from . import checks, signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,259 @@
+# accounts/cache_layer.py
+"""
+Yardım Masası - İsim Alanlı Önbellek Katmanı
+============================================
+
+Uygulama önbellek kayıtları isim alanlarına (tickets / users / settings)
+ayrılır. Her isim alanının paylaşılan cache'te bir sürüm numarası vardır;
+anahtarlar bu sürümle yazılır, böylece bir isim alanını geçersiz kılmak
+tek bir `incr` işlemidir (anahtar taraması gerekmez, eski sürümdeki
+kayıtlar TTL'leri dolunca kendiliğinden düşer).
+
+- Sürüm numarası process içinde CACHE_VERSION_LOCAL_TTL saniye tutulur;
+  başka bir worker'daki geçersiz kılma en geç bu süre içinde görülür.
+- İsabet/ıskalama sayaçları process içinde biriktirilir ve en fazla
+  CACHE_STATS_FLUSH_INTERVAL saniyede bir paylaşılan cache'e eklenir
+  (her okuma için ek yazma yapılmaz).
+- Anahtar sayıları backend'e göre hesaplanır (LocMem: bellekteki anahtarlar,
+  Redis: SCAN). Dosya tabanlı cache'te isim alanı ayrımı yapılamaz.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .request_metrics import record_cache_lookup
+
+NAMESPACES = {
+    'tickets': 'Talep sayaçları ve dashboard verileri',
+    'users': 'Token çözümleme ve kullanıcı kayıtları',
+    'settings': 'Sistem ayarları',
+}
+
+VERSION_KEY = 'cache_ns_version:{}'
+STATS_KEY = 'cache_ns_stats:{}:{}'
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+def _incr(key, delta=1):
+    """Sayaç yoksa oluşturarak artır (DummyCache'te sessizce 0 döner)"""
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, None)
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            return 0
+
+# ================================================================================
+# İsabet / Iskalama Sayaçları
+# ================================================================================
+
+class NamespaceStats:
+    """İsim alanı başına isabet/ıskalama sayaçları (process içi birikim + paylaşılan toplam)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush = time.monotonic()
+
+    def record(self, namespace, hit):
+        record_cache_lookup(hit)
+        with self._lock:
+            counts = self._pending.setdefault(namespace, [0, 0])
+            counts[0 if hit else 1] += 1
+            due = time.monotonic() - self._last_flush >= _setting('CACHE_STATS_FLUSH_INTERVAL', 30)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Biriken sayaçları paylaşılan cache'e ekle"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        for namespace, (hits, misses) in pending.items():
+            if hits:
+                _incr(STATS_KEY.format(namespace, 'hits'), hits)
+            if misses:
+                _incr(STATS_KEY.format(namespace, 'misses'), misses)
+
+    def totals(self, namespace):
+        """Tüm worker'ların (flush edilmiş) toplamı + bu process'in bekleyen sayaçları"""
+        shared = cache.get_many([STATS_KEY.format(namespace, 'hits'), STATS_KEY.format(namespace, 'misses')])
+        with self._lock:
+            pending_hits, pending_misses = self._pending.get(namespace, (0, 0))
+        return (
+            shared.get(STATS_KEY.format(namespace, 'hits'), 0) + pending_hits,
+            shared.get(STATS_KEY.format(namespace, 'misses'), 0) + pending_misses,
+        )
+
+    def reset(self, namespace):
+        with self._lock:
+            self._pending.pop(namespace, None)
+        cache.delete_many([STATS_KEY.format(namespace, 'hits'), STATS_KEY.format(namespace, 'misses')])
+
+namespace_stats = NamespaceStats()
+
+# ================================================================================
+# İsim Alanı
+# ================================================================================
+
+_versions = {}
+_versions_lock = threading.Lock()
+
+class CacheNamespace:
+    """Sürümlü anahtarlarla çalışan isim alanı (get / set / delete / get_or_set / invalidate)"""
+
+    def __init__(self, name):
+        if name not in NAMESPACES:
+            raise ValueError(f'Bilinmeyen cache isim alanı: {name}')
+        self.name = name
+
+    def version(self, fresh=False):
+        """Güncel sürüm (process içinde kısa süre saklanır, fresh=True ile her zaman okunur)"""
+        now = time.monotonic()
+        with _versions_lock:
+            memo = _versions.get(self.name)
+        if not fresh and memo is not None and memo[0] > now:
+            return memo[1]
+
+        key = VERSION_KEY.format(self.name)
+        version = cache.get(key)
+        if version is None:
+            # Sürüm kaybolursa (eviction / clear) eski kayıtlar geri gelmesin diye zaman tabanlı başlangıç
+            cache.add(key, int(time.time() * 1000), None)
+            version = cache.get(key) or 1
+        self._remember(version)
+        return version
+
+    def _remember(self, version):
+        with _versions_lock:
+            _versions[self.name] = (time.monotonic() + _setting('CACHE_VERSION_LOCAL_TTL', 2), version)
+
+    def key(self, key):
+        return f'{self.name}:{key}'
+
+    def get(self, key, default=None):
+        value = cache.get(self.key(key), version=self.version())
+        namespace_stats.record(self.name, hit=value is not None)
+        return default if value is None else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        cache.set(self.key(key), value, timeout, version=self.version())
+
+    def delete(self, key):
+        cache.delete(self.key(key), version=self.version())
+
+    def get_or_set(self, key, factory, timeout=DEFAULT_TIMEOUT):
+        """Kayıt yoksa factory() sonucunu yaz ve döndür"""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, timeout)
+        return value
+
+    def invalidate(self):
+        """İsim alanındaki tüm kayıtları geçersiz kıl, yeni sürümü döndür"""
+        self.version()  # sürüm anahtarının var olduğundan emin ol
+        version = _incr(VERSION_KEY.format(self.name)) or 1
+        self._remember(version)
+        return version
+
+    def key_count(self):
+        """Güncel sürümdeki anahtar sayısı (backend desteklemiyorsa None)"""
+        prefix = cache.make_key(self.key(''), version=self.version())
+        return count_keys(prefix)
+
+def namespace(name):
+    return CacheNamespace(name)
+
+# ================================================================================
+# Backend Bilgileri
+# ================================================================================
+
+def _backend_kind():
+    backend = type(caches['default'])
+    module = f'{backend.__module__}.'
+    for kind in ('locmem', 'filebased', 'redis', 'memcached', 'dummy'):
+        if f'.{kind}.' in module:
+            return kind
+    return 'other'
+
+def is_shared_cache():
+    """
+    Varsayılan cache tüm worker process'leri arasında paylaşılıyor mu?
+    LocMem process içidir, DummyCache hiçbir şey saklamaz; bu backend'lerde
+    bir worker'daki geçersiz kılma diğerlerine ulaşmaz.
+    """
+    return _backend_kind() not in ('locmem', 'dummy')
+
+def has_atomic_counters():
+    """incr/add process'ler arasında atomik mi? (dosya tabanlı cache'te değildir)"""
+    return _backend_kind() in ('redis', 'memcached')
+
+def count_keys(prefix=None):
+    """
+    `prefix` ile başlayan (süresi dolmamış) ham anahtar sayısı, bilinmiyorsa None.
+    prefix verilmezse bu cache'e ait tüm anahtarlar sayılır.
+    """
+    backend = caches['default']
+    kind = _backend_kind()
+    if kind == 'locmem':
+        now = time.time()
+        with backend._lock:
+            return sum(
+                1 for key in backend._cache
+                if key.startswith(prefix or '') and (backend._expire_info.get(key) or now + 1) > now
+            )
+    if kind == 'redis':
+        client = backend._cache.get_client()
+        match = prefix if prefix is not None else backend.key_prefix
+        return sum(1 for _ in client.scan_iter(match=f'{match}*', count=1000))
+    if kind == 'filebased' and prefix is None:
+        return len(backend._list_cache_files())
+    if kind == 'dummy':
+        return 0
+    return None
+
+def cache_overview():
+    """Admin cache sayfası için backend ve isim alanı özetleri"""
+    config = settings.CACHES.get('default', {})
+    location = config.get('LOCATION', '')
+    if isinstance(location, str) and '@' in location:
+        # Redis URL'sindeki kullanıcı adı / parola gösterilmez
+        scheme, _, rest = location.partition('://')
+        location = f"{scheme}://***@{rest.rsplit('@', 1)[1]}"
+    rows = []
+    total_hits = total_misses = 0
+    for name, description in NAMESPACES.items():
+        space = namespace(name)
+        hits, misses = namespace_stats.totals(name)
+        total_hits += hits
+        total_misses += misses
+        rows.append({
+            'name': name,
+            'description': description,
+            'version': space.version(),
+            'keys': space.key_count(),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses) * 100, 1) if hits + misses else None,
+        })
+
+    return {
+        'backend': config.get('BACKEND', ''),
+        'backend_kind': _backend_kind(),
+        'location': location,
+        'key_prefix': config.get('KEY_PREFIX', ''),
+        'default_timeout': config.get('TIMEOUT', 300),
+        'total_keys': count_keys(),
+        'hits': total_hits,
+        'misses': total_misses,
+        'hit_rate': round(total_hits / (total_hits + total_misses) * 100, 1) if total_hits + total_misses else None,
+        'namespaces': rows,
+    }
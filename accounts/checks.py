@@ -0,0 +1,25 @@
+# accounts/checks.py
+# ================================================================================
+# Accounts Sistem Kontrolleri
+# manage.py check / runserver / migrate sırasında yapılandırma uyarıları
+# ================================================================================
+
+from django.core.checks import Warning, register
+
+from .cache_layer import is_shared_cache
+
+
+@register()
+def shared_cache_check(app_configs, **kwargs):
+    """Önbellek geçersiz kılmaları worker'lar arasında yalnızca paylaşılan cache'te yayılır"""
+    if is_shared_cache():
+        return []
+    return [
+        Warning(
+            'Varsayılan cache process içi (locmem/dummy); birden fazla worker ile '
+            'sistem ayarı değişiklikleri ve token iptalleri diğer worker\'lara ulaşmaz.',
+            hint="Çok worker'lı kurulumlarda CACHE_BACKEND=redis kullanın "
+                 "(tek process için SILENCED_SYSTEM_CHECKS = ['accounts.W001']).",
+            id='accounts.W001',
+        )
+    ]
@@ -0,0 +1,257 @@
+# accounts/dashboard.py
+"""
+Yardım Masası Dashboard İstatistikleri
+======================================
+
+Admin paneli sayaçlarını az sayıda toplu sorgu ile hesaplar:
+- Kullanıcı sayaçları: tek koşullu aggregate (Count + filter=Q)
+- Talep durum/öncelik/zaman sayaçları: tek koşullu aggregate
+- Günlük aktivite serisi: tek TruncDate group-by sorgusu
+- Token sayaçları: tek koşullu aggregate
+- Rapor serileri: TicketDailyStats rollup tablosu + tek group-by kullanıcı sorgusu
+- Admin paneli sayaçları 'tickets' cache isim alanında ADMIN_DASHBOARD_CACHE_TTL saniye saklanır
+"""
+
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from .cache_layer import namespace
+from .models import CustomAuthToken, CustomUser
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+def _period_bounds(now):
+    """Dashboard'da kullanılan zaman sınırlarını döndür"""
+    today = now.date()
+    return {
+        'today': today,
+        'yesterday': today - timedelta(days=1),
+        'week_ago': now - timedelta(days=7),
+        'month_ago': now - timedelta(days=30),
+    }
+
+def get_user_stats(now=None):
+    """Kullanıcı sayaçlarını tek sorguda hesapla"""
+    now = now or timezone.now()
+    bounds = _period_bounds(now)
+
+    return CustomUser.objects.aggregate(
+        total_users=Count('id'),
+        active_users=Count('id', filter=Q(is_active=True)),
+        admin_users=Count('id', filter=Q(role='admin')),
+        support_users=Count('id', filter=Q(role='support')),
+        customer_users=Count('id', filter=Q(role='customer')),
+        users_today=Count('id', filter=Q(date_joined__date=bounds['today'])),
+        users_yesterday=Count('id', filter=Q(date_joined__date=bounds['yesterday'])),
+        users_this_week=Count('id', filter=Q(date_joined__gte=bounds['week_ago'])),
+        users_this_month=Count('id', filter=Q(date_joined__gte=bounds['month_ago'])),
+    )
+
+def get_ticket_stats(now=None):
+    """Talep durum, öncelik ve zaman sayaçlarını tek sorguda hesapla"""
+    from tickets.models import Talep
+
+    now = now or timezone.now()
+    bounds = _period_bounds(now)
+
+    return Talep.objects.aggregate(
+        total_tickets=Count('id'),
+
+        # Status bazlı sayımlar
+        open_tickets=Count('id', filter=Q(status='open')),
+        in_progress_tickets=Count('id', filter=Q(status='in_progress')),
+        resolved_tickets=Count('id', filter=Q(status='resolved')),
+        closed_tickets=Count('id', filter=Q(status='closed')),
+        pending_tickets=Count('id', filter=Q(status='pending')),
+
+        # Priority bazlı sayımlar
+        high_priority=Count('id', filter=Q(priority='high')),
+        medium_priority=Count('id', filter=Q(priority='medium')),
+        low_priority=Count('id', filter=Q(priority='low')),
+
+        # Zaman bazlı talepler
+        tickets_today=Count('id', filter=Q(created_at__date=bounds['today'])),
+        tickets_yesterday=Count('id', filter=Q(created_at__date=bounds['yesterday'])),
+        tickets_this_week=Count('id', filter=Q(created_at__gte=bounds['week_ago'])),
+        tickets_this_month=Count('id', filter=Q(created_at__gte=bounds['month_ago'])),
+    )
+
+def get_daily_ticket_activity(days=7, now=None, date_format='%d/%m'):
+    """
+    Son `days` günün günlük talep sayılarını tek group-by sorgusu ile döndür.
+    Talep açılmayan günler 0 olarak doldurulur, liste eskiden yeniye sıralıdır.
+    """
+    from tickets.models import Talep
+    from tickets.rollups import day_range
+
+    now = now or timezone.now()
+    today = now.date()
+    first_day = today - timedelta(days=days - 1)
+    range_start, range_end = day_range(first_day, today)
+
+    rows = (
+        Talep.objects.filter(created_at__gte=range_start, created_at__lt=range_end)
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    counts = {row['day']: row['count'] for row in rows}
+
+    daily_activity = []
+    for i in range(days - 1, -1, -1):
+        day = today - timedelta(days=i)
+        daily_activity.append({
+            'date': day.strftime(date_format),
+            'tickets': counts.get(day, 0),
+        })
+    return daily_activity
+
+def get_token_stats(now=None):
+    """Token sayaçlarını tek sorguda hesapla"""
+    now = now or timezone.now()
+    bounds = _period_bounds(now)
+
+    return CustomAuthToken.objects.aggregate(
+        active_tokens=Count('id', filter=Q(created__gte=bounds['month_ago'])),
+        expired_tokens=Count('id', filter=Q(created__lt=bounds['month_ago'])),
+        tokens_today=Count('id', filter=Q(created__date=bounds['today'])),
+    )
+
+# ================================================================================
+# Admin Paneli Sayaçları
+# ================================================================================
+
+def get_admin_dashboard_stats(now=None):
+    """
+    admin_panel_view için tüm sayaçları hesapla.
+    Dönen sözlük, şablonun kullandığı context anahtarlarının aynısını içerir.
+    """
+    now = now or timezone.now()
+
+    stats = {}
+    stats.update(get_user_stats(now))
+    stats.update(get_ticket_stats(now))
+    stats.update(get_token_stats(now))
+    stats['daily_activity'] = get_daily_ticket_activity(days=7, now=now)
+
+    # Büyüme oranları
+    stats['ticket_daily_growth'] = (
+        (stats['tickets_today'] - stats['tickets_yesterday']) / max(stats['tickets_yesterday'], 1)
+    ) * 100
+
+    # System health metrikleri
+    stats['system_health'] = {
+        'total_users': stats['total_users'],
+        'active_users': stats['active_users'],
+        'total_tickets': stats['total_tickets'],
+        'active_tickets': stats['open_tickets'] + stats['in_progress_tickets'] + stats['pending_tickets'],
+        'critical_tickets': stats['high_priority'],
+        'user_activity_score': min(100, (stats['users_this_week'] / max(stats['total_users'], 1)) * 1000),  # 0-100 skala
+        'ticket_activity_score': min(100, (stats['tickets_this_week'] / max(stats['tickets_this_month'] / 4, 1)) * 100),
+    }
+
+    # Performance indicators
+    support_users = stats['support_users']
+    stats['performance_indicators'] = {
+        'resolution_rate': round((stats['resolved_tickets'] + stats['closed_tickets']) / max(stats['total_tickets'], 1) * 100, 1),
+        'daily_growth': round(stats['ticket_daily_growth'], 1),
+        'user_engagement': round(stats['tickets_this_month'] / max(stats['active_users'], 1), 2),
+        'support_load': round(stats['open_tickets'] / max(support_users, 1), 2) if support_users > 0 else 0,
+    }
+
+    return stats
+
+def get_cached_admin_dashboard_stats(now=None):
+    """get_admin_dashboard_stats sonucu, 'tickets' isim alanında önbelleklenmiş"""
+    return namespace('tickets').get_or_set(
+        'admin_dashboard_stats',
+        lambda: get_admin_dashboard_stats(now),
+        getattr(settings, 'ADMIN_DASHBOARD_CACHE_TTL', 60),
+    )
+
+# ================================================================================
+# Rapor Serileri (Rollup Tablosundan)
+# ================================================================================
+
+def _month_starts(today, months):
+    """Son `months` ayın ilk günleri, eskiden yeniye"""
+    year, month = today.year, today.month
+    starts = []
+    for _ in range(months):
+        starts.append(date(year, month, 1))
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    starts.reverse()
+    return starts
+
+def get_daily_report_series(days=30, today=None):
+    """
+    Son `days` günün açılan/kapatılan talep ve yeni kullanıcı sayıları.
+    Talep sayıları TicketDailyStats satırlarından okunur.
+    """
+    from tickets.rollups import daily_counts
+
+    today = today or timezone.localdate()
+    first_day = today - timedelta(days=days - 1)
+
+    ticket_counts = daily_counts(first_day, today)
+    user_rows = (
+        CustomUser.objects.filter(date_joined__date__gte=first_day, date_joined__date__lte=today)
+        .annotate(day=TruncDate('date_joined'))
+        .values('day')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    user_counts = {row['day']: row['count'] for row in user_rows}
+
+    series = []
+    for i in range(days - 1, -1, -1):
+        day = today - timedelta(days=i)
+        tickets = ticket_counts.get(day, {})
+        series.append({
+            'date': day,
+            'created': tickets.get('created', 0),
+            'closed': tickets.get('closed', 0),
+            'new_users': user_counts.get(day, 0),
+        })
+    return series
+
+def get_monthly_report_series(months=12, today=None):
+    """
+    Son `months` takvim ayının açılan/kapatılan talep ve yeni kullanıcı sayıları.
+    Talep sayıları TicketDailyStats satırlarından okunur.
+    """
+    from tickets.rollups import monthly_counts
+
+    today = today or timezone.localdate()
+    starts = _month_starts(today, months)
+
+    ticket_counts = monthly_counts(starts[0], today)
+    user_rows = (
+        CustomUser.objects.filter(date_joined__date__gte=starts[0])
+        .annotate(month=TruncMonth('date_joined'))
+        .values('month')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    user_counts = {(row['month'].year, row['month'].month): row['count'] for row in user_rows}
+
+    series = []
+    for month_start in starts:
+        key = (month_start.year, month_start.month)
+        tickets = ticket_counts.get(key, {})
+        series.append({
+            'month_start': month_start,
+            'created': tickets.get('created', 0),
+            'closed': tickets.get('closed', 0),
+            'new_users': user_counts.get(key, 0),
+        })
+    return series
@@ -0,0 +1,239 @@
+# accounts/log_retention.py
+"""
+Yardım Masası - SystemLog Saklama (Retention)
+=============================================
+
+Eski log kayıtları iki yolla temizlenir:
+
+1. Bölüm (partition) düşürme - PostgreSQL
+   accounts_systemlog tablosu "timestamp" alanına göre aylık bölümlenmiştir
+   (migration 0011). Tüm kayıtları saklama süresini aşmış bir ay, tek bir
+   DETACH + DROP ile silinir (satır satır silme, kilit ve VACUUM yükü yok).
+   SYSTEM_LOG_RETENTION_ARCHIVE açıksa bölüm silinmez, arşiv tablosu olarak
+   ayrılır (accounts_systemlog_archive_YYYYMM).
+
+2. Parça parça silme - tüm veritabanları
+   Seviye bazında süresi dolmuş kayıtlar SYSTEM_LOG_RETENTION_BATCH_SIZE
+   boyutunda partiler halinde silinir. Her parti kısa bir transaction'dır;
+   tek bir sınırsız DELETE'in uzun kilitleri ve bellek kullanımı oluşmaz.
+
+Saklama politikası: SYSTEM_LOG_RETENTION_DAYS = {'DEBUG': 7, 'INFO': 90, ...}
+(None: süresiz). Bir ay ancak tüm seviyelerin süresi dolduğunda düşürülür.
+"""
+
+import re
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import SystemLog
+
+TABLE = SystemLog._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+PARTITION_RE = re.compile(rf'^{TABLE}_p(\d{{4}})(\d{{2}})$')
+
+DEFAULT_RETENTION_DAYS = {
+    'DEBUG': 7,
+    'INFO': 90,
+    'WARNING': 180,
+    'ERROR': 365,
+    'CRITICAL': 365,
+}
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+def retention_policy():
+    """Seviye → saklama süresi (gün, None: süresiz)"""
+    policy = dict(DEFAULT_RETENTION_DAYS)
+    policy.update(getattr(settings, 'SYSTEM_LOG_RETENTION_DAYS', {}))
+    return policy
+
+def _batch_size():
+    return int(getattr(settings, 'SYSTEM_LOG_RETENTION_BATCH_SIZE', 5000))
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+def next_month(value):
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+def partition_name(month):
+    return f'{TABLE}_p{month.year:04d}{month.month:02d}'
+
+def is_partitioned(using=None):
+    """accounts_systemlog PostgreSQL'de bölümlenmiş tablo mu?"""
+    conn = using or connection
+    if conn.vendor != 'postgresql':
+        return False
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND c.relnamespace = current_schema()::regnamespace",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+# ================================================================================
+# Bölüm Yönetimi (PostgreSQL)
+# ================================================================================
+
+def list_partitions():
+    """Aylık bölümler: [(ay başlangıcı, tablo adı)] - tarih sırasıyla"""
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND p.relnamespace = current_schema()::regnamespace",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            partitions.append((datetime(int(match[1]), int(match[2]), 1, tzinfo=dt_timezone.utc), name))
+    return sorted(partitions)
+
+def create_partition(month):
+    """
+    `month` ayı için bölüm oluştur. Varsayılan bölüme düşmüş o aya ait kayıtlar
+    yeni bölüme taşınır, sonra bölüm ana tabloya bağlanır.
+    """
+    name = partition_name(month)
+    start, end = month_start(month), next_month(month)
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE {qn(name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} '
+            f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+            f'INSERT INTO {qn(name)} SELECT * FROM moved',
+            [start, end],
+        )
+        cursor.execute(
+            f'ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+    return name
+
+def ensure_partitions(months_ahead=None, now=None):
+    """Bu ay ve sonraki `months_ahead` ay için eksik bölümleri oluştur"""
+    if not is_partitioned():
+        return []
+    if months_ahead is None:
+        months_ahead = int(getattr(settings, 'SYSTEM_LOG_PARTITION_MONTHS_AHEAD', 2))
+
+    existing = {month for month, _ in list_partitions()}
+    month = month_start(now or timezone.now())
+    created = []
+    for _ in range(months_ahead + 1):
+        if month not in existing:
+            created.append(create_partition(month))
+        month = next_month(month)
+    return created
+
+def expired_partitions(cutoff):
+    """Tüm kayıtları `cutoff` anından eski olan bölümler"""
+    return [(month, name) for month, name in list_partitions() if next_month(month) <= cutoff]
+
+def drop_partitions_before(cutoff, archive=None, dry_run=False):
+    """
+    Süresi tamamen dolmuş aylık bölümleri ayır ve sil (veya arşivle).
+    Dönüş: [(tablo adı, satır sayısı)]
+    """
+    if archive is None:
+        archive = getattr(settings, 'SYSTEM_LOG_RETENTION_ARCHIVE', False)
+    qn = connection.ops.quote_name
+
+    dropped = []
+    for month, name in expired_partitions(cutoff):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM {qn(name)}')
+            rows = cursor.fetchone()[0]
+            if not dry_run:
+                cursor.execute(f'ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(name)}')
+                if archive:
+                    cursor.execute(f'ALTER TABLE {qn(name)} RENAME TO {qn(f"{TABLE}_archive_{month:%Y%m}")}')
+                else:
+                    cursor.execute(f'DROP TABLE {qn(name)}')
+        dropped.append((name, rows))
+    return dropped
+
+# ================================================================================
+# Parça Parça Silme
+# ================================================================================
+
+def delete_in_batches(queryset, batch_size=None, max_batches=None, pause=0):
+    """
+    Sorgu kümesini `batch_size` satırlık partiler halinde sil.
+    Her parti: id listesi (indeksli, LIMIT'li) + tek DELETE. Silinen satır sayısını döndürür.
+    """
+    batch_size = batch_size or _batch_size()
+    deleted = batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        with transaction.atomic():
+            # Zaman koşulu korunur: bölümlü tabloda yalnızca ilgili bölümler taranır
+            count, _ = queryset.filter(pk__in=ids).delete()
+        deleted += count
+        batches += 1
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return deleted
+
+def purge_before(cutoff, levels=None, batch_size=None, max_batches=None, dry_run=False):
+    """
+    `cutoff` anından eski kayıtları sil (levels verilirse yalnızca o seviyeler).
+    Tüm seviyeler siliniyorsa tamamen eski bölümler önce düşürülür.
+    Dönüş: {'partitions': [(ad, satır)], 'deleted': satır sayısı}
+    """
+    partitions = []
+    if levels is None:
+        partitions = drop_partitions_before(cutoff, dry_run=dry_run)
+
+    queryset = SystemLog.objects.filter(timestamp__lt=cutoff)
+    if levels is not None:
+        queryset = queryset.filter(level__in=levels)
+
+    if dry_run:
+        deleted = queryset.count()
+    else:
+        deleted = delete_in_batches(queryset, batch_size=batch_size, max_batches=max_batches)
+    return {'partitions': partitions, 'deleted': deleted}
+
+def apply_retention(policy=None, batch_size=None, max_batches=None, dry_run=False, now=None):
+    """
+    Seviye bazlı saklama politikasını uygula.
+    Dönüş: {'partitions': [(ad, satır)], 'levels': {seviye: silinen}, 'created_partitions': [...]}
+    """
+    now = now or timezone.now()
+    policy = policy or retention_policy()
+    cutoffs = {level: now - timedelta(days=days) for level, days in policy.items() if days is not None}
+
+    report = {'partitions': [], 'levels': {}, 'created_partitions': []}
+    if not dry_run:
+        report['created_partitions'] = ensure_partitions(now=now)
+
+    # Tüm seviyelerin süresi dolmuş aylar bölüm olarak düşürülür
+    known_levels = {level for level, _ in SystemLog.LOG_LEVELS}
+    if known_levels <= set(cutoffs):
+        report['partitions'] = drop_partitions_before(min(cutoffs.values()), dry_run=dry_run)
+
+    for level, cutoff in sorted(cutoffs.items()):
+        result = purge_before(cutoff, levels=[level], batch_size=batch_size,
+                              max_batches=max_batches, dry_run=dry_run)
+        report['levels'][level] = result['deleted']
+    return report
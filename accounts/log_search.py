@@ -0,0 +1,128 @@
+# accounts/log_search.py
+"""
+Yardım Masası - SystemLog Tam Metin Arama
+=========================================
+
+admin_logs_view araması veritabanına göre indeksli bir yol kullanır
+(indeksler migration 0012 ile oluşturulur):
+
+- PostgreSQL: action + message üzerinde 'simple' yapılandırmalı tsvector
+  ifade indeksi (GIN) ve websearch_to_tsquery. Kelime içi / yarım kelime
+  aramaları için pg_trgm GIN indeksleri (UPPER(...) gin_trgm_ops) ile
+  indekslenen icontains yedeği. Sonuçlar ts_rank ile sıralanır.
+- SQLite: FTS5 sanal tablosu (external content, tetikleyicilerle güncel),
+  terimler önek eşleşmesiyle aranır, bm25 ile sıralanır.
+- Diğer durumlarda (indeks yoksa) eski icontains araması.
+
+Kullanıcı adı eşleşmesi her yolda küçük kullanıcı tablosu üzerinden
+user_id IN (...) alt sorgusu ile yapılır (log tablosuna JOIN gerekmez).
+"""
+
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+
+from .models import SystemLog
+
+TABLE = SystemLog._meta.db_table
+FTS_TABLE = f'{TABLE}_fts'
+SEARCH_INDEX = 'systemlog_search_idx'
+SEARCH_CONFIG = 'simple'
+
+# Indeks ifadesi ile birebir aynı olmalıdır (bkz. migration 0012)
+SEARCH_DOCUMENT_SQL = (
+    f"to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+    f"coalesce(\"{TABLE}\".\"action\", '') || ' ' || coalesce(\"{TABLE}\".\"message\", ''))"
+)
+
+_backends = {}
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+def search_backend(using='default'):
+    """'postgresql', 'sqlite_fts' veya 'basic' (sonuç process içinde saklanır)"""
+    if using in _backends:
+        return _backends[using]
+
+    connection = connections[using]
+    backend = 'basic'
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE schemaname = current_schema() AND indexname = %s",
+                [SEARCH_INDEX],
+            )
+            if cursor.fetchone():
+                backend = 'postgresql'
+        elif connection.vendor == 'sqlite':
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+            if cursor.fetchone():
+                backend = 'sqlite_fts'
+    _backends[using] = backend
+    return backend
+
+def fts5_query(text):
+    """Kullanıcı girdisini güvenli bir FTS5 sorgusuna çevir: her terim önek eşleşmeli, AND ile"""
+    terms = re.findall(r'\w+', text, re.UNICODE)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def _username_match(text):
+    User = get_user_model()
+    return Q(user_id__in=User.objects.filter(username__icontains=text).values('pk'))
+
+# ================================================================================
+# Arama
+# ================================================================================
+
+def search_logs(queryset, text, using='default'):
+    """
+    Sorgu kümesine arama koşulunu ekle ve `search_rank` alanını ekle
+    (büyük değer daha alakalı). Dönüş: (queryset, backend adı)
+    """
+    text = text.strip()
+    backend = search_backend(using)
+
+    if backend == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+        queryset = queryset.alias(
+            search_document=RawSQL(SEARCH_DOCUMENT_SQL, (), output_field=SearchVectorField()),
+        ).filter(
+            Q(search_document=query)
+            # Trigram indeksli kelime içi eşleşme (UPPER(...) gin_trgm_ops)
+            | Q(message__icontains=text)
+            | Q(action__icontains=text)
+            | _username_match(text)
+        ).annotate(
+            search_rank=SearchRank(F('search_document'), query),
+        )
+        return queryset, backend
+
+    if backend == 'sqlite_fts':
+        match = fts5_query(text)
+        if not match:
+            return queryset.filter(_username_match(text)).annotate(search_rank=Value(0.0)), backend
+        matched_ids = RawSQL(f'SELECT rowid FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s', (match,))
+        # bm25 küçük değer = daha alakalı; işaret çevrilerek diğer yollarla aynı yön kullanılır
+        rank = RawSQL(
+            f'SELECT -bm25("{FTS_TABLE}") FROM "{FTS_TABLE}" '
+            f'WHERE "{FTS_TABLE}" MATCH %s AND rowid = "{TABLE}"."id"',
+            (match,),
+            output_field=FloatField(),
+        )
+        queryset = queryset.filter(Q(pk__in=matched_ids) | _username_match(text)).annotate(
+            search_rank=Coalesce(rank, Value(0.0)),
+        )
+        return queryset, backend
+
+    queryset = queryset.filter(
+        Q(message__icontains=text) | Q(action__icontains=text) | _username_match(text)
+    ).annotate(search_rank=Value(0.0))
+    return queryset, backend
@@ -0,0 +1,222 @@
+# accounts/log_writer.py
+"""
+Yardım Masası - Asenkron SystemLog Yazıcısı
+===========================================
+
+SystemLog.log() istek içinde INSERT çalıştırmaz; kayıt process içi sınırlı
+bir kuyruğa eklenir ve arka plan thread'i kayıtları bulk_create ile yazar:
+
+- Parti, SYSTEM_LOG_BATCH_SIZE kayda ulaştığında ya da ilk kaydın üzerinden
+  SYSTEM_LOG_FLUSH_INTERVAL saniye geçtiğinde yazılır
+- Kuyruk SYSTEM_LOG_QUEUE_SIZE kayıtla sınırlıdır. Dolduğunda
+  SYSTEM_LOG_OVERFLOW politikası uygulanır:
+    'drop_new'    : yeni kayıt atılır (varsayılan)
+    'drop_oldest' : kuyruktaki en eski kayıt atılır, yeni kayıt eklenir
+    'block'       : SYSTEM_LOG_BLOCK_TIMEOUT saniye beklenir, yer açılmazsa atılır
+  SYSTEM_LOG_SYNC_LEVELS seviyelerindeki kayıtlar (ERROR, CRITICAL) atılmaz,
+  kuyruk doluysa doğrudan (senkron) yazılır.
+- Atılan kayıtlar seviye bazında sayılır (admin bakım sayfası)
+- Process kapanırken (atexit) kuyruktaki kayıtlar yazılır
+
+SYSTEM_LOG_ASYNC = False ise kayıtlar eskisi gibi anında yazılır.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+class SystemLogWriter:
+    """Sınırlı kuyruk + arka plan bulk_create thread'i"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+        self._stop = threading.Event()
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Sayaçlar
+    # ------------------------------------------------------------------
+
+    def reset_stats(self):
+        with self._lock:
+            self.enqueued = 0
+            self.written = 0
+            self.sync_writes = 0
+            self.batches = 0
+            self.failed = 0
+            self.dropped = {}
+
+    def _count_drop(self, record):
+        with self._lock:
+            self.dropped[record.level] = self.dropped.get(record.level, 0) + 1
+
+    def stats(self):
+        return {
+            'enabled': _setting('SYSTEM_LOG_ASYNC', True),
+            'queued': self._queue.qsize() if self._queue is not None else 0,
+            'capacity': _setting('SYSTEM_LOG_QUEUE_SIZE', 10000),
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'sync_writes': self.sync_writes,
+            'batches': self.batches,
+            'failed': self.failed,
+            'dropped': sum(self.dropped.values()),
+            'dropped_by_level': dict(self.dropped),
+        }
+
+    # ------------------------------------------------------------------
+    # Kuyruk
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self):
+        """Thread'i ilk kayıtta başlat (fork sonrası çocuk process'te yeniden)"""
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Fork edilen process ebeveynin kuyruğunu/thread'ini devralmaz
+                self._queue = queue.Queue(maxsize=_setting('SYSTEM_LOG_QUEUE_SIZE', 10000))
+                self._pid = pid
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='systemlog-writer', daemon=True)
+            self._thread.start()
+
+    def submit(self, record):
+        """Kaydı kuyruğa ekle; eklenemezse politikaya göre at veya senkron yaz"""
+        if not _setting('SYSTEM_LOG_ASYNC', True):
+            self._write_now(record)
+            return
+
+        self._ensure_started()
+        if self._offer(record):
+            with self._lock:
+                self.enqueued += 1
+            return
+
+        if record.level in _setting('SYSTEM_LOG_SYNC_LEVELS', ('ERROR', 'CRITICAL')):
+            self._write_now(record)
+        else:
+            self._count_drop(record)
+
+    def _offer(self, record):
+        policy = _setting('SYSTEM_LOG_OVERFLOW', 'drop_new')
+        try:
+            if policy == 'block':
+                self._queue.put(record, timeout=_setting('SYSTEM_LOG_BLOCK_TIMEOUT', 0.05))
+            else:
+                self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+
+        if policy == 'drop_oldest':
+            try:
+                self._count_drop(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(record)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _write_now(self, record):
+        record.save()
+        with self._lock:
+            self.sync_writes += 1
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    def _take_batch(self, block=True):
+        """İlk kaydı bekle, sonra parti dolana ya da süre bitene kadar topla"""
+        batch_size = _setting('SYSTEM_LOG_BATCH_SIZE', 500)
+        interval = _setting('SYSTEM_LOG_FLUSH_INTERVAL', 2.0)
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=interval) if block else self._queue.get_nowait())
+        except queue.Empty:
+            return batch
+
+        deadline = time.monotonic() + interval
+        while len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if block and remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch):
+        from .models import SystemLog
+
+        if not batch:
+            return
+        try:
+            close_old_connections()
+            SystemLog.objects.bulk_create(batch)
+            with self._lock:
+                self.written += len(batch)
+                self.batches += 1
+        except Exception as e:
+            with self._lock:
+                self.failed += len(batch)
+            logger.error(f"SystemLog batch write failed ({len(batch)} kayıt): {str(e)}")
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                self._write_batch(self._take_batch())
+        finally:
+            connection.close()
+
+    def flush(self):
+        """Kuyruktaki tüm kayıtları çağıran thread'de yaz, yazılan sayıyı döndür"""
+        if self._queue is None or self._pid != os.getpid():
+            return 0
+        written = 0
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                return written
+            self._write_batch(batch)
+            written += len(batch)
+
+    def shutdown(self, timeout=5.0):
+        """Thread'i durdur ve kalan kayıtları yaz"""
+        self._stop.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+        return self.flush()
+
+system_log_writer = SystemLogWriter()
+
+@atexit.register
+def _flush_at_exit():
+    """Process kapanırken kuyruktaki kayıtları yaz"""
+    try:
+        system_log_writer.shutdown()
+    except Exception:
+        pass
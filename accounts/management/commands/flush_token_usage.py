@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from accounts.cache_layer import has_atomic_counters
+from accounts.token_usage import flush_token_usage, pending_token_usage
+
+
+class Command(BaseCommand):
+    help = 'Kuyrukta bekleyen token last_used kayıtlarını toplu olarak veritabanına yaz'
+
+    def handle(self, *args, **options):
+        if not has_atomic_counters():
+            # Kuyruk kullanılmıyor; kayıtlar istek sırasında doğrudan yazılıyor
+            self.stdout.write(self.style.WARNING(
+                'Cache backend paylaşılan/atomik değil (Redis veya Memcached gerekir); '
+                'token kullanımı kuyruğa alınmadan doğrudan veritabanına yazılıyor.'
+            ))
+            return
+
+        pending = pending_token_usage()
+        if not pending:
+            self.stdout.write(self.style.WARNING('Kuyrukta bekleyen kayıt yok.'))
+            return
+
+        written = flush_token_usage()
+        self.stdout.write(
+            self.style.SUCCESS(f'{pending} kuyruk kaydından {written} token güncellendi.')
+        )
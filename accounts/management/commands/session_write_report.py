@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+User = get_user_model()
+
+# (etiket, session ayarları) - önce eski yapılandırma, sonra kayan süreli backend
+SESSION_CONFIGS = [
+    ('db + SESSION_SAVE_EVERY_REQUEST', {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+        'SESSION_SAVE_EVERY_REQUEST': True,
+    }),
+    ('accounts.sessions (sliding)', {
+        'SESSION_ENGINE': 'accounts.sessions',
+        'SESSION_SAVE_EVERY_REQUEST': False,
+    }),
+]
+
+
+class Command(BaseCommand):
+    help = 'Oturum açmış kullanıcı isteklerinde istek başına django_session yazma sayısını karşılaştır'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='İstekleri yapacak kullanıcı (varsayılan: ilk aktif kullanıcı)')
+        parser.add_argument('--url', action='append', dest='urls', help='İstenecek URL (birden fazla verilebilir)')
+        parser.add_argument('--requests', type=int, default=20, help='URL başına istek sayısı')
+
+    def handle(self, *args, **options):
+        if options['username']:
+            user = User.objects.filter(username=options['username']).first()
+        else:
+            user = User.objects.filter(is_active=True).first()
+        if user is None:
+            raise CommandError('Kullanıcı bulunamadı.')
+
+        urls = options['urls'] or ['/tickets/']
+        requests = max(1, options['requests'])
+
+        self.stdout.write(f'Kullanıcı: {user.username} | URL: {", ".join(urls)} | {requests} istek/URL')
+        for label, session_settings in SESSION_CONFIGS:
+            with override_settings(**session_settings):
+                writes, total = self.measure(user, urls, requests)
+            self.stdout.write(self.style.SUCCESS(
+                f'{label:<34} | {writes:>4} yazma / {total} istek | {writes / total:.2f} yazma/istek'
+            ))
+
+    def measure(self, user, urls, requests):
+        """Giriş sonrası isteklerde django_session INSERT/UPDATE sorgularını say"""
+        client = Client()
+        client.force_login(user)
+
+        writes = total = 0
+        try:
+            for _ in range(requests):
+                for url in urls:
+                    with CaptureQueriesContext(connection) as context:
+                        client.get(url)
+                    total += 1
+                    writes += sum(
+                        1 for query in context.captured_queries
+                        if 'django_session' in query['sql']
+                        and query['sql'].lstrip().upper().startswith(('INSERT', 'UPDATE'))
+                    )
+        finally:
+            client.logout()
+        return writes, total
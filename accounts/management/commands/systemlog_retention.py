@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+
+from accounts.log_retention import (
+    apply_retention, ensure_partitions, is_partitioned, list_partitions, retention_policy,
+)
+
+
+class Command(BaseCommand):
+    help = ('SystemLog saklama politikasını uygula: süresi dolmuş aylık bölümleri düşür/arşivle, '
+            'kalan kayıtları seviye bazında parça parça sil')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Silinecekleri yalnızca raporla')
+        parser.add_argument('--batch-size', type=int, help='Tek DELETE ile silinecek en fazla satır')
+        parser.add_argument('--max-batches', type=int, help='Seviye başına en fazla parti (uzun işleri bölmek için)')
+        parser.add_argument('--ensure-partitions', action='store_true',
+                            help='Yalnızca gelecek ayların bölümlerini oluştur (PostgreSQL)')
+        parser.add_argument('--list-partitions', action='store_true', help='Mevcut aylık bölümleri listele')
+
+    def handle(self, *args, **options):
+        partitioned = is_partitioned()
+
+        if options['list_partitions']:
+            if not partitioned:
+                self.stdout.write(self.style.WARNING('SystemLog tablosu bölümlenmemiş (yalnızca PostgreSQL).'))
+                return
+            for month, name in list_partitions():
+                self.stdout.write(f'  {month:%Y-%m}  {name}')
+            return
+
+        if options['ensure_partitions']:
+            created = ensure_partitions()
+            self.stdout.write(self.style.SUCCESS(
+                f'{len(created)} bölüm oluşturuldu: {", ".join(created)}' if created else 'Eksik bölüm yok.'
+            ))
+            return
+
+        policy = retention_policy()
+        self.stdout.write('Saklama politikası: ' + ', '.join(
+            f'{level}={days if days is not None else "süresiz"}' + (' gün' if days is not None else '')
+            for level, days in policy.items()
+        ))
+        self.stdout.write(f'Bölümleme: {"aylık (PostgreSQL)" if partitioned else "yok, parça parça silme"}')
+
+        report = apply_retention(
+            policy=policy,
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            dry_run=options['dry_run'],
+        )
+
+        verb = 'silinecek' if options['dry_run'] else 'silindi'
+        for name in report['created_partitions']:
+            self.stdout.write(f'  + bölüm oluşturuldu: {name}')
+        for name, rows in report['partitions']:
+            self.stdout.write(f'  - bölüm {name}: {rows} kayıt {verb}')
+        for level, deleted in report['levels'].items():
+            self.stdout.write(f'  {level}: {deleted} kayıt {verb}')
+
+        total = sum(rows for _, rows in report['partitions']) + sum(report['levels'].values())
+        self.stdout.write(self.style.SUCCESS(f'Toplam {total} kayıt {verb}.'))
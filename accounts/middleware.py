@@ -1,14 +1,23 @@
 # accounts/middleware.py
 # ================================================================================
-# Custom Middleware - Token Authentication
-# HTTP isteklerini yakalayıp token tabanlı kimlik doğrulama sağlar
+# Custom Middleware - Token Authentication ve İstek Metrikleri
+# HTTP isteklerini yakalayıp token tabanlı kimlik doğrulama sağlar,
+# istek başına süre/sorgu/önbellek/template ölçümlerini toplar
 # ================================================================================
 
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
 from django.utils.deprecation import MiddlewareMixin
 from django.contrib.auth import get_user_model, login
 from rest_framework.authtoken.models import Token
 from .models import CustomAuthToken
+from .request_metrics import end_request, start_request, view_stats
+from .token_cache import MISSING, token_cache, token_entry
+import json
 import logging
+import time
 
 User = get_user_model()  # CustomUser modelini dinamik olarak al
 logger = logging.getLogger(__name__)  # Logging sistemi
@@ -18,7 +27,8 @@ class TokenAuthMiddleware(MiddlewareMixin):
     Gelişmiş Token-based authentication middleware
     - Cookie ve header'dan token okuma
     - Custom token desteği
-    - Session integration
+    - Token çözümleme önbelleği (process içi LRU + Django cache)
+    - Stateless mod (header ve seçili yol önekleri) / session integration (cookie)
     """
     
     def process_request(self, request):
@@ -53,45 +63,157 @@ class TokenAuthMiddleware(MiddlewareMixin):
                 if user:
                     token_source = 'cookie'
         
-        # Kullanıcı bulunduysa session'a ekle
+        # Kullanıcı bulunduysa isteğe bağla
         if user:
             request.user = user
-            # Session'a kullanıcıyı eklemek için özel backend kullan
-            # Bu sayede request.user.is_authenticated True olur
+            request._cached_user = user
             if not hasattr(request, '_dont_enforce_csrf_checks'):
                 request._dont_enforce_csrf_checks = True
-            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
-            logger.info(f"User {user.username} authenticated via {token_source}")
+
+            if self.is_stateless(request, token_source):
+                # Stateless mod: session yazılmaz, login sinyali/last_login güncellemesi yok
+                logger.debug(f"User {user.username} authenticated via {token_source} (stateless)")
+            else:
+                # Tarayıcı cookie akışı: kullanıcıyı session'a bağla, sonraki istekler session ile gelir
+                login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+                logger.info(f"User {user.username} authenticated via {token_source}")
         
         return None
+
+    def is_stateless(self, request, token_source):
+        """
+        Token doğrulamasının session'a dokunmadan yapılıp yapılmayacağı
+        - Authorization header'ı ile gelen (API tarzı) istemciler her zaman stateless
+        - TOKEN_AUTH_STATELESS_PATHS önekleriyle eşleşen yollar her zaman stateless
+        - Diğer cookie istekleri session'a bağlanır
+        """
+        if token_source == 'header':
+            return True
+        prefixes = getattr(settings, 'TOKEN_AUTH_STATELESS_PATHS', ())
+        return any(request.path.startswith(prefix) for prefix in prefixes)
     
     def get_user_by_token(self, token_key):
         """
         Token key ile kullanıcı bulma ve doğrulama
-        Önce custom token, sonra DRF token kontrol eder
+        Önce token önbelleği, sonra custom token, en son DRF token kontrol eder
         """
         if not token_key:
             return None
-            
+
+        # 1. Önbellekten çözümle (kararlı durumda token tablosuna sorgu atılmaz)
+        entry = token_cache.get(token_key)
+        if entry is None or self._is_expired(entry):
+            entry = self.load_token_entry(token_key)
+            if entry is None:
+                return None
+
+        if entry.get('missing') or not entry['is_active']:
+            return None
+
+        if entry['source'] == 'custom':
+            CustomAuthToken.mark_used(token_key)  # Son kullanım zamanını güncelle
+
+        return User.objects.filter(pk=entry['user_id'], is_active=True).first()
+
+    def load_token_entry(self, token_key):
+        """
+        Token'ı veritabanından çözümle ve önbelleğe yaz
+        Süresi dolmuş custom token yenilenir ve son kez kabul edilir (önbelleğe yazılmaz)
+        """
         # 1. Custom token kontrolü (öncelikli)
         try:
             custom_token = CustomAuthToken.objects.get(key=token_key)
-            if not custom_token.is_expired():
-                custom_token.use_token()  # Son kullanım zamanını güncelle
-                return custom_token.user
-            else:
-                # Token süresi dolmuş, otomatik yenile
+            if custom_token.is_expired():
+                # Token süresi dolmuş, otomatik yenile (eski anahtar geçersizleşir)
                 custom_token.refresh_token()
                 custom_token.use_token()
-                return custom_token.user
+                return None if not custom_token.is_active else {
+                    'user_id': custom_token.user_id,
+                    'expires_at': None,
+                    'is_active': True,
+                    'source': 'refreshed',
+                }
+            entry = token_entry(custom_token, source='custom')
+            token_cache.set(token_key, entry)
+            return entry
         except CustomAuthToken.DoesNotExist:
             pass
             
         # 2. Fallback: Normal DRF token kontrolü
         try:
             normal_token = Token.objects.get(key=token_key)
-            return normal_token.user
+            entry = token_entry(normal_token, source='drf')
+            token_cache.set(token_key, entry)
+            return entry
         except Token.DoesNotExist:
             pass
-        
-        return None
\ No newline at end of file
+
+        token_cache.set(token_key, MISSING)
+        return MISSING
+
+    @staticmethod
+    def _is_expired(entry):
+        """Önbellekteki custom token kaydının süresi dolmuş mu?"""
+        expires_at = entry.get('expires_at')
+        return expires_at is not None and expires_at <= time.time()
+
+
+request_logger = logging.getLogger('accounts.requests')  # Yapılandırılmış istek logları
+
+class RequestMetricsMiddleware:
+    """
+    İstek metrikleri middleware'i
+    - Süre, sorgu sayısı/süresi, önbellek isabetleri, template render süresi
+    - Server-Timing header'ı (REQUEST_METRICS_SERVER_TIMING)
+    - accounts.requests logger'ına JSON satırı (yavaş istekler WARNING)
+    - View bazlı kayan pencere yüzdelikleri (admin bakım sayfası)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics, token = start_request()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+                response = self.get_response(request)
+        finally:
+            end_request(token)
+        metrics.finish()
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else None
+        if view_name:
+            view_stats.record(view_name, metrics)
+
+        if self.show_server_timing(request):
+            response['Server-Timing'] = metrics.server_timing()
+
+        self.log_request(request, response, view_name, metrics)
+        return response
+
+    def show_server_timing(self, request):
+        """True: herkes, 'staff': admin/support kullanıcıları, False: kapalı"""
+        mode = getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', 'staff')
+        if mode != 'staff':
+            return bool(mode)
+        user = getattr(request, 'user', None)
+        return bool(
+            user is not None and user.is_authenticated
+            and (user.is_staff or getattr(user, 'role', None) in ('admin', 'support'))
+        )
+
+    def log_request(self, request, response, view_name, metrics):
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            **metrics.as_dict(),
+        }
+        slow_ms = getattr(settings, 'REQUEST_METRICS_SLOW_MS', 1000)
+        level = logging.WARNING if metrics.total_ms >= slow_ms else logging.INFO
+        if request_logger.isEnabledFor(level):
+            request_logger.log(level, json.dumps(record, ensure_ascii=False))
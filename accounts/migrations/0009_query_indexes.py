@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_systemlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['timestamp'], name='systemlog_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['level', 'timestamp'], name='systemlog_level_time_idx'),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:02
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import migrations
+
+TABLE = 'accounts_systemlog'
+MONTHS_AHEAD = 2
+
+
+def _month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def _next_month(value):
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _legacy_name(name):
+    return f'{name[:52]}_legacy'
+
+
+def _rebuild_table(schema_editor, partitioned):
+    """
+    accounts_systemlog tablosunu bölümlü (partitioned=True) ya da düz tablo
+    olarak yeniden oluştur. İndeksler, FK'lar ve id sayacı korunur.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND c.relnamespace = current_schema()::regnamespace",
+            [TABLE],
+        )
+        if (cursor.fetchone() is not None) == partitioned:
+            return
+
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+            [TABLE],
+        )
+        constraints = cursor.fetchall()
+        constraint_names = {name for name, _, _ in constraints}
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = %s",
+            [TABLE],
+        )
+        indexes = [(name, definition) for name, definition in cursor.fetchall() if name not in constraint_names]
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])
+        sequence = cursor.fetchone()[0]
+
+        # Eski tabloyu ve nesne adlarını kenara al
+        legacy = f'{TABLE}_legacy'
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {legacy}')
+        for name, _ in indexes:
+            cursor.execute(f'ALTER INDEX "{name}" RENAME TO "{_legacy_name(name)}"')
+        for name, _, _ in constraints:
+            cursor.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT "{name}" TO "{_legacy_name(name)}"')
+        if sequence:
+            cursor.execute(f'ALTER SEQUENCE {sequence} RENAME TO {TABLE}_id_seq_legacy')
+
+        # PostgreSQL 17 öncesinde bölümlü tablolarda IDENTITY desteklenmez:
+        # id her iki yönde de sahipli bir sequence ile üretilir
+        suffix = ' PARTITION BY RANGE ("timestamp")' if partitioned else ''
+        cursor.execute(f'CREATE TABLE {TABLE} (LIKE {legacy} INCLUDING DEFAULTS){suffix}')
+        cursor.execute(f'CREATE SEQUENCE {TABLE}_id_seq AS bigint')
+        cursor.execute(f'ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id')
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq'::regclass)")
+
+        for name, contype, definition in constraints:
+            if contype == 'p':
+                # Bölümlü tabloda benzersizlik bölüm anahtarını içermelidir
+                columns = '(id, "timestamp")' if partitioned else '(id)'
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" PRIMARY KEY {columns}')
+            else:
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" {definition}')
+        for _, definition in indexes:
+            cursor.execute(definition)
+
+        if partitioned:
+            cursor.execute(f'SELECT min("timestamp"), max("timestamp") FROM {legacy}')
+            first, last = cursor.fetchone()
+            now = datetime.now(dt_timezone.utc)
+            month = _month_start(first or now)
+            end = _month_start(max(last or now, now))
+            for _ in range(MONTHS_AHEAD):
+                end = _next_month(end)
+            while month <= end:
+                cursor.execute(
+                    f'CREATE TABLE {TABLE}_p{month:%Y%m} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)',
+                    [month, _next_month(month)],
+                )
+                month = _next_month(month)
+            cursor.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+        cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {legacy}')
+
+        cursor.execute(f"SELECT setval('{TABLE}_id_seq', coalesce((SELECT max(id) FROM {TABLE}), 0) + 1, false)")
+
+        # Eski tablo; sahipli eski sequence ve (geri dönüşte) eski bölümler de silinir
+        cursor.execute(f'DROP TABLE {legacy} CASCADE')
+
+
+def partition_systemlog(apps, schema_editor):
+    _rebuild_table(schema_editor, partitioned=True)
+
+
+def unpartition_systemlog(apps, schema_editor):
+    _rebuild_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+    # Tablo yeniden oluşturma ve veri kopyalama tek transaction'da yapılır
+    atomic = True
+
+    dependencies = [
+        ('accounts', '0010_systemlog_timestamp_default'),
+    ]
+
+    operations = [
+        # Yalnızca PostgreSQL: aylık RANGE bölümleme. Diğer veritabanlarında
+        # saklama, parça parça silme ile yapılır (accounts.log_retention).
+        migrations.RunPython(partition_systemlog, unpartition_systemlog),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:20
+
+from django.db import DatabaseError, migrations, transaction
+
+TABLE = 'accounts_systemlog'
+FTS_TABLE = f'{TABLE}_fts'
+
+# accounts.log_search.SEARCH_DOCUMENT_SQL ile birebir aynı ifade
+SEARCH_DOCUMENT_SQL = (
+    f"to_tsvector('simple'::regconfig, "
+    f"coalesce(\"{TABLE}\".\"action\", '') || ' ' || coalesce(\"{TABLE}\".\"message\", ''))"
+)
+
+SQLITE_TRIGGERS = {
+    f'{FTS_TABLE}_ai': (
+        f'AFTER INSERT ON {TABLE} BEGIN '
+        f'INSERT INTO {FTS_TABLE}(rowid, action, message) VALUES (new.id, new.action, new.message); END'
+    ),
+    f'{FTS_TABLE}_ad': (
+        f'AFTER DELETE ON {TABLE} BEGIN '
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, action, message) "
+        f"VALUES ('delete', old.id, old.action, old.message); END"
+    ),
+    f'{FTS_TABLE}_au': (
+        f'AFTER UPDATE ON {TABLE} BEGIN '
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, action, message) "
+        f"VALUES ('delete', old.id, old.action, old.message); "
+        f'INSERT INTO {FTS_TABLE}(rowid, action, message) VALUES (new.id, new.action, new.message); END'
+    ),
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS systemlog_search_idx ON {TABLE} USING gin ({SEARCH_DOCUMENT_SQL})'
+        )
+        # pg_trgm yetki gerektirebilir; kurulamazsa arama tsvector + sıralı tarama ile çalışır
+        try:
+            with transaction.atomic(using=connection.alias):
+                schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                for column in ('message', 'action'):
+                    schema_editor.execute(
+                        f'CREATE INDEX IF NOT EXISTS systemlog_{column}_trgm_idx ON {TABLE} '
+                        f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+                    )
+        except DatabaseError:
+            pass
+
+    elif connection.vendor == 'sqlite':
+        # FTS5 derlenmemişse arama icontains ile çalışmaya devam eder
+        try:
+            with transaction.atomic(using=connection.alias):
+                schema_editor.execute(
+                    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(action, message, "
+                    f"content='{TABLE}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+                )
+                for name, body in SQLITE_TRIGGERS.items():
+                    schema_editor.execute(f'CREATE TRIGGER {name} {body}')
+                schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        except DatabaseError:
+            pass
+
+
+def drop_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == 'postgresql':
+        for name in ('systemlog_search_idx', 'systemlog_message_trgm_idx', 'systemlog_action_trgm_idx'):
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+    elif connection.vendor == 'sqlite':
+        for name in SQLITE_TRIGGERS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_systemlog_partitioning'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:10
+
+from django.db import migrations
+
+
+# Bir grubun üyeleri talep görünürlük sorgusunda (tickets.visibility) yalnızca
+# indeksten okunur. Otomatik oluşturulan M2M ara tablosunda Meta.indexes
+# tanımlanamadığı için indeks SQL ile eklenir.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_systemlog_search'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS accounts_membership_group_user_idx '
+            'ON accounts_customuser_groups (group_id, customuser_id)',
+            'DROP INDEX IF EXISTS accounts_membership_group_user_idx',
+        ),
+    ]
@@ -125,6 +125,8 @@ class CustomAuthToken(models.Model):
         ordering = ['-created']
 
     def save(self, *args, **kwargs):
+        from .token_cache import token_cache
+
         # Token key yoksa oluştur
         if not self.key:
             self.key = self.generate_key()
@@ -132,6 +134,8 @@ class CustomAuthToken(models.Model):
         if not self.expires_at:
             self.expires_at = timezone.now() + timedelta(days=7)
         super().save(*args, **kwargs)
+        # Aktiflik/süre değişmiş olabilir, önbellekteki çözümlemeyi düşür
+        token_cache.invalidate(self.key)
 
     def generate_key(self):
         return secrets.token_urlsafe(64)
@@ -140,6 +144,10 @@ class CustomAuthToken(models.Model):
         return timezone.now() > self.expires_at
 
     def refresh_token(self):
+        from .token_cache import token_cache
+
+        # Eski anahtar artık geçersiz
+        token_cache.invalidate(self.key)
         self.key = self.generate_key()
         self.expires_at = timezone.now() + timedelta(days=7)
         self.save(update_fields=['key', 'expires_at'])
@@ -149,6 +157,15 @@ class CustomAuthToken(models.Model):
         self.last_used = timezone.now()
         self.save(update_fields=['last_used'])
 
+    @classmethod
+    def mark_used(cls, key):
+        """
+        Token'ı örneğini yüklemeden kullanıldı olarak işaretle
+        Yazma toplu olarak ertelenir (bkz. accounts.token_usage)
+        """
+        from .token_usage import record_token_use
+        record_token_use(key)
+
     def set_password_hash(self, raw_password):
         self.password_hash = make_password(raw_password)
         self.save(update_fields=['password_hash'])
@@ -204,6 +221,12 @@ class SystemSettings(models.Model):
         settings, created = cls.objects.get_or_create(pk=1)
         return settings
 
+    @classmethod
+    def cached(cls):
+        """Process içinde önbelleklenmiş ayarlar (salt okunur) - bkz. accounts.system_settings"""
+        from .system_settings import get_system_settings
+        return get_system_settings()
+
 # ================================================================================
 # Sistem Log Modeli
 # ================================================================================
@@ -221,7 +244,8 @@ class SystemLog(models.Model):
         ('CRITICAL', 'Kritik'),
     ]
     
-    timestamp = models.DateTimeField(auto_now_add=True, verbose_name="Zaman")
+    # auto_now_add yerine default: kuyruktan toplu yazılan kayıtlar oluşturuldukları anı korur
+    timestamp = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Zaman")
     level = models.CharField(max_length=10, choices=LOG_LEVELS, default='INFO', verbose_name="Seviye")
     user = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="Kullanıcı")
     ip_address = models.GenericIPAddressField(null=True, blank=True, verbose_name="IP Adresi")
@@ -234,6 +258,12 @@ class SystemLog(models.Model):
         verbose_name_plural = 'Sistem Logları'
         ordering = ['-timestamp']
         db_table = 'accounts_systemlog'
+        indexes = [
+            # Log listesi sıralaması ve tarih aralığı filtreleri
+            models.Index(fields=['timestamp'], name='systemlog_timestamp_idx'),
+            # Seviye filtresi + tarih sıralaması, seviye bazlı sayaçlar
+            models.Index(fields=['level', 'timestamp'], name='systemlog_level_time_idx'),
+        ]
     
     def __str__(self):
         return f"[{self.level}] {self.action} - {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
@@ -241,13 +271,20 @@ class SystemLog(models.Model):
     @classmethod
     def log(cls, level, action, message, user=None, ip_address=None, extra_data=None):
         """
-        Log kaydı oluşturma yardımcı metodu
+        Log kaydı oluşturma yardımcı metodu.
+        Kayıt arka plan yazıcısına (accounts.log_writer) verilir; SYSTEM_LOG_ASYNC
+        açıkken dönen nesne henüz kaydedilmemiştir (pk None).
         """
-        return cls.objects.create(
+        from .log_writer import system_log_writer
+
+        record = cls(
+            timestamp=timezone.now(),
             level=level,
             action=action,
             message=message,
-            user=user,
+            user_id=user.pk if user is not None else None,
             ip_address=ip_address,
             extra_data=extra_data
-        )
\ No newline at end of file
+        )
+        system_log_writer.submit(record)
+        return record
@@ -0,0 +1,106 @@
+# accounts/pagination.py
+"""
+Yardım Masası - Admin Listeleri için Tahmini Sayımlı Sayfalama
+==============================================================
+
+Django Paginator her sayfada SELECT COUNT(*) çalıştırır; büyük tablolarda
+(SystemLog, token, kullanıcı) bu sorgu tüm tabloyu/indeksi tarar.
+EstimatedCountPaginator önce planlayıcı tahminine bakar:
+
+- PostgreSQL, filtresiz sorgu : pg_class.reltuples (bölümlü tabloda
+  alt bölümlerin toplamı)
+- PostgreSQL, filtreli sorgu  : EXPLAIN (FORMAT JSON) çıktısındaki "Plan Rows"
+- Diğer veritabanları        : tahmin yok, her zaman kesin sayım
+
+Tahmin ADMIN_LIST_COUNT_ESTIMATE_THRESHOLD değerinin altındaysa kesin sayım
+yapılır (küçük tablolarda maliyet önemsizdir, sayı doğru görünür). Eşik
+üzerinde tahmin kullanılır ve `is_estimated` True olur; şablonlar toplamı
+"~" ile yaklaşık olarak gösterir.
+"""
+
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+DEFAULT_ESTIMATE_THRESHOLD = 100000
+
+# ================================================================================
+# Satır Tahmini
+# ================================================================================
+
+def estimate_threshold():
+    return int(getattr(settings, 'ADMIN_LIST_COUNT_ESTIMATE_THRESHOLD', DEFAULT_ESTIMATE_THRESHOLD))
+
+def _is_unfiltered(queryset):
+    query = queryset.query
+    return not query.where and not query.distinct and query.low_mark == 0 and query.high_mark is None
+
+def table_estimate(model, using='default'):
+    """pg_class.reltuples ile tablo satır tahmini (hiç ANALYZE edilmemişse None)"""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        # Bölümlü ana tablonun reltuples değeri -1/0'dır; alt bölümler toplanır
+        cursor.execute(
+            "SELECT sum(c.reltuples) FILTER (WHERE c.reltuples >= 0), count(*) FILTER (WHERE c.reltuples < 0) "
+            "FROM pg_class c WHERE c.oid = %s::regclass "
+            "OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)",
+            [model._meta.db_table, model._meta.db_table],
+        )
+        total, unknown = cursor.fetchone()
+    if total is None or unknown:
+        return None
+    return int(total)
+
+def plan_estimate(queryset):
+    """EXPLAIN (FORMAT JSON) ile sorgunun döndüreceği satır tahmini"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+def estimate_count(queryset):
+    """Sorgu kümesinin satır sayısı tahmini; tahmin yapılamıyorsa None"""
+    if _is_unfiltered(queryset):
+        estimate = table_estimate(queryset.model, using=queryset.db)
+        if estimate is not None:
+            return estimate
+    return plan_estimate(queryset)
+
+# ================================================================================
+# Paginator
+# ================================================================================
+
+class EstimatedCountPaginator(Paginator):
+    """Eşik üzerinde planlayıcı tahmini, altında kesin COUNT kullanan Paginator"""
+
+    def __init__(self, object_list, per_page, threshold=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.threshold = estimate_threshold() if threshold is None else threshold
+        self.is_estimated = False
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= self.threshold:
+                self.is_estimated = True
+                return estimate
+        return super().count
+
+    def page_links(self, page, on_each_side=2, on_ends=1):
+        """
+        Sayfa bağlantıları (ara sayfalar Paginator.ELLIPSIS ile kısaltılır);
+        tahmini toplamda tüm page_range'i dolaşmamak için kullanılır
+        """
+        return list(self.get_elided_page_range(page.number, on_each_side=on_each_side, on_ends=on_ends))
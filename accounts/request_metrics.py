@@ -0,0 +1,159 @@
+# accounts/request_metrics.py
+"""
+Yardım Masası - İstek Metrikleri
+================================
+
+RequestMetricsMiddleware'in her istek için topladığı ölçümler:
+- Toplam süre (wall time)
+- Veritabanı sorgu sayısı ve süresi (connection.execute_wrapper ile, DEBUG gerekmez)
+- Uygulama önbellekleri isabet/ıskalama sayıları (record_cache_lookup)
+- Template render süresi (accounts.template_backends.TimedDjangoTemplates)
+
+Ölçümler isteğe özel bir ContextVar'da tutulur. View bazında son
+REQUEST_METRICS_WINDOW isteğin süreleri process içinde saklanır ve
+admin bakım sayfasında yüzdelikler olarak gösterilir.
+"""
+
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_current = ContextVar('request_metrics', default=None)
+
+# ================================================================================
+# İstek Ölçümleri
+# ================================================================================
+
+class RequestMetrics:
+    """Tek bir isteğin ölçümleri"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total_ms = 0.0
+        self.queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_ms = 0.0
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """connection.execute_wrapper için: her sorgunun süresini topla"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - started) * 1000
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+        return self
+
+    def server_timing(self):
+        """Server-Timing header değeri"""
+        return ', '.join([
+            f'total;dur={self.total_ms:.1f}',
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"',
+            f'cache;desc="hit={self.cache_hits} miss={self.cache_misses}"',
+            f'tpl;dur={self.template_ms:.1f}',
+        ])
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total_ms, 1),
+            'db_ms': round(self.db_ms, 1),
+            'queries': self.queries,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'template_ms': round(self.template_ms, 1),
+        }
+
+def start_request():
+    """Yeni ölçüm başlat, (metrics, reset token) döndür"""
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+def end_request(token):
+    _current.reset(token)
+
+def current_metrics():
+    """Aktif isteğin ölçümleri (istek dışında None)"""
+    return _current.get()
+
+def record_cache_lookup(hit):
+    """Uygulama önbelleği okumasını aktif isteğe işle"""
+    metrics = _current.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+def record_template_render(duration_ms):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.template_ms += duration_ms
+
+# ================================================================================
+# View Bazlı Kayan Pencere İstatistikleri
+# ================================================================================
+
+def _percentile(ordered, p):
+    """Sıralı listede nearest-rank yüzdelik"""
+    if not ordered:
+        return 0
+    index = min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))
+    return ordered[index]
+
+class ViewStats:
+    """View başına son N isteğin (süre, sorgu, db süresi) örnekleri - process içi"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    @property
+    def window(self):
+        return int(getattr(settings, 'REQUEST_METRICS_WINDOW', 500))
+
+    def record(self, view_name, metrics):
+        with self._lock:
+            samples = self._samples.get(view_name)
+            if samples is None or samples.maxlen != self.window:
+                samples = self._samples[view_name] = deque(samples or (), maxlen=self.window)
+            samples.append((metrics.total_ms, metrics.queries, metrics.db_ms))
+
+    def summary(self):
+        """
+        View başına yüzdelikler, en yavaş p90'dan başlayarak.
+        Dönüş: [{'view', 'count', 'p50_ms', 'p90_ms', 'p99_ms', 'avg_queries', 'max_queries', 'avg_db_ms'}]
+        """
+        with self._lock:
+            snapshot = {view: list(samples) for view, samples in self._samples.items()}
+
+        rows = []
+        for view, samples in snapshot.items():
+            durations = sorted(sample[0] for sample in samples)
+            queries = [sample[1] for sample in samples]
+            rows.append({
+                'view': view,
+                'count': len(samples),
+                'p50_ms': round(_percentile(durations, 50), 1),
+                'p90_ms': round(_percentile(durations, 90), 1),
+                'p99_ms': round(_percentile(durations, 99), 1),
+                'avg_queries': round(sum(queries) / len(queries), 1),
+                'max_queries': max(queries),
+                'avg_db_ms': round(sum(sample[2] for sample in samples) / len(samples), 1),
+            })
+        rows.sort(key=lambda row: row['p90_ms'], reverse=True)
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._samples = {}
+
+view_stats = ViewStats()
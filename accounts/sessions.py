@@ -0,0 +1,102 @@
+# accounts/sessions.py
+"""
+Yardım Masası - Kayan Süreli (Sliding Expiry) Session Backend
+=============================================================
+
+SESSION_SAVE_EVERY_REQUEST her istekte django_session satırını yeniden
+yazar. Bu backend (cached_db tabanlı) session'ı yalnızca şu durumlarda kaydeder:
+
+1. Session verisi değiştiğinde (Django'nun standart davranışı)
+2. Kalan ömür SESSION_REFRESH_THRESHOLD saniyenin altına düştüğünde
+
+Böylece aktif bir kullanıcının session'ı kaymaya devam eder, ancak yazma
+sayısı istek başına bir yerine (SESSION_COOKIE_AGE - eşik) saniyede bire iner.
+Boşta kalma süresi sınırı [eşik, SESSION_COOKIE_AGE] aralığındadır.
+
+Kullanım: SESSION_ENGINE = 'accounts.sessions'
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+
+# Session verisinde son kayıt zamanını tutan anahtar (unix zamanı)
+REFRESHED_AT_KEY = '_session_refreshed_at'
+
+# ================================================================================
+# Yazma Sayaçları (Enstrümantasyon)
+# ================================================================================
+
+class SessionWriteStats:
+    """Process içi session okuma/yazma sayaçları"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.writes = 0
+        self.refresh_writes = 0
+
+    def reset(self):
+        with self._lock:
+            self.loads = 0
+            self.writes = 0
+            self.refresh_writes = 0
+
+    def record(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self):
+        return {
+            'loads': self.loads,
+            'writes': self.writes,
+            'refresh_writes': self.refresh_writes,
+        }
+
+session_write_stats = SessionWriteStats()
+
+def _refresh_threshold():
+    return int(getattr(settings, 'SESSION_REFRESH_THRESHOLD', 900))
+
+# ================================================================================
+# Session Store
+# ================================================================================
+
+class SessionStore(CachedDBStore):
+    """cached_db session store + eşik tabanlı kayan süre"""
+
+    def load(self):
+        data = super().load()
+        session_write_stats.record('loads')
+
+        if data and self.needs_refresh(data):
+            # SessionMiddleware yalnızca modified=True iken kaydeder
+            self.modified = True
+            self._refresh_pending = True
+        return data
+
+    def needs_refresh(self, data):
+        """Kalan ömür eşiğin altına düştüyse True"""
+        expiry = data.get('_session_expiry')
+        if expiry is not None and not isinstance(expiry, int):
+            # Mutlak bitiş tarihi: kaydırılacak bir süre yok
+            return False
+
+        refreshed_at = data.get(REFRESHED_AT_KEY)
+        if refreshed_at is None:
+            return True
+
+        age = expiry if expiry is not None else self.get_session_cookie_age()
+        remaining = age - (time.time() - refreshed_at)
+        return remaining < _refresh_threshold()
+
+    def save(self, must_create=False):
+        self._get_session(no_load=must_create)[REFRESHED_AT_KEY] = int(time.time())
+        super().save(must_create=must_create)
+
+        session_write_stats.record('writes')
+        if getattr(self, '_refresh_pending', False):
+            session_write_stats.record('refresh_writes')
+            self._refresh_pending = False
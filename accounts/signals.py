@@ -0,0 +1,27 @@
+# accounts/signals.py
+# ================================================================================
+# Accounts Sinyalleri
+# Token silindiğinde önbellekteki çözümlemeyi geçersiz kılar,
+# sistem ayarları değiştiğinde önbellekli kopyaları yeniler.
+# ================================================================================
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .models import CustomAuthToken, SystemSettings
+from .system_settings import invalidate_system_settings
+from .token_cache import token_cache
+
+
+@receiver(post_delete, sender=CustomAuthToken)
+@receiver(post_delete, sender=Token)
+def auth_token_deleted(sender, instance, **kwargs):
+    """Silinen token artık kimlik doğrulamada kullanılamaz"""
+    token_cache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=SystemSettings)
+def system_settings_saved(sender, instance, **kwargs):
+    """Tüm worker'lar ayarları bir sonraki isteklerinde yeniden yükler"""
+    invalidate_system_settings()
@@ -0,0 +1,88 @@
+# accounts/system_settings.py
+"""
+Yardım Masası - Önbellekli Sistem Ayarları
+==========================================
+
+SystemSettings tek kayıtlık bir tablodur ve sık okunur (token süresi,
+oturum zaman aşımı vb.). get_system_settings() kaydı process içinde saklar;
+sıcak yollarda veritabanına gidilmez.
+
+Tutarlılık paylaşılan cache'teki 'settings' isim alanı sürümü ile sağlanır:
+- SystemSettings kaydedildiğinde (commit sonrası) sürüm artırılır
+- get_system_settings() sürümü en fazla SYSTEM_SETTINGS_CHECK_INTERVAL
+  saniyede bir (tek cache okuması) kontrol eder; değiştiyse kayıt yeniden
+  yüklenir. Böylece tüm worker'lar değişikliği en geç bu süre sonunda görür.
+
+Bu yalnızca cache tüm worker'lar arasında paylaşılıyorsa (redis, memcached,
+dosya) geçerlidir. LocMem/Dummy cache'te sürüm process içidir; bu durumda
+kopya her kontrolde veritabanından yeniden okunur (en fazla
+SYSTEM_SETTINGS_CHECK_INTERVAL saniyede bir sorgu) ve accounts.W001 sistem
+kontrolü uyarı verir.
+
+Yeniden yükleme önce paylaşılan cache'teki (sürüme bağlı) kopyayı dener,
+yalnızca o da yoksa veritabanına gidilir.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from .cache_layer import is_shared_cache, namespace
+
+CACHE_KEY = 'system_settings'
+
+class SystemSettingsCache:
+    """Process içi SystemSettings kopyası ve paylaşılan sürüm kontrolü"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (sürüm, SystemSettings) - tek atama ile değiştirilir
+        self._state = None
+        self._checked_at = 0.0
+
+    def _load(self):
+        from .models import SystemSettings
+        return SystemSettings.get_settings()
+
+    def sync(self):
+        """Paylaşılan sürümü kontrol et, değişmişse ayarları yeniden yükle"""
+        if not is_shared_cache():
+            # Sürüm başka worker'lardaki kayıtları göremez: doğrudan veritabanından oku
+            state = self._state = (None, self._load())
+            self._checked_at = time.monotonic()
+            return state[1]
+
+        space = namespace('settings')
+        version = space.version(fresh=True)
+        state = self._state
+        if state is None or state[0] != version:
+            with self._lock:
+                state = self._state
+                if state is None or state[0] != version:
+                    state = self._state = (version, space.get_or_set(CACHE_KEY, self._load, None))
+        self._checked_at = time.monotonic()
+        return state[1]
+
+    def get(self):
+        state = self._state
+        interval = getattr(settings, 'SYSTEM_SETTINGS_CHECK_INTERVAL', 1)
+        if state is None or time.monotonic() - self._checked_at >= interval:
+            return self.sync()
+        return state[1]
+
+    def invalidate(self):
+        """Tüm worker'ların kopyalarını geçersiz kıl"""
+        namespace('settings').invalidate()
+        self._state = None
+
+system_settings_cache = SystemSettingsCache()
+
+def get_system_settings():
+    """Önbellekli SystemSettings (salt okunur kullanım için; düzenleme için get_settings())"""
+    return system_settings_cache.get()
+
+def invalidate_system_settings():
+    """Ayar değişikliğini transaction commit edildikten sonra yayınla"""
+    transaction.on_commit(system_settings_cache.invalidate)
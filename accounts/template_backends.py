@@ -0,0 +1,42 @@
+# accounts/template_backends.py
+"""
+Yardım Masası - Süre Ölçen Template Backend
+===========================================
+
+Django template backend'i ile aynıdır; yalnızca üst seviye template
+render sürelerini aktif isteğin metriklerine (accounts.request_metrics) ekler.
+{% include %} / {% extends %} ile yüklenen alt template'ler üst render
+süresinin içinde kalır, iki kez sayılmaz.
+"""
+
+import time
+
+from django.template.backends.django import DjangoTemplates
+
+from .request_metrics import record_template_render
+
+
+class TimedTemplate:
+    """Backend template nesnesini saran, render süresini ölçen sınıf"""
+
+    def __init__(self, template):
+        self._template = template
+
+    def __getattr__(self, name):
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        started = time.perf_counter()
+        try:
+            return self._template.render(context, request)
+        finally:
+            record_template_render((time.perf_counter() - started) * 1000)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
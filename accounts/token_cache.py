@@ -0,0 +1,160 @@
+# accounts/token_cache.py
+"""
+Yardım Masası - Token Çözümleme Önbelleği
+=========================================
+
+Token anahtarı → (kullanıcı id, son geçerlilik, aktiflik) eşlemesini iki
+katmanda saklar, böylece kararlı durumda kimlik doğrulama için token
+tablosuna sorgu atılmaz:
+
+1. Process içi LRU (TTL'li, kısa ömürlü)
+2. Django cache framework, 'users' isim alanı (tüm worker'lar arasında paylaşılan)
+
+Token yenilendiğinde, kaydedildiğinde veya silindiğinde ilgili kayıt her iki
+katmandan silinir. Diğer worker'ların process içi kopyaları en geç
+TOKEN_CACHE_LOCAL_TTL saniye içinde düşer. 'users' isim alanı admin cache
+sayfasından geçersiz kılındığında paylaşılan kayıtlar topluca düşer.
+
+Varsayılan cache paylaşılmıyorsa (locmem/dummy) ikinci katman kullanılmaz:
+LocMem'deki kayıt yalnızca bu process'ten silinebilir ve iptal edilen token
+diğer worker'larda TOKEN_CACHE_TTL boyunca kabul edilirdi. Bu durumda kayıtlar
+yalnızca TOKEN_CACHE_LOCAL_TTL süresince process içinde tutulur.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .cache_layer import is_shared_cache, namespace
+from .request_metrics import record_cache_lookup
+
+CACHE_KEY_PREFIX = 'auth_token'
+
+# Bulunamayan token'lar için kayıt (tekrarlanan geçersiz token'lar DB'ye gitmesin)
+MISSING = {'missing': True}
+
+# ================================================================================
+# Process İçi LRU
+# ================================================================================
+
+class LocalTTLCache:
+    """Thread-safe, boyut sınırlı ve kayıt başına süreli LRU önbellek"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+# ================================================================================
+# İki Katmanlı Token Önbelleği
+# ================================================================================
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+def _cache_key(token_key):
+    """Token anahtarı paylaşılan cache'e açık metin olarak yazılmaz"""
+    digest = hashlib.sha256(token_key.encode()).hexdigest()
+    return f'{CACHE_KEY_PREFIX}:{digest}'
+
+class TokenCache:
+    """
+    Token çözümleme önbelleği.
+    Kayıtlar: {'user_id', 'expires_at' (unix zamanı veya None), 'is_active', 'source'}
+    veya bulunamayan token'lar için MISSING.
+    """
+
+    def __init__(self):
+        self.local = LocalTTLCache(_setting('TOKEN_CACHE_MAX_ENTRIES', 10000))
+        self.shared = namespace('users')
+
+    def _ttl_for(self, entry, ttl):
+        """Kayıt, token'ın son geçerlilik anından daha uzun yaşamasın"""
+        expires_at = entry.get('expires_at')
+        if expires_at is not None:
+            ttl = min(ttl, max(0, int(expires_at - time.time())))
+        return ttl
+
+    def get(self, token_key):
+        cache_key = _cache_key(token_key)
+        entry = self.local.get(cache_key)
+        if entry is not None:
+            record_cache_lookup(hit=True)
+            return entry
+
+        if not is_shared_cache():
+            return None
+
+        entry = self.shared.get(cache_key)
+        if entry is not None:
+            ttl = self._ttl_for(entry, _setting('TOKEN_CACHE_LOCAL_TTL', 30))
+            if ttl > 0:
+                self.local.set(cache_key, entry, ttl)
+        return entry
+
+    def set(self, token_key, entry):
+        cache_key = _cache_key(token_key)
+        if entry.get('missing'):
+            shared_ttl = local_ttl = _setting('TOKEN_CACHE_MISSING_TTL', 10)
+        else:
+            shared_ttl = self._ttl_for(entry, _setting('TOKEN_CACHE_TTL', 300))
+            local_ttl = self._ttl_for(entry, _setting('TOKEN_CACHE_LOCAL_TTL', 30))
+        if shared_ttl > 0 and is_shared_cache():
+            self.shared.set(cache_key, entry, shared_ttl)
+        if local_ttl > 0:
+            self.local.set(cache_key, entry, local_ttl)
+
+    def invalidate(self, token_key):
+        if not token_key:
+            return
+        cache_key = _cache_key(token_key)
+        self.local.delete(cache_key)
+        self.shared.delete(cache_key)
+
+    def clear_local(self):
+        self.local.clear()
+
+token_cache = TokenCache()
+
+def token_entry(token, source='custom'):
+    """Token model örneğinden önbellek kaydı oluştur"""
+    expires_at = getattr(token, 'expires_at', None)
+    return {
+        'user_id': token.user_id,
+        'expires_at': expires_at.timestamp() if expires_at else None,
+        'is_active': getattr(token, 'is_active', True),
+        'source': source,
+    }
@@ -0,0 +1,187 @@
+# accounts/token_usage.py
+"""
+Yardım Masası - Token Kullanım Takibi (Write-Behind)
+====================================================
+
+CustomAuthToken.last_used her istekte UPDATE edilmez:
+
+1. Bir token TOKEN_USAGE_GRANULARITY saniyelik pencere içinde en fazla bir
+   kez kaydedilir (cache.add ile tüm worker'lar arasında)
+2. Kayıt, paylaşılan cache'teki sıralı bir kuyruğa (slot) yazılır
+3. Kuyruk TOKEN_USAGE_FLUSH_INTERVAL saniyede bir (ya da flush_token_usage
+   komutu ile) tek bir UPDATE ... CASE WHEN sorgusu ile veritabanına yazılır
+
+Yazıcı önce sıra numarasını (SEQ_KEY) alır, slotu sonra yazar; flush bu
+aradaki boş slotu atlamaz. İlk boş slotta durur ve sonraki flush'ta yeniden
+dener; slot MISSING_SLOT_GRACE saniye boyunca boş kalırsa (yazıcı çöktü,
+kayıt cache'ten düştü) kayıp sayılır ve geçilir.
+
+Kuyruk, process'ler arasında paylaşılan ve incr/add'i atomik olan bir cache
+(Redis, Memcached) gerektirir. LocMem'de kuyruk yalnızca yazan process'te
+görünür (flush_token_usage komutu boş kuyruk görür), dosya tabanlı cache'te
+sıra numaraları çakışabilir. Bu backend'lerde ve DummyCache'te kayıt, yine
+pencere başına bir kez olmak üzere doğrudan veritabanına yazılır.
+"""
+
+import atexit
+import hashlib
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+from .cache_layer import has_atomic_counters
+from .models import CustomAuthToken
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'token_usage'
+SEQ_KEY = f'{PREFIX}:seq'
+FLUSHED_KEY = f'{PREFIX}:flushed'
+LOCK_KEY = f'{PREFIX}:lock'
+FLUSH_DUE_KEY = f'{PREFIX}:flush_due'
+
+# Kuyruktaki bir kaydın flush edilmeden önce cache'te kalabileceği süre
+QUEUE_TTL = 24 * 60 * 60
+FLUSH_BATCH_SIZE = 500
+
+# Sıra numarası alınmış ama henüz yazılmamış slotun bekleneceği süre (saniye)
+MISSING_SLOT_GRACE = 30
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+def _granularity():
+    return int(getattr(settings, 'TOKEN_USAGE_GRANULARITY', 300))
+
+def _flush_interval():
+    return int(getattr(settings, 'TOKEN_USAGE_FLUSH_INTERVAL', 60))
+
+def _slot_key(slot):
+    return f'{PREFIX}:slot:{slot}'
+
+def _missing_key(slot):
+    return f'{PREFIX}:missing:{slot}'
+
+def _slot_abandoned(slot):
+    """
+    Boş slot kayıp mı? İlk görüldüğü an saklanır; MISSING_SLOT_GRACE
+    dolana kadar yazıcının slotu henüz yazmadığı varsayılır.
+    """
+    now = time.time()
+    if cache.add(_missing_key(slot), now, QUEUE_TTL):
+        return False
+    first_seen = cache.get(_missing_key(slot))
+    return first_seen is not None and now - first_seen >= MISSING_SLOT_GRACE
+
+def _seen_key(token_key):
+    return f'{PREFIX}:seen:' + hashlib.sha256(token_key.encode()).hexdigest()
+
+def write_last_used(usages):
+    """
+    {token_key: datetime} eşlemesini tek UPDATE sorgusu ile yaz.
+    Güncellenen satır sayısını döndürür.
+    """
+    if not usages:
+        return 0
+    return CustomAuthToken.objects.filter(key__in=list(usages)).update(
+        last_used=Case(
+            *[When(key=key, then=Value(used_at)) for key, used_at in usages.items()],
+            output_field=DateTimeField(),
+        )
+    )
+
+# ================================================================================
+# Kayıt ve Flush
+# ================================================================================
+
+def record_token_use(token_key, when=None):
+    """
+    Token kullanımını kuyruğa ekle.
+    Pencere içinde zaten kaydedilmişse hiçbir şey yapmaz ve False döner.
+    """
+    when = when or timezone.now()
+
+    if not cache.add(_seen_key(token_key), 1, _granularity()):
+        return False
+
+    if not has_atomic_counters():
+        # Kuyruk güvenilir değil (process içi ya da atomik olmayan cache): doğrudan yaz
+        write_last_used({token_key: when})
+        return True
+
+    cache.add(SEQ_KEY, 0, None)
+    slot = cache.incr(SEQ_KEY)
+
+    cache.set(_slot_key(slot), (token_key, when.timestamp()), QUEUE_TTL)
+
+    # Flush aralığı dolduysa bu istek kuyruğu boşaltır (worker'lar arasında tek seferlik)
+    if cache.add(FLUSH_DUE_KEY, 1, _flush_interval()):
+        flush_token_usage()
+    return True
+
+def flush_token_usage():
+    """
+    Kuyruktaki kullanım kayıtlarını toplu olarak veritabanına yaz.
+    Aynı anda tek bir flush çalışır; henüz yazılmamış ilk slotta durulur.
+    Yazılan token sayısını döndürür.
+    """
+    if not cache.add(LOCK_KEY, 1, 60):
+        return 0
+
+    written = 0
+    try:
+        first = (cache.get(FLUSHED_KEY) or 0) + 1
+        last = cache.get(SEQ_KEY) or 0
+
+        for batch_start in range(first, last + 1, FLUSH_BATCH_SIZE):
+            batch_end = min(batch_start + FLUSH_BATCH_SIZE - 1, last)
+            entries = cache.get_many([_slot_key(slot) for slot in range(batch_start, batch_end + 1)])
+
+            # Yazıcısı henüz slotu yazmamış olabilir: ilk boş slottan öncesi işlenir
+            flushed_until = batch_start - 1
+            for slot in range(batch_start, batch_end + 1):
+                if _slot_key(slot) not in entries and not _slot_abandoned(slot):
+                    break
+                flushed_until = slot
+            if flushed_until < batch_start:
+                break
+
+            slots = range(batch_start, flushed_until + 1)
+            usages = {}
+            for slot in slots:
+                if _slot_key(slot) not in entries:
+                    continue
+                token_key, timestamp = entries[_slot_key(slot)]
+                used_at = datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+                if token_key not in usages or usages[token_key] < used_at:
+                    usages[token_key] = used_at
+            written += write_last_used(usages)
+            cache.delete_many([_slot_key(slot) for slot in slots] + [_missing_key(slot) for slot in slots])
+            cache.set(FLUSHED_KEY, flushed_until, None)
+            if flushed_until < batch_end:
+                break
+    except Exception as e:
+        logger.error(f"Token usage flush failed: {str(e)}")
+    finally:
+        cache.delete(LOCK_KEY)
+
+    return written
+
+def pending_token_usage():
+    """Kuyrukta bekleyen kayıt sayısı"""
+    return max(0, (cache.get(SEQ_KEY) or 0) - (cache.get(FLUSHED_KEY) or 0))
+
+@atexit.register
+def _flush_at_exit():
+    """Process kapanırken (process içi cache'te kalan) kayıtları yaz"""
+    try:
+        if pending_token_usage():
+            flush_token_usage()
+    except Exception:
+        pass
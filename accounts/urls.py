@@ -55,6 +55,7 @@ urlpatterns = [
     # Raporlar ve analitik
     path('admin/reports/', views.admin_reports_view, name='admin_reports'),
     path('admin/analytics/', views.admin_analytics_view, name='admin_analytics'),
+    path('admin/analytics/resolution-time/', views.admin_resolution_stats_api, name='admin_resolution_stats_api'),
     
     # Sistem yönetimi
     path('admin/settings/', views.admin_settings_view, name='admin_settings'),
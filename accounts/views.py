@@ -96,134 +96,37 @@ def admin_panel_view(request):
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
 
-    from django.utils import timezone
-    from datetime import timedelta
-    from django.db.models import Count, Q
-    
+    from django.contrib.auth.models import Group
+    from tickets.models import Talep
+    from .dashboard import get_cached_admin_dashboard_stats
+
     now = timezone.now()
-    today = now.date()
-    yesterday = today - timedelta(days=1)
-    week_ago = now - timedelta(days=7)
     month_ago = now - timedelta(days=30)
 
-    # Kullanıcı istatistikleri (güncel)
-    total_users = CustomUser.objects.count()
-    active_users = CustomUser.objects.filter(is_active=True).count()
-    admin_users = CustomUser.objects.filter(role='admin').count()
-    support_users = CustomUser.objects.filter(role='support').count()
-    customer_users = CustomUser.objects.filter(role='customer').count()
-    
-    # Bugün katılan kullanıcılar
-    users_today = CustomUser.objects.filter(date_joined__date=today).count()
-    users_yesterday = CustomUser.objects.filter(date_joined__date=yesterday).count()
-    users_this_week = CustomUser.objects.filter(date_joined__gte=week_ago).count()
-    users_this_month = CustomUser.objects.filter(date_joined__gte=month_ago).count()
-    
-    # Talep istatistikleri (güncel)
-    try:
-        from tickets.models import Talep
-        total_tickets = Talep.objects.count()
-        
-        # Status bazlı sayımlar
-        open_tickets = Talep.objects.filter(status='open').count()
-        in_progress_tickets = Talep.objects.filter(status='in_progress').count()
-        resolved_tickets = Talep.objects.filter(status='resolved').count()
-        closed_tickets = Talep.objects.filter(status='closed').count()
-        pending_tickets = Talep.objects.filter(status='pending').count()
-        
-        # Priority bazlı sayımlar
-        high_priority = Talep.objects.filter(priority='high').count()
-        medium_priority = Talep.objects.filter(priority='medium').count()
-        low_priority = Talep.objects.filter(priority='low').count()
-        
-        # Zaman bazlı talepler
-        tickets_today = Talep.objects.filter(created_at__date=today).count()
-        tickets_yesterday = Talep.objects.filter(created_at__date=yesterday).count()
-        tickets_this_week = Talep.objects.filter(created_at__gte=week_ago).count()
-        tickets_this_month = Talep.objects.filter(created_at__gte=month_ago).count()
-        
-        # Büyüme oranları
-        ticket_daily_growth = ((tickets_today - tickets_yesterday) / max(tickets_yesterday, 1)) * 100
-        
-        # Son talepler (güncel)
-        recent_tickets = Talep.objects.select_related('user', 'category').order_by('-created_at')[:10]
-        
-        # Kritik talepler (yüksek öncelikli ve açık)
-        critical_tickets = Talep.objects.filter(
-            priority='high',
-            status__in=['open', 'in_progress']
-        ).select_related('user').order_by('-created_at')[:5]
-        
-        # Kategori dağılımı
-        category_stats = Talep.objects.values('category__name').annotate(
-            count=Count('id')
-        ).order_by('-count')[:10]
-        
-        # Günlük aktivite (son 7 gün)
-        daily_activity = []
-        for i in range(7):
-            day = today - timedelta(days=i)
-            day_tickets = Talep.objects.filter(created_at__date=day).count()
-            daily_activity.append({
-                'date': day.strftime('%d/%m'),
-                'tickets': day_tickets
-            })
-        daily_activity.reverse()
-        
-    except ImportError:
-        # Tickets app yoksa default değerler
-        total_tickets = 0
-        open_tickets = 0
-        in_progress_tickets = 0
-        resolved_tickets = 0
-        closed_tickets = 0
-        pending_tickets = 0
-        high_priority = 0
-        medium_priority = 0
-        low_priority = 0
-        tickets_today = 0
-        tickets_yesterday = 0
-        tickets_this_week = 0
-        tickets_this_month = 0
-        ticket_daily_growth = 0
-        recent_tickets = []
-        critical_tickets = []
-        category_stats = []
-        daily_activity = []
-
-    # Token istatistikleri (güncel)
-    active_tokens = CustomAuthToken.objects.filter(created__gte=month_ago).count()
-    expired_tokens = CustomAuthToken.objects.filter(created__lt=month_ago).count()
-    tokens_today = CustomAuthToken.objects.filter(created__date=today).count()
-    
-    # Grup sayısı ve kullanıcı dağılımı
-    from django.contrib.auth.models import Group
+    # Tüm sayaçlar birkaç koşullu aggregate sorgusu ile hesaplanır ve
+    # 'tickets' cache isim alanında kısa süre saklanır
+    stats = get_cached_admin_dashboard_stats(now)
+
+    # Son talepler (güncel)
+    recent_tickets = Talep.objects.select_related('user', 'category').order_by('-created_at')[:10]
+
+    # Kritik talepler (yüksek öncelikli ve açık)
+    critical_tickets = Talep.objects.filter(
+        priority='high',
+        status__in=['open', 'in_progress']
+    ).select_related('user').order_by('-created_at')[:5]
+
+    # Kategori dağılımı
+    category_stats = Talep.objects.values('category__name').annotate(
+        count=Count('id')
+    ).order_by('-count')[:10]
+
+    # Grup sayısı ve grup başına kullanıcı sayısı
     total_groups = Group.objects.count()
-    
-    # Grup başına kullanıcı sayısı
     group_user_counts = Group.objects.annotate(
         user_count=Count('customuser_set')
     ).order_by('-user_count')[:10]
-    
-    # System health metrikleri
-    system_health = {
-        'total_users': total_users,
-        'active_users': active_users,
-        'total_tickets': total_tickets,
-        'active_tickets': open_tickets + in_progress_tickets + pending_tickets,
-        'critical_tickets': high_priority,
-        'user_activity_score': min(100, (users_this_week / max(total_users, 1)) * 1000),  # 0-100 skala
-        'ticket_activity_score': min(100, (tickets_this_week / max(tickets_this_month/4, 1)) * 100),
-    }
-    
-    # Performance indicators
-    performance_indicators = {
-        'resolution_rate': round((resolved_tickets + closed_tickets) / max(total_tickets, 1) * 100, 1),
-        'daily_growth': round(ticket_daily_growth, 1),
-        'user_engagement': round(tickets_this_month / max(active_users, 1), 2),
-        'support_load': round(open_tickets / max(support_users, 1), 2) if support_users > 0 else 0,
-    }
-    
+
     # Son kullanıcılar (güncel)
     recent_users = CustomUser.objects.select_related().order_by('-date_joined')[:10]
 
@@ -234,45 +137,45 @@ def admin_panel_view(request):
         'page_title': 'Admin Panel',
         
         # Kullanıcı istatistikleri (güncel)
-        'total_users': total_users,
-        'active_users': active_users,
-        'admin_users': admin_users,
-        'support_users': support_users,
-        'customer_users': customer_users,
-        'users_today': users_today,
-        'users_this_week': users_this_week,
-        'users_this_month': users_this_month,
+        'total_users': stats['total_users'],
+        'active_users': stats['active_users'],
+        'admin_users': stats['admin_users'],
+        'support_users': stats['support_users'],
+        'customer_users': stats['customer_users'],
+        'users_today': stats['users_today'],
+        'users_this_week': stats['users_this_week'],
+        'users_this_month': stats['users_this_month'],
         'recent_users': recent_users,
         
         # Talep istatistikleri (güncel)
-        'total_tickets': total_tickets,
-        'open_tickets': open_tickets,
-        'in_progress_tickets': in_progress_tickets,
-        'resolved_tickets': resolved_tickets,
-        'closed_tickets': closed_tickets,
-        'pending_tickets': pending_tickets,
-        'high_priority': high_priority,
-        'medium_priority': medium_priority,
-        'low_priority': low_priority,
-        'tickets_today': tickets_today,
-        'tickets_this_week': tickets_this_week,
-        'tickets_this_month': tickets_this_month,
-        'ticket_daily_growth': round(ticket_daily_growth, 2),
+        'total_tickets': stats['total_tickets'],
+        'open_tickets': stats['open_tickets'],
+        'in_progress_tickets': stats['in_progress_tickets'],
+        'resolved_tickets': stats['resolved_tickets'],
+        'closed_tickets': stats['closed_tickets'],
+        'pending_tickets': stats['pending_tickets'],
+        'high_priority': stats['high_priority'],
+        'medium_priority': stats['medium_priority'],
+        'low_priority': stats['low_priority'],
+        'tickets_today': stats['tickets_today'],
+        'tickets_this_week': stats['tickets_this_week'],
+        'tickets_this_month': stats['tickets_this_month'],
+        'ticket_daily_growth': round(stats['ticket_daily_growth'], 2),
         'recent_tickets': recent_tickets,
         'critical_tickets': critical_tickets,
         'category_stats': category_stats,
-        'daily_activity': daily_activity,
+        'daily_activity': stats['daily_activity'],
         
         # Token ve grup istatistikleri (güncel)
-        'active_tokens': active_tokens,
-        'expired_tokens': expired_tokens,
-        'tokens_today': tokens_today,
+        'active_tokens': stats['active_tokens'],
+        'expired_tokens': stats['expired_tokens'],
+        'tokens_today': stats['tokens_today'],
         'total_groups': total_groups,
         'group_user_counts': group_user_counts,
         
         # System health ve performance
-        'system_health': system_health,
-        'performance_indicators': performance_indicators,
+        'system_health': stats['system_health'],
+        'performance_indicators': stats['performance_indicators'],
         
         # Metadata
         'last_updated': now.strftime('%d/%m/%Y %H:%M:%S'),
@@ -296,34 +199,19 @@ def support_panel_view(request):
 @login_required
 def customer_panel_view(request):
     """Customer panel"""
-    from tickets.models import Talep
     from django.db.models import Count, Q
-    
-    # Aynı gruptaki kullanıcıların taleplerini de al
-    user_groups = request.user.groups.all()
-    if user_groups.exists():
-        # Aynı grupta olan kullanıcıları bul
-        group_users = CustomUser.objects.filter(groups__in=user_groups).distinct()
-        # Bu kullanıcıların son 5 talebini al
-        recent_tickets = Talep.objects.filter(user__in=group_users).order_by('-created_at')[:5]
-        # Ticket istatistiklerini hesapla
-        ticket_stats = Talep.objects.filter(user__in=group_users).aggregate(
-            total=Count('id'),
-            open=Count('id', filter=Q(status='open')),
-            in_progress=Count('id', filter=Q(status='in_progress')),
-            resolved=Count('id', filter=Q(status='resolved')),
-            closed=Count('id', filter=Q(status='closed'))
-        )
-    else:
-        # Grubu yoksa sadece kendi taleplerini göster
-        recent_tickets = Talep.objects.filter(user=request.user).order_by('-created_at')[:5]
-        ticket_stats = Talep.objects.filter(user=request.user).aggregate(
-            total=Count('id'),
-            open=Count('id', filter=Q(status='open')),
-            in_progress=Count('id', filter=Q(status='in_progress')),
-            resolved=Count('id', filter=Q(status='resolved')),
-            closed=Count('id', filter=Q(status='closed'))
-        )
+    from tickets.visibility import group_visible_tickets
+    
+    # Kendi talepleri + aynı gruptaki kullanıcıların talepleri (ticket listesi ile aynı sorgu yolu)
+    visible = group_visible_tickets(request.user)
+    recent_tickets = visible.order_by('-created_at')[:5]
+    ticket_stats = visible.aggregate(
+        total=Count('id'),
+        open=Count('id', filter=Q(status='open')),
+        in_progress=Count('id', filter=Q(status='in_progress')),
+        resolved=Count('id', filter=Q(status='resolved')),
+        closed=Count('id', filter=Q(status='closed'))
+    )
     
     context = {
         'current_user': request.user,
@@ -343,11 +231,15 @@ def customer_panel_view(request):
 def admin_users_view(request):
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
+    from .pagination import EstimatedCountPaginator
     users = CustomUser.objects.prefetch_related('groups').all().order_by('-date_joined')
+    paginator = EstimatedCountPaginator(users, 25)
+    page_users = paginator.get_page(request.GET.get('page'))
     return render(request, 'accounts/admin_users.html', {
         'current_user': request.user,
         'user_role': request.user.get_role_display(),
-        'users': users,
+        'users': page_users,
+        'page_links': paginator.page_links(page_users),
         'panel_title': 'Kullanıcı Yönetimi',
         'page_title': 'Kullanıcı Yönetimi'
     })
@@ -907,6 +799,9 @@ def admin_reports_view(request):
     from datetime import datetime, timedelta
     from django.db.models import Count, Q, Avg, Max, Min
     from tickets.models import Talep
+    from tickets.rollups import distribution, on_day
+    from tickets.sla import breached as sla_breached
+    from .dashboard import get_daily_report_series, get_monthly_report_series
     
     now = datetime.now()
     today = now.date()
@@ -920,29 +815,21 @@ def admin_reports_view(request):
     total_tickets = Talep.objects.count()
     
     # Zaman bazlı ticket sayıları
-    tickets_today = Talep.objects.filter(created_at__date=today).count()
+    tickets_today = Talep.objects.filter(on_day('created_at', today)).count()
     tickets_last_week = Talep.objects.filter(created_at__gte=last_week).count()
     tickets_last_month = Talep.objects.filter(created_at__gte=last_month).count()
     tickets_last_quarter = Talep.objects.filter(created_at__gte=last_quarter).count()
     tickets_last_year = Talep.objects.filter(created_at__gte=last_year).count()
     
-    # Status bazlı analizler
-    tickets_by_status = Talep.objects.values('status').annotate(
-        count=Count('id'),
-        percentage=Count('id') * 100.0 / max(total_tickets, 1)
-    ).order_by('-count')
-    
-    # Priority bazlı analizler
-    tickets_by_priority = Talep.objects.values('priority').annotate(
-        count=Count('id'),
-        percentage=Count('id') * 100.0 / max(total_tickets, 1)
-    ).order_by('-count')
-    
-    # Kategori bazlı analizler
-    tickets_by_category = Talep.objects.values('category__name').annotate(
-        count=Count('id'),
-        percentage=Count('id') * 100.0 / max(total_tickets, 1)
-    ).order_by('-count')[:15]  # Top 15 kategori
+    # Status / priority / kategori dağılımları (TicketDailyStats rollup'ından)
+    def with_percentage(rows, total):
+        for row in rows:
+            row['percentage'] = row['count'] * 100.0 / max(total, 1)
+        return rows
+
+    tickets_by_status = with_percentage(distribution('status'), total_tickets)
+    tickets_by_priority = with_percentage(distribution('priority'), total_tickets)
+    tickets_by_category = with_percentage(distribution('category__name', limit=15), total_tickets)  # Top 15 kategori
     
     # Kullanıcı rolleri analizi
     users_by_role = CustomUser.objects.values('role').annotate(
@@ -956,57 +843,29 @@ def admin_reports_view(request):
             count=Count('id')
         ).order_by('-count')
     
-    # Günlük aktivite raporu (son 30 gün)
+    # Günlük aktivite raporu (son 30 gün, eskiden yeniye)
     daily_activity = []
-    for i in range(30):
-        day = today - timedelta(days=i)
-        day_tickets = Talep.objects.filter(created_at__date=day).count()
-        day_users_joined = CustomUser.objects.filter(date_joined__date=day).count()
-        
+    for day in get_daily_report_series(days=30):
         daily_activity.append({
-            'date': day.strftime('%Y-%m-%d'),
-            'date_display': day.strftime('%d/%m/%Y'),
-            'tickets': day_tickets,
-            'new_users': day_users_joined,
-            'total_activity': day_tickets + day_users_joined
+            'date': day['date'].strftime('%Y-%m-%d'),
+            'date_display': day['date'].strftime('%d/%m/%Y'),
+            'tickets': day['created'],
+            'new_users': day['new_users'],
+            'total_activity': day['created'] + day['new_users']
         })
     
-    daily_activity.reverse()  # Eskiden yeniye sırala
-    
-    # Aylık özet rapor (son 12 ay)
+    # Aylık özet rapor (son 12 ay, eskiden yeniye)
     monthly_summary = []
-    for i in range(12):
-        month_start = now.replace(day=1) - timedelta(days=30*i)
-        next_month = month_start.replace(day=28) + timedelta(days=4)
-        next_month = next_month.replace(day=1)
-        
-        month_tickets = Talep.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=next_month
-        ).count()
-        
-        month_users = CustomUser.objects.filter(
-            date_joined__gte=month_start,
-            date_joined__lt=next_month
-        ).count()
-        
-        month_closed = Talep.objects.filter(
-            updated_at__gte=month_start,
-            updated_at__lt=next_month,
-            status='closed'
-        ).count()
-        
+    for month in get_monthly_report_series(months=12):
         monthly_summary.append({
-            'month': month_start.strftime('%Y-%m'),
-            'month_name': month_start.strftime('%B %Y'),
-            'tickets_created': month_tickets,
-            'users_joined': month_users,
-            'tickets_closed': month_closed,
-            'closure_rate': round((month_closed / max(month_tickets, 1)) * 100, 2)
+            'month': month['month_start'].strftime('%Y-%m'),
+            'month_name': month['month_start'].strftime('%B %Y'),
+            'tickets_created': month['created'],
+            'users_joined': month['new_users'],
+            'tickets_closed': month['closed'],
+            'closure_rate': round((month['closed'] / max(month['created'], 1)) * 100, 2)
         })
     
-    monthly_summary.reverse()  # Eskiden yeniye sırala
-    
     # En aktif kullanıcılar
     most_active_users = Talep.objects.values(
         'user__username', 
@@ -1028,7 +887,7 @@ def admin_reports_view(request):
         'open_tickets': Talep.objects.exclude(status='closed').count(),
         'closed_tickets': Talep.objects.filter(status='closed').count(),
         'high_priority_tickets': Talep.objects.filter(priority='high').count(),
-        'overdue_tickets': 0,  # Gelecekte deadline alanı eklenirse güncellenebilir
+        'overdue_tickets': sla_breached().count(),  # Yanıt/çözüm süresi dolmuş açık talepler
     }
     
     # Performance indicators
@@ -1081,6 +940,11 @@ def admin_analytics_view(request):
     from datetime import datetime, timedelta
     from django.db.models import Count, Q, Avg
     from tickets.models import Talep
+    from django.utils import timezone
+    from tickets.metrics import resolution_time_stats
+    from tickets.rollups import distribution, on_day
+    from tickets.status_history import first_response, resolution, time_in_status
+    from .dashboard import get_daily_report_series, get_monthly_report_series
     
     now = datetime.now()
     today = now.date()
@@ -1096,8 +960,8 @@ def admin_analytics_view(request):
     closed_tickets = Talep.objects.filter(status='closed').count()
     
     # Zaman bazlı analizler
-    tickets_today = Talep.objects.filter(created_at__date=today).count()
-    tickets_yesterday = Talep.objects.filter(created_at__date=yesterday).count()
+    tickets_today = Talep.objects.filter(on_day('created_at', today)).count()
+    tickets_yesterday = Talep.objects.filter(on_day('created_at', yesterday)).count()
     tickets_this_week = Talep.objects.filter(created_at__gte=last_week).count()
     tickets_this_month = Talep.objects.filter(created_at__gte=last_month).count()
     
@@ -1112,71 +976,59 @@ def admin_analytics_view(request):
     ).count()
     weekly_growth = ((tickets_this_week - tickets_previous_week) / max(tickets_previous_week, 1)) * 100 if tickets_previous_week > 0 else 0
     
-    # Status dağılımı
-    status_distribution = Talep.objects.values('status').annotate(count=Count('id')).order_by('-count')
-    
-    # Priority dağılımı  
-    priority_distribution = Talep.objects.values('priority').annotate(count=Count('id')).order_by('-count')
-    
-    # Kategori dağılımı
-    category_distribution = Talep.objects.values('category__name').annotate(count=Count('id')).order_by('-count')[:10]
+    # Status / priority / kategori dağılımları (TicketDailyStats rollup'ından)
+    status_distribution = distribution('status')
+    priority_distribution = distribution('priority')
+    category_distribution = distribution('category__name', limit=10)
     
     # Kullanıcı rolleri dağılımı
     user_roles = CustomUser.objects.values('role').annotate(count=Count('id'))
     
-    # Aylık trend verisi (son 12 ay)
+    # Aylık trend verisi (son 12 ay, eskiden yeniye)
     monthly_data = []
-    for i in range(12):
-        month_start = now.replace(day=1) - timedelta(days=30*i)
-        next_month = month_start.replace(day=28) + timedelta(days=4)
-        next_month = next_month.replace(day=1)
-        
-        month_tickets = Talep.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=next_month
-        ).count()
-        
+    for month in get_monthly_report_series(months=12):
         monthly_data.append({
-            'month': month_start.strftime('%Y-%m'),
-            'month_name': month_start.strftime('%B %Y'),
-            'count': month_tickets
+            'month': month['month_start'].strftime('%Y-%m'),
+            'month_name': month['month_start'].strftime('%B %Y'),
+            'count': month['created']
         })
     
-    monthly_data.reverse()  # Eskiden yeniye sırala
-    
-    # Günlük trend (son 30 gün)
+    # Günlük trend (son 30 gün, eskiden yeniye)
     daily_data = []
-    for i in range(30):
-        day = today - timedelta(days=i)
-        day_tickets = Talep.objects.filter(created_at__date=day).count()
+    for day in get_daily_report_series(days=30):
         daily_data.append({
-            'date': day.strftime('%Y-%m-%d'),
-            'date_display': day.strftime('%d/%m'),
-            'count': day_tickets
+            'date': day['date'].strftime('%Y-%m-%d'),
+            'date_display': day['date'].strftime('%d/%m'),
+            'count': day['created']
         })
     
-    daily_data.reverse()  # Eskiden yeniye sırala
-    
     # En aktif kullanıcılar (talep oluşturanlar)
     top_users = Talep.objects.values('user__username', 'user__first_name', 'user__last_name')\
         .annotate(ticket_count=Count('id'))\
         .order_by('-ticket_count')[:10]
     
-    # Ortalama çözüm süresi (gün olarak)
-    closed_tickets_with_time = Talep.objects.filter(
-        status='closed',
-        updated_at__isnull=False
-    )
-    
-    avg_resolution_time = 0
-    if closed_tickets_with_time.exists():
-        total_resolution_time = 0
-        count = 0
-        for ticket in closed_tickets_with_time:
-            resolution_time = (ticket.updated_at - ticket.created_at).total_seconds() / 86400  # gün cinsinden
-            total_resolution_time += resolution_time
-            count += 1
-        avg_resolution_time = total_resolution_time / count if count > 0 else 0
+    # Çözüm süresi istatistikleri (gün olarak, veritabanında hesaplanır)
+    resolution_stats = resolution_time_stats()
+
+    # Durum geçmişinden (TicketStatusEvent) son 30 günün süreleri (saat olarak)
+    def to_hours(value):
+        return round(value.total_seconds() / 3600, 1) if value else 0
+
+    history_start = timezone.now() - timedelta(days=30)
+    recent_tickets = Talep.objects.filter(created_at__gte=history_start)
+    response_stats = first_response(recent_tickets)
+    first_resolution_stats = resolution(recent_tickets)
+    status_labels = dict(Talep.STATUS_CHOICES)
+    status_durations = [
+        {
+            'status': status,
+            'label': status_labels.get(status, status),
+            'count': row['count'],
+            'avg_hours': to_hours(row['avg']),
+            'total_hours': to_hours(row['total']),
+        }
+        for status, row in sorted(time_in_status(start=history_start).items(), key=lambda item: -item[1]['count'])
+    ]
     
     # Performance metrikleri
     performance_metrics = {
@@ -1189,8 +1041,15 @@ def admin_analytics_view(request):
         'tickets_this_month': tickets_this_month,
         'today_growth': round(today_growth, 2),
         'weekly_growth': round(weekly_growth, 2),
-        'avg_resolution_time': round(avg_resolution_time, 2),
+        'avg_resolution_time': resolution_stats['avg_days'],
+        'resolution_time_p50': resolution_stats['p50_days'],
+        'resolution_time_p90': resolution_stats['p90_days'],
+        'resolution_time_p99': resolution_stats['p99_days'],
         'closure_rate': round((closed_tickets / max(total_tickets, 1)) * 100, 2),
+        'avg_first_response_hours': to_hours(response_stats['avg']),
+        'responded_tickets': response_stats['count'],
+        'avg_first_resolution_hours': to_hours(first_resolution_stats['avg']),
+        'resolved_tickets': first_resolution_stats['count'],
     }
     
     context = {
@@ -1206,21 +1065,36 @@ def admin_analytics_view(request):
         'monthly_data': monthly_data,
         'daily_data': daily_data,
         'top_users': list(top_users),
+        'status_durations': status_durations,
         'last_updated': now.strftime('%d/%m/%Y %H:%M')
     }
     return render(request, 'accounts/admin_analytics.html', context)
 
+@login_required
+def admin_resolution_stats_api(request):
+    """Çözüm süresi istatistiklerini (ortalama, p50/p90/p99) JSON olarak döndür"""
+    if getattr(request.user, 'role', '').lower() != 'admin':
+        return JsonResponse({'error': 'Yetkiniz yok'}, status=403)
+    
+    from tickets.metrics import resolution_time_stats
+    
+    return JsonResponse({
+        'success': True,
+        'resolution_time': resolution_time_stats(),
+        'unit': 'days',
+    })
+
 @login_required
 def admin_settings_view(request):
     """Sistem ayarları sayfası"""
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
     
-    # Mevcut ayarları al
     from .models import SystemSettings
-    settings = SystemSettings.get_settings()
     
     if request.method == 'POST':
+        # Düzenleme veritabanındaki kayıt üzerinde yapılır
+        settings = SystemSettings.get_settings()
         tab = request.POST.get('tab', 'general')
         
         try:
@@ -1266,6 +1140,9 @@ def admin_settings_view(request):
         # Güncelleme sonrası aynı tab'a yönlendir
         return redirect(f"{request.path}?tab={tab}")
     
+    # Görüntüleme önbellekli kopyadan (kayıt sonrası sürüm artırıldığı için günceldir)
+    settings = SystemSettings.cached()
+    
     # Hangi tab'ın aktif olacağını belirle
     active_tab = request.GET.get('tab', 'general')
     
@@ -1287,24 +1164,46 @@ def admin_logs_view(request):
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
     
+    from .log_search import search_logs
     from .models import SystemLog
-    from django.core.paginator import Paginator
+    from .pagination import EstimatedCountPaginator, estimate_count, estimate_threshold
     from django.db.models import Count
     from datetime import datetime, timedelta
+    from urllib.parse import urlencode
+    from tickets.rollups import on_day
+    
+    # AJAX istek kontrolü - log temizleme
+    if request.method == 'POST' and request.POST.get('action') == 'clear_logs':
+        if request.user.role == 'admin':
+            from .log_retention import purge_before
+            
+            # Eski logları sil (30 günden eski) - bölüm düşürme + parça parça silme
+            old_date = timezone.now() - timedelta(days=30)
+            result = purge_before(old_date)
+            deleted_count = result['deleted'] + sum(rows for _, rows in result['partitions'])
+            
+            # Yeni log kaydı oluştur
+            SystemLog.log(
+                level='INFO',
+                action='LOG_CLEANUP',
+                message=f'Admin tarafından {deleted_count} adet eski log kaydı temizlendi',
+                user=request.user,
+                ip_address=request.META.get('REMOTE_ADDR')
+            )
+            
+            messages.success(request, f'{deleted_count} adet eski log kaydı temizlendi.')
+            return redirect('admin_logs')
     
     # Filtreleme parametreleri
     level_filter = request.GET.get('level', '')
     date_filter = request.GET.get('date_range', 'all')
-    search_query = request.GET.get('search', '')
+    search_query = request.GET.get('search', '').strip()
     
-    # Log kayıtlarını filtrele
+    # Tarih ve arama filtreleri (seviye filtresi hariç)
     logs = SystemLog.objects.all()
     
-    if level_filter:
-        logs = logs.filter(level=level_filter.upper())
-    
     if date_filter == 'today':
-        logs = logs.filter(timestamp__date=timezone.now().date())
+        logs = logs.filter(on_day('timestamp', timezone.localdate()))
     elif date_filter == 'week':
         week_ago = timezone.now() - timedelta(days=7)
         logs = logs.filter(timestamp__gte=week_ago)
@@ -1313,59 +1212,55 @@ def admin_logs_view(request):
         logs = logs.filter(timestamp__gte=month_ago)
     
     if search_query:
-        logs = logs.filter(
-            Q(message__icontains=search_query) | 
-            Q(action__icontains=search_query) |
-            Q(user__username__icontains=search_query)
-        )
+        # İndeksli tam metin arama (PostgreSQL tsvector/trigram, SQLite FTS5)
+        logs, _ = search_logs(logs, search_query)
+    
+    # Seviye istatistikleri ve toplam aynı filtrelenmiş sorgudan, tek aggregate ile.
+    # Planlayıcı tahmini eşiğin üzerindeyse tablo taranmaz, seviye sayıları da tahmindir.
+    level_names = [level for level, _ in SystemLog.LOG_LEVELS]
+    estimate = estimate_count(logs)
+    counts_estimated = estimate is not None and estimate >= estimate_threshold()
+    if counts_estimated:
+        stats = {level: estimate_count(logs.filter(level=level)) or 0 for level in level_names}
+    else:
+        stats = logs.order_by().aggregate(**{
+            level: Count('id', filter=Q(level=level)) for level in level_names
+        })
     
-    # Sayfalama
-    paginator = Paginator(logs, 20)  # Her sayfada 20 log
-    page_number = request.GET.get('page')
-    page_logs = paginator.get_page(page_number)
+    if level_filter:
+        logs = logs.filter(level=level_filter.upper())
+        total_logs = stats.get(level_filter.upper(), 0)
+    else:
+        total_logs = sum(stats.values())
     
-    # İstatistikler
-    log_stats = SystemLog.objects.values('level').annotate(count=Count('id'))
-    stats_dict = {stat['level']: stat['count'] for stat in log_stats}
+    if search_query:
+        logs = logs.order_by('-search_rank', '-timestamp')
+    logs = logs.select_related('user')
     
-    # AJAX istek kontrolü - log temizleme
-    if request.method == 'POST' and request.POST.get('action') == 'clear_logs':
-        if request.user.role == 'admin':
-            # Eski logları sil (30 günden eski)
-            old_date = timezone.now() - timedelta(days=30)
-            deleted_count = SystemLog.objects.filter(timestamp__lt=old_date).delete()[0]
-            
-            # Yeni log kaydı oluştur
-            SystemLog.log(
-                level='INFO',
-                action='LOG_CLEANUP',
-                message=f'Admin tarafından {deleted_count} adet eski log kaydı temizlendi',
-                user=request.user,
-                ip_address=request.META.get('REMOTE_ADDR')
-            )
-            
-            messages.success(request, f'{deleted_count} adet eski log kaydı temizlendi.')
-            return redirect('admin_logs')
+    # Sayfalama - toplam zaten bilindiği için ayrıca COUNT sorgusu çalışmaz
+    paginator = EstimatedCountPaginator(logs, 20)  # Her sayfada 20 log
+    paginator.count = total_logs
+    paginator.is_estimated = counts_estimated
+    page_number = request.GET.get('page')
+    page_logs = paginator.get_page(page_number)
     
+    filters = {
+        'level': level_filter,
+        'date_range': date_filter,
+        'search': search_query,
+    }
     context = {
         'current_user': request.user,
         'user_role': request.user.get_role_display(),
         'panel_title': 'Sistem Logları',
         'page_title': 'Sistem Logları',
         'logs': page_logs,
-        'stats': {
-            'DEBUG': stats_dict.get('DEBUG', 0),
-            'INFO': stats_dict.get('INFO', 0),
-            'WARNING': stats_dict.get('WARNING', 0),
-            'ERROR': stats_dict.get('ERROR', 0),
-            'CRITICAL': stats_dict.get('CRITICAL', 0),
-        },
-        'total_logs': logs.count(),
-        'filters': {
-            'level': level_filter,
-            'date_range': date_filter,
-            'search': search_query,
-        }
+        'page_links': paginator.page_links(page_logs),
+        'stats': stats,
+        'total_logs': total_logs,
+        'counts_estimated': counts_estimated,
+        'filters': filters,
+        'log_query': ''.join(f'&{urlencode({key: value})}' for key, value in filters.items() if value),
     }
     return render(request, 'accounts/admin_logs.html', context)
 
@@ -1375,12 +1270,17 @@ def admin_tokens_view(request):
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
     
-    tokens = CustomAuthToken.objects.all().order_by('-created')
+    from .pagination import EstimatedCountPaginator
+    
+    tokens = CustomAuthToken.objects.select_related('user').order_by('-created')
+    paginator = EstimatedCountPaginator(tokens, 25)
+    page_tokens = paginator.get_page(request.GET.get('page'))
     
     context = {
         'current_user': request.user,
         'user_role': request.user.get_role_display(),
-        'tokens': tokens,
+        'tokens': page_tokens,
+        'page_links': paginator.page_links(page_tokens),
         'panel_title': 'API Token Yönetimi',
         'page_title': 'API Token Yönetimi'
     }
@@ -1406,11 +1306,19 @@ def admin_maintenance_view(request):
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
     
+    from .log_writer import system_log_writer
+    from .request_metrics import view_stats
+    
     context = {
         'current_user': request.user,
         'user_role': request.user.get_role_display(),
         'panel_title': 'Sistem Bakım',
-        'page_title': 'Sistem Bakım'
+        'page_title': 'Sistem Bakım',
+        # View bazlı istek süreleri (bu process'in son REQUEST_METRICS_WINDOW isteği)
+        'view_metrics': view_stats.summary(),
+        'view_metrics_window': view_stats.window,
+        # SystemLog yazıcısı kuyruk/atılan kayıt sayaçları (bu process)
+        'log_writer': system_log_writer.stats(),
     }
     return render(request, 'accounts/admin_maintenance.html', context)
 
@@ -1444,15 +1352,45 @@ def admin_notifications_view(request):
 
 @login_required
 def admin_cache_view(request):
-    """Cache yönetimi sayfası"""
+    """Cache yönetimi sayfası - isim alanı istatistikleri ve geçersiz kılma"""
     if getattr(request.user, 'role', '').lower() != 'admin':
         return redirect('/accounts/login/')
     
+    from django.core.cache import cache
+    from .cache_layer import NAMESPACES, cache_overview, namespace, namespace_stats
+    from .token_cache import token_cache
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        name = request.POST.get('namespace', '')
+        
+        if action == 'invalidate_namespace' and name in NAMESPACES:
+            version = namespace(name).invalidate()
+            if name == 'users':
+                token_cache.clear_local()
+            messages.success(request, f'"{name}" isim alanı geçersiz kılındı (yeni sürüm: {version}).')
+        elif action == 'reset_stats' and name in NAMESPACES:
+            namespace_stats.reset(name)
+            messages.success(request, f'"{name}" isim alanı sayaçları sıfırlandı.')
+        elif action == 'clear_all':
+            cache.clear()
+            token_cache.clear_local()
+            messages.success(request, 'Tüm cache temizlendi.')
+        else:
+            messages.error(request, 'Geçersiz cache işlemi.')
+        
+        logger.info(f"Cache işlemi: {action} {name} - {request.user.username}")
+        return redirect('admin_cache')
+    
+    # Bu process'te biriken sayaçlar da toplamlara yansısın
+    namespace_stats.flush()
+    
     context = {
         'current_user': request.user,
         'user_role': request.user.get_role_display(),
         'panel_title': 'Cache Yönetimi',
-        'page_title': 'Cache Yönetimi'
+        'page_title': 'Cache Yönetimi',
+        'cache': cache_overview(),
     }
     return render(request, 'accounts/admin_cache.html', context)
 
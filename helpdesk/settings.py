@@ -4,6 +4,7 @@ Yardım Masası Project - Django yapılandırması
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 # ============================================================
@@ -76,6 +77,7 @@ CRISPY_TEMPLATE_PACK = "bootstrap5"
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Static files - production
+    'accounts.middleware.RequestMetricsMiddleware',  # İstek süre/sorgu metrikleri, Server-Timing
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -85,6 +87,11 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# İstek metrikleri (accounts.middleware.RequestMetricsMiddleware)
+REQUEST_METRICS_WINDOW = 500             # View başına saklanan son istek sayısı (process içi)
+REQUEST_METRICS_SLOW_MS = 1000           # Bu süreyi aşan istekler WARNING olarak loglanır
+REQUEST_METRICS_SERVER_TIMING = 'staff'  # True: tüm yanıtlar, 'staff': admin/support, False: kapalı
+
 # ============================================================
 # URL / WSGI - ALPHA PRODUCTION
 # ============================================================
@@ -115,12 +122,86 @@ DATABASES = {
     }
 }
 
-# Cache configuration - Development
+# Cache configuration - CACHE_BACKEND ortam değişkeni ile seçilir:
+#   locmem (varsayılan) : tek process, testler için yerel karşılık. Birden fazla
+#                         worker ile kullanılmamalı: önbellek geçersiz kılmaları
+#                         (sistem ayarları, token iptali) diğer worker'lara
+#                         ulaşmaz (accounts.W001 uyarısı)
+#   file                : aynı makinedeki birden fazla process (CACHE_LOCATION = dizin)
+#   redis               : birden fazla process / sunucu (CACHE_LOCATION = redis:// URL,
+#                         'redis' paketi gerekir; Redis uyumlu sunucular da kullanılabilir)
+#   dummy               : cache kapalı
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem').lower()
+_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'helpdesk'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', os.path.join(tempfile.gettempdir(), 'helpdesk_cache')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+    'dummy': ('django.core.cache.backends.dummy.DummyCache', ''),
+}
+if CACHE_BACKEND not in _CACHE_BACKENDS:
+    raise ValueError(f"Geçersiz CACHE_BACKEND: {CACHE_BACKEND} ({', '.join(_CACHE_BACKENDS)})")
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',  # Development için cache yok
+        'BACKEND': _CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': os.getenv('CACHE_LOCATION', _CACHE_BACKENDS[CACHE_BACKEND][1]),
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'helpdesk'),
+        'TIMEOUT': int(os.getenv('CACHE_TIMEOUT', '300')),
     }
 }
+if CACHE_BACKEND in ('locmem', 'file'):
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '10000'))}
+
+# İsim alanlı cache katmanı (accounts.cache_layer)
+# Sürüm numarasının process içinde tutulduğu süre (sn) - başka worker'daki
+# geçersiz kılma en geç bu süre sonunda görülür
+CACHE_VERSION_LOCAL_TTL = 2
+# İsabet/ıskalama sayaçlarının paylaşılan cache'e yazılma aralığı (sn)
+CACHE_STATS_FLUSH_INTERVAL = 30
+# Admin paneli sayaçlarının 'tickets' isim alanında tutulma süresi (sn)
+ADMIN_DASHBOARD_CACHE_TTL = 60
+# Önbellekli SystemSettings sürümünün kontrol aralığı (sn) - paylaşılmayan
+# cache'te (locmem/dummy) kayıt bu aralıkla veritabanından yeniden okunur
+SYSTEM_SETTINGS_CHECK_INTERVAL = 1
+
+# SystemLog arka plan yazıcısı (accounts.log_writer)
+SYSTEM_LOG_ASYNC = True                     # False: kayıtlar istek içinde anında yazılır
+SYSTEM_LOG_QUEUE_SIZE = 10000               # Process içi kuyruk kapasitesi
+SYSTEM_LOG_BATCH_SIZE = 500                 # Tek bulk_create'teki en fazla kayıt
+SYSTEM_LOG_FLUSH_INTERVAL = 2.0             # Bir kaydın kuyrukta bekleyebileceği en uzun süre (sn)
+SYSTEM_LOG_OVERFLOW = 'drop_new'            # Kuyruk doluyken: drop_new | drop_oldest | block
+SYSTEM_LOG_BLOCK_TIMEOUT = 0.05             # 'block' politikasında en fazla bekleme (sn)
+SYSTEM_LOG_SYNC_LEVELS = ('ERROR', 'CRITICAL')  # Kuyruk doluyken atılmak yerine senkron yazılır
+
+# SystemLog saklama (accounts.log_retention, systemlog_retention komutu)
+SYSTEM_LOG_RETENTION_DAYS = {               # Seviye bazında saklama süresi (gün), None: süresiz
+    'DEBUG': 7,
+    'INFO': 90,
+    'WARNING': 180,
+    'ERROR': 365,
+    'CRITICAL': 365,
+}
+SYSTEM_LOG_RETENTION_BATCH_SIZE = 5000      # Tek DELETE ile silinecek en fazla satır
+SYSTEM_LOG_RETENTION_ARCHIVE = False        # True: süresi dolan aylık bölümler silinmez, arşiv tablosu olur
+SYSTEM_LOG_PARTITION_MONTHS_AHEAD = 2       # Önceden oluşturulacak aylık bölüm sayısı (PostgreSQL)
+
+# Token authentication - bu öneklerle başlayan yollarda cookie token'ı da
+# session'a bağlanmadan (login() çağrılmadan) doğrulanır.
+# Authorization header'ı ile gelen istekler her zaman stateless'tır.
+TOKEN_AUTH_STATELESS_PATHS = [
+    '/tickets/update-status/',
+]
+
+# Token çözümleme önbelleği (accounts.token_cache) - süreler saniye cinsinden
+TOKEN_CACHE_TTL = 300          # Paylaşılan cache katmanı (yalnızca redis/memcached/dosya cache'te kullanılır)
+TOKEN_CACHE_LOCAL_TTL = 30     # Process içi LRU - iptal edilen token diğer worker'larda en geç bu sürede düşer
+TOKEN_CACHE_MISSING_TTL = 10   # Bulunamayan token anahtarları
+TOKEN_CACHE_MAX_ENTRIES = 10000
+
+# Token last_used takibi (accounts.token_usage) - süreler saniye cinsinden
+TOKEN_USAGE_GRANULARITY = 300     # Bir token bu süre içinde en fazla bir kez yazılır
+TOKEN_USAGE_FLUSH_INTERVAL = 60   # Kuyruk bu aralıkla toplu olarak veritabanına yazılır (yalnızca Redis/Memcached;
+                                  # diğer backend'lerde kayıt doğrudan yazılır)
 
 # Database connection pooling - Development (disabled)
 DATABASE_CONNECTION_POOLING = {
@@ -136,7 +217,7 @@ DATABASE_CONNECTION_POOLING = {
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'accounts.template_backends.TimedDjangoTemplates',  # DjangoTemplates + render süresi ölçümü
         'DIRS': [
             BASE_DIR / "templates",
             BASE_DIR / "tickets" / "templates",
@@ -232,7 +313,13 @@ SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Strict'  # Daha güvenli
 SESSION_COOKIE_AGE = 1800  # 30 dakika (daha kısa)
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
-SESSION_SAVE_EVERY_REQUEST = True
+
+# Kayan süreli session: her istekte yazmak yerine (SESSION_SAVE_EVERY_REQUEST)
+# yalnızca veri değiştiğinde veya kalan ömür eşiğin altına düştüğünde kaydedilir.
+# Karşılaştırma: python manage.py session_write_report
+SESSION_ENGINE = 'accounts.sessions'
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_THRESHOLD = 900  # saniye - boşta kalma sınırı [15, 30] dakika
 
 # Additional security settings - Alpha production
 DATA_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB (daha kısıtlayıcı)
@@ -245,6 +332,34 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 500  # Daha kısıtlayıcı
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Talep listesi sayfalama (keyset/cursor) - ?page_size= bu sınırla kısıtlanır
+TICKET_LIST_PAGE_SIZE = 25
+TICKET_LIST_MAX_PAGE_SIZE = 100
+
+# Toplu durum değiştirme - tek istekte güncellenebilecek en fazla talep
+TICKET_BULK_STATUS_MAX_IDS = 500
+
+# SLA - check_sla komutunun "yakında ihlal edecek" raporu için varsayılan süre (saat)
+SLA_WARNING_HOURS = 4
+
+# SLA süreleri mesai saati olarak işler (False: takvim saati)
+SLA_BUSINESS_HOURS = True
+
+# İş takvimi (tickets.business_hours) - değişiklik sonrası: manage.py check_sla --recompute
+BUSINESS_TIME_ZONE = TIME_ZONE
+# Hafta günü (0=Pazartesi) → çalışma aralıkları; listede olmayan günler hafta sonu
+BUSINESS_WORKING_HOURS = {weekday: [('09:00', '18:00')] for weekday in range(5)}
+# 'AA-GG': her yıl tekrar eden resmi tatil, 'YYYY-AA-GG': o yıla özel (dini bayramlar vb.)
+BUSINESS_HOLIDAYS = ['01-01', '04-23', '05-01', '05-19', '07-15', '08-30', '10-29']
+
+# Admin listeleri (loglar, tokenlar, kullanıcılar) - planlayıcı tahmini bu satır
+# sayısının üzerindeyse COUNT(*) çalışmaz, toplam yaklaşık gösterilir (PostgreSQL)
+ADMIN_LIST_COUNT_ESTIMATE_THRESHOLD = int(os.getenv('ADMIN_LIST_COUNT_ESTIMATE_THRESHOLD', '100000'))
+
+# Talep numarası dağıtımı - her process bu kadar numarayı tek seferde ayırır
+# (1: numaralar oluşturulma sırasını izler; >1: daha az DB turu, process'ler arası sıra garantisi yok)
+TICKET_NUMBER_BLOCK_SIZE = int(os.getenv('TICKET_NUMBER_BLOCK_SIZE', '1'))
+
 # ============================================================
 # DJANGO REST FRAMEWORK GÜVENLİK
 # ============================================================
@@ -343,6 +458,12 @@ LOGGING = {
             'level': 'WARNING',
             'propagate': False,
         },
+        'accounts.requests': {
+            # İstek başına JSON metrik satırı (RequestMetricsMiddleware)
+            'handlers': ['file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         'root': {
             'handlers': ['console'],
             'level': 'ERROR',
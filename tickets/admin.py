@@ -11,7 +11,9 @@ from django.urls import path
 from django.http import JsonResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.contrib import messages
-from .models import Category, SLA, Talep, Comment
+from .models import Category, SLA, STATUS_TRANSITIONS, Talep, Comment
+from .rollups import update_queryset
+from .transitions import change_status, tickets_for_update
 
 
 # -------------------------------------------------------------------------------
@@ -79,7 +81,8 @@ class TalepAdmin(admin.ModelAdmin):
 
     def change_status_view(self, request, talep_id, new_status):
         """AJAX ile durum değiştirme"""
-        talep = get_object_or_404(Talep, id=talep_id)
+        # Yalnızca durum/rollup alanları okunur (description vb. yüklenmez)
+        talep = get_object_or_404(tickets_for_update(), id=talep_id)
         
         # Durum geçerli mi kontrol et
         valid_statuses = [choice[0] for choice in Talep.STATUS_CHOICES]
@@ -87,8 +90,13 @@ class TalepAdmin(admin.ModelAdmin):
             return JsonResponse({'error': 'Geçersiz durum'}, status=400)
         
         old_status = talep.get_status_display()
-        talep.status = new_status
-        talep.save()
+        # UPDATE ... WHERE status = <eski durum>: arada değiştiyse çakışma
+        if not change_status(talep, new_status, actor=request.user):
+            conflict_message = f'Talep #{talep_id} bu arada başka bir kullanıcı tarafından güncellendi.'
+            if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+                return JsonResponse({'error': conflict_message, 'conflict': True}, status=409)
+            messages.error(request, conflict_message)
+            return HttpResponseRedirect(request.META.get('HTTP_REFERER', '/admin/tickets/talep/'))
         
         new_status_display = talep.get_status_display()
         
@@ -102,6 +110,11 @@ class TalepAdmin(admin.ModelAdmin):
             messages.success(request, f'Talep #{talep_id} durumu "{old_status}" → "{new_status_display}" olarak değiştirildi.')
             return HttpResponseRedirect(request.META.get('HTTP_REFERER', '/admin/tickets/talep/'))
 
+    def save_model(self, request, obj, form, change):
+        """Admin formundan yapılan durum değişikliği durum geçmişine kullanıcıyla yazılır"""
+        obj._status_actor = request.user
+        super().save_model(request, obj, form, change)
+
     # ================================
     # Durum Değiştirme Butonları
     # ================================
@@ -111,18 +124,8 @@ class TalepAdmin(admin.ModelAdmin):
         current_status = obj.status
         
         # Mevcut duruma göre gösterilecek butonları belirle
-        status_transitions = {
-            'new': ['seen', 'open', 'wrong_section'],
-            'seen': ['open', 'pending', 'wrong_section'],
-            'open': ['in_progress', 'pending', 'resolved'],
-            'pending': ['open', 'in_progress'],
-            'in_progress': ['resolved', 'pending'],
-            'resolved': ['closed', 'open'],
-            'closed': ['open'],
-            'wrong_section': ['new', 'open']
-        }
-        
-        available_statuses = status_transitions.get(current_status, [])
+        # (geçiş haritası toplu durum değiştirme ile ortaktır)
+        available_statuses = STATUS_TRANSITIONS.get(current_status, [])
         
         for status_code in available_statuses:
             status_name = dict(Talep.STATUS_CHOICES)[status_code]
@@ -171,25 +174,25 @@ class TalepAdmin(admin.ModelAdmin):
     # ================================
     def mark_as_closed(self, request, queryset):
         """Seçilen talepleri 'Kapatıldı' olarak işaretle"""
-        updated = queryset.update(status='closed')
+        updated = update_queryset(queryset, actor=request.user, status='closed')
         self.message_user(request, f"{updated} talep kapatıldı.")
     mark_as_closed.short_description = "Seçilen talepleri (Kapatıldı) olarak işaretle"
 
     def mark_as_pending(self, request, queryset):
         """Seçilen talepleri 'Beklemede' olarak işaretle"""
-        updated = queryset.update(status='pending')
+        updated = update_queryset(queryset, actor=request.user, status='pending')
         self.message_user(request, f"{updated} talep beklemeye alındı.")
     mark_as_pending.short_description = "Seçilen talepleri (Beklemede) olarak işaretle"
 
     def mark_as_open(self, request, queryset):
         """Seçilen talepleri 'Açık' olarak işaretle"""
-        updated = queryset.update(status='open')
+        updated = update_queryset(queryset, actor=request.user, status='open')
         self.message_user(request, f"{updated} talep açık olarak işaretlendi.")
     mark_as_open.short_description = "Seçilen talepleri (Açık) olarak işaretle"
 
     def mark_as_wrong_section(self, request, queryset):
         """Seçilen talepleri 'Yanlış Bölüm' olarak işaretle"""
-        updated = queryset.update(status='wrong_section')
+        updated = update_queryset(queryset, actor=request.user, status='wrong_section')
         self.message_user(request, f"{updated} talep yanlış bölüm olarak işaretlendi.")
     mark_as_wrong_section.short_description = "Seçilen talepleri (Yanlış Bölüm) olarak işaretle"
 
@@ -12,4 +12,8 @@ class TicketsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
 
     # Uygulamanın proje içindeki adı
-    name = 'tickets'
\ No newline at end of file
+    name = 'tickets'
+
+    def ready(self):
+        # Model sinyallerini bağla (rollup tabloları vb.)
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,238 @@
+# tickets/benchmark.py
+"""
+Yardım Masası - Sorgu Planı Ölçümleri
+=====================================
+
+View'ları test client ile çağırır, çalışan SQL sorgularını yakalar ve
+her sorgu için:
+- veritabanı planını (PostgreSQL: EXPLAIN ANALYZE, SQLite: EXPLAIN QUERY PLAN)
+- tek başına çalışma süresini
+raporlar. İndekslerin gerçekten kullanılıp kullanılmadığını görmek için
+sentetik veri (tickets.synthetic) ile birlikte kullanılır.
+
+run_view_benchmark ise view'ları (AJAX durum/atama endpoint'leri dahil)
+tekrar tekrar çağırarak gecikme yüzdeliklerini ve sorgu sayılarını ölçer.
+"""
+
+import json
+import statistics
+import time
+
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# (etiket, url adı, rol, query string)
+BENCHMARK_CASES = [
+    ('ticket_list', 'ticket_list', 'admin', ''),
+    ('ticket_list ?status=open', 'ticket_list', 'admin', 'status=open'),
+    ('ticket_list ?assigned_to', 'ticket_list', 'support', 'assigned_to={support_id}'),
+    ('ticket_list', 'ticket_list', 'customer', ''),
+    ('ticket_detail', 'ticket_detail', 'admin', ''),
+    ('customer_panel', 'customer_panel', 'customer', ''),
+    ('admin_panel', 'admin_panel', 'admin', ''),
+    ('admin_reports', 'admin_reports', 'admin', ''),
+    ('admin_analytics', 'admin_analytics', 'admin', ''),
+    ('admin_logs', 'admin_logs', 'admin', ''),
+    ('admin_logs ?level=ERROR', 'admin_logs', 'admin', 'level=ERROR'),
+    ('admin_logs ?search', 'admin_logs', 'admin', 'search=sentetik error'),
+]
+
+# ================================================================================
+# Sorgu Planı
+# ================================================================================
+
+def explain_prefix(vendor):
+    if vendor == 'postgresql':
+        return 'EXPLAIN (ANALYZE, BUFFERS) '
+    if vendor == 'sqlite':
+        return 'EXPLAIN QUERY PLAN '
+    return 'EXPLAIN '
+
+def explain_sql(sql, using='default'):
+    """Yakalanan SQL'in planını satır listesi olarak döndür"""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute(explain_prefix(connection.vendor) + sql)
+        rows = cursor.fetchall()
+    if connection.vendor == 'sqlite':
+        # (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [' '.join(str(column) for column in row) for row in rows]
+
+def time_sql(sql, using='default', repeat=3):
+    """Sorguyu `repeat` kez çalıştır, medyan süreyi (ms) döndür"""
+    connection = connections[using]
+    timings = []
+    with connection.cursor() as cursor:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            cursor.execute(sql)
+            cursor.fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def _is_select(sql):
+    return sql.lstrip().upper().startswith(('SELECT', 'WITH'))
+
+# ================================================================================
+# View Ölçümü
+# ================================================================================
+
+def run_query_benchmark(users_by_role, ticket, repeat=3, explain=True, cases=None, using='default'):
+    """
+    Her senaryo için view'ı `repeat` kez çağır, son çağrının sorgularını ölç.
+    Dönüş: [{'label', 'role', 'status_code', 'view_ms', 'queries': [{'sql', 'ms', 'plan'}]}]
+    """
+    support = users_by_role.get('support')
+    results = []
+
+    for label, url_name, role, query in cases or BENCHMARK_CASES:
+        user = users_by_role.get(role)
+        if user is None:
+            continue
+
+        kwargs = {'pk': ticket.pk} if url_name == 'ticket_detail' else {}
+        url = reverse(url_name, kwargs=kwargs)
+        if query:
+            url += '?' + query.format(support_id=support.pk if support else '')
+
+        client = Client()
+        client.force_login(user)
+        view_timings = []
+        try:
+            for _ in range(max(1, repeat)):
+                with CaptureQueriesContext(connections[using]) as context:
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    view_timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            client.logout()
+
+        queries = []
+        for captured in context.captured_queries:
+            sql = captured['sql']
+            entry = {'sql': sql, 'ms': float(captured['time']) * 1000, 'plan': []}
+            if explain and _is_select(sql):
+                entry['ms'] = time_sql(sql, using=using, repeat=repeat)
+                entry['plan'] = explain_sql(sql, using=using)
+            queries.append(entry)
+
+        results.append({
+            'label': label,
+            'role': role,
+            'url': url,
+            'status_code': response.status_code,
+            'view_ms': statistics.median(view_timings),
+            'queries': queries,
+        })
+    return results
+
+# ================================================================================
+# Gecikme Ölçümü
+# ================================================================================
+
+# (etiket, url adı, rol, HTTP metodu)
+VIEW_BENCHMARKS = [
+    ('ticket_list', 'ticket_list', 'admin', 'GET'),
+    ('ticket_list', 'ticket_list', 'support', 'GET'),
+    ('ticket_list', 'ticket_list', 'customer', 'GET'),
+    ('ticket_detail', 'ticket_detail', 'admin', 'GET'),
+    ('ticket_detail', 'ticket_detail', 'customer', 'GET'),
+    ('admin_panel', 'admin_panel', 'admin', 'GET'),
+    ('admin_reports', 'admin_reports', 'admin', 'GET'),
+    ('admin_analytics', 'admin_analytics', 'admin', 'GET'),
+    ('change_ticket_status', 'change_ticket_status', 'support', 'POST'),
+    ('update_ticket_status', 'update_ticket_status', 'support', 'POST'),
+    ('update_ticket_assignment', 'update_ticket_assignment', 'support', 'POST'),
+]
+
+# AJAX durum endpoint'lerinde sırayla kullanılan durumlar
+STATUS_CYCLE = ('open', 'in_progress', 'pending', 'resolved')
+
+def percentile(values, p):
+    """Sıralı olmayan listede nearest-rank yüzdelik"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))
+    return ordered[index]
+
+def _sample_ticket_ids(user, limit):
+    """Kullanıcının görebildiği en yeni `limit` talep"""
+    from .visibility import visible_tickets
+
+    return list(visible_tickets(user).order_by('-created_at').values_list('pk', flat=True)[:limit])
+
+def _build_request(url_name, ticket_id, iteration, users_by_role):
+    """Senaryo için (url, JSON gövdesi) döndür"""
+    if url_name in ('ticket_detail', 'change_ticket_status', 'update_ticket_assignment'):
+        url = reverse(url_name, kwargs={'pk': ticket_id})
+    else:
+        url = reverse(url_name)
+
+    status = STATUS_CYCLE[iteration % len(STATUS_CYCLE)]
+    if url_name == 'change_ticket_status':
+        return url, {'status': status}
+    if url_name == 'update_ticket_status':
+        return url, {'ticket_id': ticket_id, 'new_status': status}
+    if url_name == 'update_ticket_assignment':
+        assignee = users_by_role.get('support') if iteration % 2 == 0 else None
+        return url, {'assigned_to_id': assignee.pk if assignee else None}
+    return url, None
+
+def run_view_benchmark(users_by_role, iterations=50, warmup=2, cases=None, sample_size=50, using='default'):
+    """
+    Her senaryoyu `iterations` kez çalıştır (ilk `warmup` istek sayılmaz).
+    Dönüş: [{'label', 'role', 'requests', 'errors', 'p50_ms', 'p90_ms', 'p99_ms',
+             'mean_ms', 'max_ms', 'queries_p50', 'queries_max'}]
+    """
+    results = []
+    for label, url_name, role, method in cases or VIEW_BENCHMARKS:
+        user = users_by_role.get(role)
+        if user is None:
+            continue
+        ticket_ids = _sample_ticket_ids(user, sample_size)
+        if not ticket_ids:
+            continue
+
+        client = Client()
+        client.force_login(user)
+        timings, query_counts, errors = [], [], 0
+        try:
+            for iteration in range(warmup + iterations):
+                ticket_id = ticket_ids[iteration % len(ticket_ids)]
+                url, body = _build_request(url_name, ticket_id, iteration, users_by_role)
+
+                with CaptureQueriesContext(connections[using]) as context:
+                    started = time.perf_counter()
+                    if method == 'POST':
+                        response = client.post(url, data=json.dumps(body), content_type='application/json')
+                    else:
+                        response = client.get(url)
+                    elapsed = (time.perf_counter() - started) * 1000
+
+                if iteration < warmup:
+                    continue
+                timings.append(elapsed)
+                query_counts.append(len(context.captured_queries))
+                if response.status_code >= 400:
+                    errors += 1
+        finally:
+            client.logout()
+
+        results.append({
+            'label': label,
+            'role': role,
+            'requests': len(timings),
+            'errors': errors,
+            'p50_ms': percentile(timings, 50),
+            'p90_ms': percentile(timings, 90),
+            'p99_ms': percentile(timings, 99),
+            'mean_ms': statistics.mean(timings),
+            'max_ms': max(timings),
+            'queries_p50': percentile(query_counts, 50),
+            'queries_max': max(query_counts),
+        })
+    return results
@@ -0,0 +1,213 @@
+# tickets/business_hours.py
+"""
+Yardım Masası - İş Takvimi (Mesai Saatleri)
+===========================================
+
+SLA süreleri takvim saati değil mesai saati olarak işler. Takvim:
+- BUSINESS_TIME_ZONE       : mesainin tanımlandığı saat dilimi (varsayılan TIME_ZONE)
+- BUSINESS_WORKING_HOURS   : {hafta günü (0=Pazartesi): [('09:00', '18:00'), ...]}
+                             listede olmayan günler hafta sonu sayılır
+- BUSINESS_HOLIDAYS        : 'AA-GG' her yıl tekrar eden, 'YYYY-AA-GG' tek seferlik tatiller
+
+Son tarih hesabı dakika dakika ilerlemez. Takvim, çalışma aralıklarının
+(UTC epoch saniyesi) sıralı başlangıç/bitiş dizileri ve her aralıktan önceki
+toplam çalışma süresini tutan bir önek toplamı olarak önceden hesaplanır:
+
+    starts[i], ends[i]   : i. çalışma aralığı
+    before[i]            : starts[i] anına kadar birikmiş çalışma saniyesi
+
+Bir andaki birikmiş çalışma süresi ve "N saat sonrası" iki bisect ile
+bulunur (O(log n)). İndeks INDEX_CHUNK_DAYS günlük parçalar halinde
+gerektikçe genişletilir ve process içinde yapılandırma başına saklanır
+(get_calendar); binlerce talebin son tarihi aynı indeksle hesaplanır.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+DEFAULT_WORKING_HOURS = {weekday: [('09:00', '18:00')] for weekday in range(5)}
+
+# Resmi tatiller (sabit tarihli); dini bayramlar yıl bazında BUSINESS_HOLIDAYS'e eklenir
+DEFAULT_HOLIDAYS = ['01-01', '04-23', '05-01', '05-19', '07-15', '08-30', '10-29']
+
+# İndeksin tek seferde genişletildiği gün sayısı
+INDEX_CHUNK_DAYS = 366
+
+_calendars = {}
+_calendars_lock = threading.Lock()
+
+# ================================================================================
+# Yapılandırma
+# ================================================================================
+
+def _parse_time(value):
+    return value if isinstance(value, time) else time.fromisoformat(value)
+
+def _parse_holidays(values):
+    """('AA-GG' tekrar eden, 'YYYY-AA-GG' tek seferlik) → (ay/gün kümesi, tarih kümesi)"""
+    recurring, dates = set(), set()
+    for value in values:
+        if isinstance(value, date):
+            dates.add(value)
+        elif len(value) == 5:
+            month, day = value.split('-')
+            recurring.add((int(month), int(day)))
+        else:
+            dates.add(date.fromisoformat(value))
+    return frozenset(recurring), frozenset(dates)
+
+def calendar_config():
+    """Ayarlardan takvim yapılandırması (hashlenebilir; önbellek anahtarı olarak da kullanılır)"""
+    working_hours = getattr(settings, 'BUSINESS_WORKING_HOURS', DEFAULT_WORKING_HOURS)
+    return (
+        getattr(settings, 'BUSINESS_TIME_ZONE', settings.TIME_ZONE),
+        tuple(sorted(
+            (int(weekday), tuple((str(start), str(end)) for start, end in intervals))
+            for weekday, intervals in working_hours.items()
+        )),
+        tuple(sorted(str(value) for value in getattr(settings, 'BUSINESS_HOLIDAYS', DEFAULT_HOLIDAYS))),
+    )
+
+# ================================================================================
+# Takvim
+# ================================================================================
+
+class BusinessCalendar:
+    """Önceden hesaplanmış çalışma aralıkları üzerinde mesai süresi hesabı"""
+
+    def __init__(self, time_zone, working_hours, holidays=()):
+        self.tz = ZoneInfo(time_zone) if isinstance(time_zone, str) else time_zone
+        self.working_hours = {
+            int(weekday): sorted((_parse_time(start), _parse_time(end)) for start, end in intervals)
+            for weekday, intervals in dict(working_hours).items()
+        }
+        if not any(start < end for intervals in self.working_hours.values() for start, end in intervals):
+            raise ImproperlyConfigured('BUSINESS_WORKING_HOURS en az bir çalışma aralığı içermelidir.')
+        self.recurring_holidays, self.holidays = _parse_holidays(holidays)
+
+        # İndeks genişletilirken diziler değiştiği için hesaplar kilit altında yapılır
+        self._lock = threading.RLock()
+        self._first_day = self._last_day = None
+        self._starts, self._ends, self._before = [], [], []
+
+    @classmethod
+    def from_config(cls, config):
+        time_zone, working_hours, holidays = config
+        return cls(time_zone, working_hours, holidays)
+
+    # ------------------------------------------------------------------
+    # Gün / aralık tanımları
+    # ------------------------------------------------------------------
+
+    def is_holiday(self, day):
+        return day in self.holidays or (day.month, day.day) in self.recurring_holidays
+
+    def is_working_day(self, day):
+        return bool(self.working_hours.get(day.weekday())) and not self.is_holiday(day)
+
+    def _day_intervals(self, day):
+        """Günün çalışma aralıkları (UTC epoch saniyesi)"""
+        if not self.is_working_day(day):
+            return []
+        intervals = []
+        for start, end in self.working_hours[day.weekday()]:
+            if start < end:
+                intervals.append((
+                    int(datetime.combine(day, start, self.tz).timestamp()),
+                    int(datetime.combine(day, end, self.tz).timestamp()),
+                ))
+        return intervals
+
+    # ------------------------------------------------------------------
+    # İndeks
+    # ------------------------------------------------------------------
+
+    def _local_day(self, timestamp):
+        return datetime.fromtimestamp(timestamp, self.tz).date()
+
+    def _rebuild(self, first_day, last_day):
+        starts, ends, before = [], [], []
+        total = 0
+        day = first_day
+        while day <= last_day:
+            for start, end in self._day_intervals(day):
+                starts.append(start)
+                ends.append(end)
+                before.append(total)
+                total += end - start
+            day += timedelta(days=1)
+        self._first_day, self._last_day = first_day, last_day
+        self._starts, self._ends, self._before = starts, ends, before
+
+    def _ensure(self, timestamp, seconds_after=0):
+        """İndeks `timestamp` gününü ve sonrasında `seconds_after` çalışma saniyesini kapsasın"""
+        day = self._local_day(timestamp)
+        first, last = self._first_day, self._last_day
+        if first is None:
+            first, last = day, day + timedelta(days=INDEX_CHUNK_DAYS)
+        first = min(first, day)
+        last = max(last, day + timedelta(days=1))
+        if (first, last) != (self._first_day, self._last_day):
+            self._rebuild(first, last)
+
+        while self._total_until(timestamp) + seconds_after > self._total():
+            self._rebuild(self._first_day, self._last_day + timedelta(days=INDEX_CHUNK_DAYS))
+
+    def _total(self):
+        return self._before[-1] + self._ends[-1] - self._starts[-1] if self._starts else 0
+
+    def _total_until(self, timestamp):
+        """İndeks başından `timestamp` anına kadar birikmiş çalışma saniyesi"""
+        i = bisect_right(self._starts, timestamp) - 1
+        if i < 0:
+            return 0
+        return self._before[i] + min(timestamp, self._ends[i]) - self._starts[i]
+
+    # ------------------------------------------------------------------
+    # Hesaplama
+    # ------------------------------------------------------------------
+
+    def add_hours(self, start, hours):
+        """`start` anından itibaren `hours` mesai saati sonrası (UTC, aware datetime)"""
+        timestamp = int(start.timestamp())
+        seconds = int(round(hours * 3600))
+        with self._lock:
+            self._ensure(timestamp, seconds)
+            target = self._total_until(timestamp) + seconds
+            # before[k] >= hedef olan ilk k; hedef bir önceki aralığın içinde (ya da sonunda)
+            i = max(bisect_left(self._before, target) - 1, 0)
+            result = self._starts[i] + target - self._before[i]
+        return datetime.fromtimestamp(result, dt_timezone.utc)
+
+    def working_hours_between(self, start, end):
+        """[start, end) arasındaki mesai süresi (saat)"""
+        if end <= start:
+            return 0.0
+        start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+        with self._lock:
+            self._ensure(start_ts)
+            self._ensure(end_ts)
+            return (self._total_until(end_ts) - self._total_until(start_ts)) / 3600
+
+    def is_working_time(self, value):
+        timestamp = int(value.timestamp())
+        with self._lock:
+            self._ensure(timestamp)
+            i = bisect_right(self._starts, timestamp) - 1
+            return i >= 0 and timestamp < self._ends[i]
+
+def get_calendar():
+    """Ayarlardaki takvim (yapılandırma başına process içinde bir kez oluşturulur)"""
+    config = calendar_config()
+    calendar = _calendars.get(config)
+    if calendar is None:
+        with _calendars_lock:
+            calendar = _calendars.get(config)
+            if calendar is None:
+                calendar = _calendars[config] = BusinessCalendar.from_config(config)
+    return calendar
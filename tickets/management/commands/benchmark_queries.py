@@ -0,0 +1,72 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.benchmark import run_query_benchmark
+from tickets.models import Talep
+from tickets.synthetic import generate_dataset
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'View sorgularının planlarını (EXPLAIN) ve sürelerini raporla, isteğe bağlı olarak büyük veri seti üret'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed-tickets', type=int, default=0,
+                            help='Ölçümden önce bu kadar sentetik talep üret (0: üretme)')
+        parser.add_argument('--seed-logs', type=int, default=50000,
+                            help='--seed-tickets ile birlikte üretilecek SystemLog sayısı '
+                                 '(ayrıntılı üretim için: generate_synthetic_data)')
+        parser.add_argument('--repeat', type=int, default=3, help='Her view/sorgu için tekrar sayısı')
+        parser.add_argument('--no-explain', action='store_true', help='Sorgu planlarını atla')
+        parser.add_argument('--full-plans', action='store_true', help='Planların tamamını yazdır')
+        parser.add_argument('--slow-ms', type=float, default=50.0, help='Bu süreden yavaş sorguları vurgula')
+
+    def handle(self, *args, **options):
+        if options['seed_tickets']:
+            counts = generate_dataset(
+                tickets=options['seed_tickets'],
+                logs=options['seed_logs'],
+                progress=lambda message: self.stdout.write(f'  {message}'),
+            )
+            self.stdout.write(self.style.SUCCESS(
+                'Üretildi: ' + ', '.join(f'{name}={count}' for name, count in counts.items())
+            ))
+
+        users_by_role = {}
+        for role in ('admin', 'support', 'customer'):
+            # Müşteri olarak grubu olan bir kullanıcı seçilir (görünürlük sorgusu ölçülsün)
+            candidates = User.objects.filter(role=role, is_active=True)
+            if role == 'customer':
+                candidates = candidates.filter(groups__isnull=False).distinct() or candidates
+            user = candidates.first()
+            if user:
+                users_by_role[role] = user
+
+        ticket = Talep.objects.order_by('-created_at').first()
+        if not users_by_role or ticket is None:
+            raise CommandError('Ölçüm için en az bir kullanıcı ve bir talep gerekli (--seed-tickets).')
+
+        self.stdout.write(f'Talep sayısı: {Talep.objects.count()}')
+        results = run_query_benchmark(
+            users_by_role, ticket,
+            repeat=options['repeat'],
+            explain=not options['no_explain'],
+        )
+
+        for result in results:
+            self.stdout.write('')
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{result['label']} [{result['role']}] HTTP {result['status_code']} | "
+                f"{result['view_ms']:.1f} ms | {len(result['queries'])} sorgu"
+            ))
+            for i, query in enumerate(result['queries'], start=1):
+                line = f"  {i:>2}. {query['ms']:8.2f} ms  {query['sql'][:110]}"
+                if query['ms'] >= options['slow_ms']:
+                    self.stdout.write(self.style.WARNING(line))
+                else:
+                    self.stdout.write(line)
+
+                plan = query['plan'] if options['full_plans'] else query['plan'][:4]
+                for plan_line in plan:
+                    self.stdout.write(f'        {plan_line}')
@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.benchmark import VIEW_BENCHMARKS, run_view_benchmark
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'View\'ları test client ile tekrar tekrar çağırıp gecikme yüzdeliklerini ve sorgu sayılarını raporla'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Senaryo başına ölçülen istek sayısı')
+        parser.add_argument('--warmup', type=int, default=2, help='Ölçüme dahil edilmeyen ısınma istekleri')
+        parser.add_argument('--view', action='append', dest='views',
+                            help='Yalnızca bu view(lar)ı ölç (ör. --view ticket_list)')
+        parser.add_argument('--read-only', action='store_true',
+                            help='Veriyi değiştiren AJAX (POST) senaryolarını atla')
+
+    def handle(self, *args, **options):
+        users_by_role = {}
+        for role in ('admin', 'support', 'customer'):
+            candidates = User.objects.filter(role=role, is_active=True)
+            if role == 'customer':
+                candidates = candidates.filter(groups__isnull=False).distinct() or candidates
+            user = candidates.first()
+            if user:
+                users_by_role[role] = user
+        if not users_by_role:
+            raise CommandError('Ölçüm için kullanıcı bulunamadı (generate_synthetic_data).')
+
+        cases = [
+            case for case in VIEW_BENCHMARKS
+            if (not options['views'] or case[0] in options['views'])
+            and not (options['read_only'] and case[3] == 'POST')
+        ]
+        results = run_view_benchmark(
+            users_by_role,
+            iterations=max(1, options['iterations']),
+            warmup=max(0, options['warmup']),
+            cases=cases,
+        )
+
+        header = (
+            f"{'view':<26} {'rol':<9} {'istek':>5} {'hata':>4} "
+            f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'ort ms':>8} {'max ms':>8} {'sorgu':>9}"
+        )
+        self.stdout.write(self.style.MIGRATE_HEADING(header))
+        for result in results:
+            line = (
+                f"{result['label']:<26} {result['role']:<9} {result['requests']:>5} {result['errors']:>4} "
+                f"{result['p50_ms']:>8.1f} {result['p90_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+                f"{result['mean_ms']:>8.1f} {result['max_ms']:>8.1f} "
+                f"{result['queries_p50']:>4}/{result['queries_max']:<4}"
+            )
+            self.stdout.write(self.style.ERROR(line) if result['errors'] else line)
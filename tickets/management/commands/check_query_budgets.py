@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.models import Talep
+from tickets.query_budget import check_view_budgets
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Ticket view\'larının sorgu sayısını bütçelere göre kontrol et (N+1 regresyonu)'
+
+    def handle(self, *args, **options):
+        users_by_role = {}
+        for role in ('admin', 'support', 'customer'):
+            user = User.objects.filter(role=role, is_active=True).first()
+            if user:
+                users_by_role[role] = user
+
+        ticket = Talep.objects.order_by('-created_at').first()
+        if not users_by_role or ticket is None:
+            raise CommandError('Kontrol için en az bir kullanıcı ve bir talep gerekli.')
+
+        failures = 0
+        for result in check_view_budgets(users_by_role, ticket):
+            line = (
+                f"{result['view']:<16} | {result['role']:<9} | "
+                f"{result['queries']:>3}/{result['limit']:<3} sorgu | HTTP {result['status_code']}"
+            )
+            if result['ok']:
+                self.stdout.write(self.style.SUCCESS(line))
+            else:
+                failures += 1
+                self.stdout.write(self.style.ERROR(line))
+                if result['error'] and options['verbosity'] > 1:
+                    self.stdout.write(result['error'])
+
+        if failures:
+            raise CommandError(f'{failures} view sorgu bütçesini aştı.')
+        self.stdout.write(self.style.SUCCESS('Tüm view\'lar sorgu bütçesi içinde.'))
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import SystemLog
+from tickets.models import OPEN_STATUSES, Talep
+from tickets.sla import breached, breaching_within, mark_breaches, recompute_deadlines
+
+
+class Command(BaseCommand):
+    help = ('SLA ihlallerini kontrol et: süresi dolan talepleri kısmi indekslerden bul ve işaretle, '
+            'yakında ihlal edecekleri raporla (cron ile periyodik çalıştırılır)')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--warn-hours',
+            type=int,
+            default=getattr(settings, 'SLA_WARNING_HOURS', 4),
+            help='Önümüzdeki N saat içinde süresi dolacak talepleri raporla',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='İşaretleme yapmadan yalnızca raporla')
+        parser.add_argument(
+            '--recompute',
+            action='store_true',
+            help='Önce tüm açık taleplerin son tarihlerini yeniden hesapla (SLA/takvim değişikliği sonrası)',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+
+        if options['recompute'] and not options['dry_run']:
+            updated = recompute_deadlines(Talep.objects.filter(status__in=OPEN_STATUSES, sla__isnull=False))
+            self.stdout.write(f'{updated} talebin son tarihleri yeniden hesaplandı.')
+
+        found = mark_breaches(now=now, dry_run=options['dry_run'])
+        new_ids = sorted(set(found['response']) | set(found['resolve']))
+        verb = 'bulundu' if options['dry_run'] else 'işaretlendi'
+        self.stdout.write(
+            f'Yeni ihlal: {len(new_ids)} talep {verb} '
+            f'(yanıt: {len(found["response"])}, çözüm: {len(found["resolve"])})'
+        )
+
+        if new_ids and not options['dry_run']:
+            SystemLog.log(
+                level='WARNING',
+                action='SLA_BREACH',
+                message=f'{len(new_ids)} talep SLA süresini aştı '
+                        f'(yanıt: {len(found["response"])}, çözüm: {len(found["resolve"])}): '
+                        f'{", ".join(map(str, new_ids[:50]))}'
+                        + (' ...' if len(new_ids) > 50 else ''),
+            )
+
+        soon = breaching_within(options['warn_hours'], now=now).count()
+        total = breached(now=now).count()
+        self.stdout.write(f'Önümüzdeki {options["warn_hours"]} saatte süresi dolacak: {soon} talep')
+        self.stdout.write(self.style.SUCCESS(f'Süresi dolmuş açık talep: {total}'))
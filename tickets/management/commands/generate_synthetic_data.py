@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.synthetic import generate_dataset
+
+
+class Command(BaseCommand):
+    help = 'Performans ölçümleri için sentetik kullanıcı, grup, kategori, SLA, talep, yorum, token ve log üret'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tickets', type=int, default=100000, help='Talep sayısı')
+        parser.add_argument('--customers', type=int, default=500, help='Müşteri sayısı')
+        parser.add_argument('--support', type=int, default=20, help='Destek personeli sayısı')
+        parser.add_argument('--admins', type=int, default=2, help='Admin sayısı')
+        parser.add_argument('--groups', type=int, default=25, help='Müşteri grubu sayısı')
+        parser.add_argument('--categories', type=int, default=8, help='Kategori sayısı')
+        parser.add_argument('--comments-per-ticket', type=int, default=2, help='Talep başına ortalama yorum')
+        parser.add_argument('--tokens-per-user', type=int, default=1, help='Kullanıcı başına token')
+        parser.add_argument('--logs', type=int, default=50000, help='SystemLog kaydı sayısı')
+        parser.add_argument('--days', type=int, default=365, help='Taleplerin yayılacağı gün sayısı')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create parti boyutu')
+        parser.add_argument('--seed', type=int, default=42, help='Rastgele sayı üreteci tohumu')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        counts = generate_dataset(
+            tickets=options['tickets'],
+            customers=options['customers'],
+            support=options['support'],
+            admins=options['admins'],
+            groups=options['groups'],
+            categories=options['categories'],
+            comments_per_ticket=options['comments_per_ticket'],
+            tokens_per_user=options['tokens_per_user'],
+            logs=options['logs'],
+            days=options['days'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            progress=lambda message: self.stdout.write(f'  {message}'),
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            'Üretildi: ' + ', '.join(f'{name}={count}' for name, count in counts.items())
+            + f' ({elapsed:.1f} sn)'
+        ))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from datetime import timedelta
+
+from tickets.rollups import reconcile_daily_stats
+
+
+class Command(BaseCommand):
+    help = 'Günlük ticket istatistiklerini (TicketDailyStats) doldur veya uzlaştır'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Sadece son N günü uzlaştır (verilmezse tüm tablo yeniden oluşturulur)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Değişiklik yapmadan sadece farkları raporla',
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        start = None
+        if days:
+            start = timezone.localdate() - timedelta(days=days - 1)
+
+        mismatches = reconcile_daily_stats(start=start, dry_run=options['check'])
+
+        scope = f'son {days} gün' if days else 'tüm tablo'
+        if not mismatches:
+            self.stdout.write(
+                self.style.SUCCESS(f'Günlük istatistikler güncel ({scope}).')
+            )
+        elif options['check']:
+            self.stdout.write(
+                self.style.WARNING(f'{mismatches} satır farklı ({scope}), düzeltme yapılmadı.')
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f'{mismatches} satır düzeltildi ({scope}).')
+            )
@@ -0,0 +1,100 @@
+# tickets/metrics.py
+"""
+Yardım Masası Ticket Metrikleri
+===============================
+
+Çözüm süresi gibi performans metriklerini veritabanı tarafında hesaplar.
+Satırlar Python'a yüklenmez:
+- Ortalama: Avg(updated_at - created_at)
+- Yüzdelikler: PostgreSQL'de PERCENTILE_CONT, diğer veritabanlarında
+  sıralı sorgu üzerinde tek satırlık OFFSET okuması
+"""
+
+from datetime import timedelta
+
+from django.db import connections
+from django.db.models import Aggregate, Avg, Count, DurationField, ExpressionWrapper, F
+
+from .models import Talep
+
+# Raporlanan yüzdelikler
+RESOLUTION_PERCENTILES = (50, 90, 99)
+
+RESOLUTION_TIME = ExpressionWrapper(F('updated_at') - F('created_at'), output_field=DurationField())
+
+# ================================================================================
+# Aggregate Tanımları
+# ================================================================================
+
+class PercentileCont(Aggregate):
+    """PostgreSQL PERCENTILE_CONT(p) WITHIN GROUP (ORDER BY expr) aggregate'i"""
+
+    function = 'PERCENTILE_CONT'
+    name = 'PercentileCont'
+    template = '%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+
+    def __init__(self, expression, percentile, **extra):
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+# ================================================================================
+# Çözüm Süresi
+# ================================================================================
+
+def closed_tickets_queryset():
+    """Çözüm süresi hesabında kullanılan kapatılmış ticket'lar"""
+    return Talep.objects.filter(status='closed', updated_at__isnull=False)
+
+def _percentiles_postgresql(queryset):
+    """Tüm yüzdelikleri tek sorguda PERCENTILE_CONT ile hesapla"""
+    aggregates = {
+        f'p{p}': PercentileCont(RESOLUTION_TIME, p / 100, output_field=DurationField())
+        for p in RESOLUTION_PERCENTILES
+    }
+    return queryset.aggregate(**aggregates)
+
+def _percentiles_generic(queryset, count):
+    """Her yüzdelik için sıralı sorgudan tek satır oku (nearest-rank)"""
+    ordered = (
+        queryset.annotate(resolution_time=RESOLUTION_TIME)
+        .order_by('resolution_time')
+        .values_list('resolution_time', flat=True)
+    )
+    result = {}
+    for p in RESOLUTION_PERCENTILES:
+        index = min(count - 1, max(0, -(-p * count // 100) - 1))
+        result[f'p{p}'] = ordered[index]
+    return result
+
+def _to_days(value):
+    """timedelta (veya mikrosaniye) değerini gün cinsine çevir"""
+    if value is None:
+        return 0
+    if not isinstance(value, timedelta):
+        value = timedelta(microseconds=value)
+    return value.total_seconds() / 86400
+
+def resolution_time_stats(queryset=None):
+    """
+    Kapatılmış ticket'ların çözüm süresi istatistikleri (gün cinsinden).
+    Dönüş: {'count', 'avg_days', 'p50_days', 'p90_days', 'p99_days'}
+    """
+    if queryset is None:
+        queryset = closed_tickets_queryset()
+
+    summary = queryset.aggregate(count=Count('id'), average=Avg(RESOLUTION_TIME))
+    count = summary['count']
+
+    stats = {'count': count, 'avg_days': round(_to_days(summary['average']), 2)}
+
+    if count:
+        if connections[queryset.db].vendor == 'postgresql':
+            percentiles = _percentiles_postgresql(queryset)
+        else:
+            percentiles = _percentiles_generic(queryset, count)
+    else:
+        percentiles = {}
+
+    for p in RESOLUTION_PERCENTILES:
+        stats[f'p{p}_days'] = round(_to_days(percentiles.get(f'p{p}')), 2)
+
+    return stats
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_category_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Tarih')),
+                ('status', models.CharField(choices=[('new', 'Yeni'), ('seen', 'Görüldü'), ('open', 'Açık'), ('pending', 'Beklemeye Alındı'), ('in_progress', 'İşlemde'), ('resolved', 'Çözüldü'), ('closed', 'Kapatıldı'), ('wrong_section', 'Yanlış Bölüm')], max_length=20, verbose_name='Durum')),
+                ('priority', models.CharField(choices=[('low', 'Düşük'), ('normal', 'Normal'), ('high', 'Yüksek'), ('urgent', 'Acil')], max_length=20, verbose_name='Öncelik')),
+                ('created_count', models.IntegerField(default=0, verbose_name='Açılan Talep')),
+                ('closed_count', models.IntegerField(default=0, verbose_name='Kapatılan Talep')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_stats', to='tickets.category', verbose_name='Kategori')),
+            ],
+            options={
+                'verbose_name': 'Günlük Talep İstatistiği',
+                'verbose_name_plural': 'Günlük Talep İstatistikleri',
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('date', 'status', 'priority', 'category'), name='tickets_dailystats_unique_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:25
+
+from django.db import migrations, models
+from django.db.models import Max
+
+SEQUENCE_NAME = 'tickets_talep_numarasi_seq'
+
+
+def init_ticket_number_source(apps, schema_editor):
+    """Sequence'i (PostgreSQL) veya sayaç satırını mevcut en büyük numaradan başlat"""
+    Talep = apps.get_model('tickets', 'Talep')
+    TicketNumberCounter = apps.get_model('tickets', 'TicketNumberCounter')
+    db_alias = schema_editor.connection.alias
+    current = Talep.objects.using(db_alias).aggregate(m=Max('talep_numarasi'))['m'] or 0
+
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'CREATE SEQUENCE IF NOT EXISTS {SEQUENCE_NAME}')
+        schema_editor.execute(
+            'SELECT setval(%s, %s, %s)',
+            params=[SEQUENCE_NAME, max(current, 1), current > 0],
+        )
+    else:
+        TicketNumberCounter.objects.using(db_alias).update_or_create(
+            name='talep_numarasi', defaults={'value': current}
+        )
+
+
+def drop_ticket_number_source(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP SEQUENCE IF EXISTS {SEQUENCE_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_ticketdailystats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketNumberCounter',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='Sayaç Adı')),
+                ('value', models.BigIntegerField(default=0, verbose_name='Son Değer')),
+            ],
+            options={
+                'verbose_name': 'Talep Numarası Sayacı',
+                'verbose_name_plural': 'Talep Numarası Sayaçları',
+            },
+        ),
+        migrations.RunPython(init_ticket_number_source, drop_ticket_number_source),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:31
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_ticket_visibility(apps, schema_editor):
+    """Mevcut kullanıcılar için kendisi + grup arkadaşları eşlemesini oluştur"""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    TicketVisibility = apps.get_model('tickets', 'TicketVisibility')
+    db_alias = schema_editor.connection.alias
+
+    pairs = {(pk, pk) for pk in User.objects.using(db_alias).values_list('pk', flat=True)}
+
+    members_by_group = defaultdict(set)
+    for group_id, user_id in User.groups.through.objects.using(db_alias).values_list('group_id', 'customuser_id'):
+        members_by_group[group_id].add(user_id)
+    for members in members_by_group.values():
+        pairs.update((viewer, owner) for viewer in members for owner in members)
+
+    TicketVisibility.objects.using(db_alias).bulk_create(
+        [TicketVisibility(viewer_id=viewer, owner_id=owner) for viewer, owner in pairs],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_ticketnumbercounter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketVisibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Talep Sahibi')),
+                ('viewer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_visibility', to=settings.AUTH_USER_MODEL, verbose_name='Görüntüleyen')),
+            ],
+            options={
+                'verbose_name': 'Talep Görünürlüğü',
+                'verbose_name_plural': 'Talep Görünürlükleri',
+                'constraints': [models.UniqueConstraint(fields=('viewer', 'owner'), name='tickets_visibility_unique_pair')],
+            },
+        ),
+        migrations.RunPython(backfill_ticket_visibility, migrations.RunPython.noop),
+    ]
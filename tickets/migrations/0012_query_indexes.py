@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0011_ticketvisibility'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Önce bileşik indeksler, sonra kapsanan tekil FK indeksleri kaldırılır
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['talep', 'created_at'], name='comment_talep_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(fields=['created_at', 'id'], name='talep_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(fields=['status', 'created_at'], name='talep_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(fields=['assigned_to', 'status'], name='talep_assigned_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(fields=['user', 'created_at'], name='talep_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(condition=models.Q(('status__in', ('new', 'seen', 'open', 'pending', 'in_progress'))), fields=['created_at'], name='talep_open_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(condition=models.Q(('status', 'closed')), fields=['updated_at'], name='talep_closed_updated_idx'),
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='talep',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Yorumun ait olduğu ticket', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='yorumlar', to='tickets.talep', verbose_name='Talep'),
+        ),
+        migrations.AlterField(
+            model_name='talep',
+            name='assigned_to',
+            field=models.ForeignKey(blank=True, db_index=False, help_text="Ticket'ı çözecek olan kullanıcı", null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='atanan_talepler', to=settings.AUTH_USER_MODEL, verbose_name='Atanan Kullanıcı'),
+        ),
+        migrations.AlterField(
+            model_name='talep',
+            name='user',
+            field=models.ForeignKey(db_index=False, help_text="Ticket'ı oluşturan kullanıcı", on_delete=django.db.models.deletion.CASCADE, related_name='talepler', to=settings.AUTH_USER_MODEL, verbose_name='Oluşturan Kullanıcı'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:54
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+# Mevcut talepler için geçmiş tek seferde, küme tabanlı INSERT ... SELECT ile
+# doldurulur: oluşturma olayı (talep sahibi, created_at) ve 'new' dışındaki
+# taleplerin mevcut durumuna geçiş (değiştiren bilinmiyor, updated_at)
+BACKFILL_SQL = [
+    """
+    INSERT INTO tickets_ticketstatusevent (talep_id, from_status, to_status, actor_id, created_at)
+    SELECT id, '', 'new', user_id, created_at FROM tickets_talep
+    """,
+    """
+    INSERT INTO tickets_ticketstatusevent (talep_id, from_status, to_status, actor_id, created_at)
+    SELECT id, 'new', status, NULL, updated_at FROM tickets_talep WHERE status <> 'new'
+    """,
+]
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0012_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('new', 'Yeni'), ('seen', 'Görüldü'), ('open', 'Açık'), ('pending', 'Beklemeye Alındı'), ('in_progress', 'İşlemde'), ('resolved', 'Çözüldü'), ('closed', 'Kapatıldı'), ('wrong_section', 'Yanlış Bölüm')], default='', max_length=20, verbose_name='Önceki Durum')),
+                ('to_status', models.CharField(choices=[('new', 'Yeni'), ('seen', 'Görüldü'), ('open', 'Açık'), ('pending', 'Beklemeye Alındı'), ('in_progress', 'İşlemde'), ('resolved', 'Çözüldü'), ('closed', 'Kapatıldı'), ('wrong_section', 'Yanlış Bölüm')], max_length=20, verbose_name='Yeni Durum')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Değişiklik Zamanı')),
+                ('actor', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Değiştiren Kullanıcı')),
+                ('talep', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='tickets.talep', verbose_name='Talep')),
+            ],
+            options={
+                'verbose_name': 'Talep Durum Değişikliği',
+                'verbose_name_plural': 'Talep Durum Değişiklikleri',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['talep', 'created_at'], name='status_event_talep_created_idx'), models.Index(fields=['to_status', 'created_at'], name='status_event_to_created_idx')],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
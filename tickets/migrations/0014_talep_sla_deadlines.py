@@ -0,0 +1,62 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:56
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_sla_deadlines(apps, schema_editor):
+    """SLA'sı olan mevcut taleplerin yanıt/çözüm son tarihlerini doldur"""
+    SLA = apps.get_model('tickets', 'SLA')
+    Talep = apps.get_model('tickets', 'Talep')
+    db_alias = schema_editor.connection.alias
+
+    hours = {sla.pk: (sla.response_time, sla.resolve_time) for sla in SLA.objects.using(db_alias)}
+    tickets = Talep.objects.using(db_alias).filter(sla__isnull=False).only('pk', 'sla_id', 'created_at')
+    batch = []
+    for ticket in tickets.order_by('pk').iterator(chunk_size=1000):
+        response_hours, resolve_hours = hours[ticket.sla_id]
+        ticket.response_due_at = ticket.created_at + timedelta(hours=response_hours)
+        ticket.resolve_due_at = ticket.created_at + timedelta(hours=resolve_hours)
+        batch.append(ticket)
+        if len(batch) >= 1000:
+            Talep.objects.using(db_alias).bulk_update(batch, ['response_due_at', 'resolve_due_at'])
+            batch = []
+    if batch:
+        Talep.objects.using(db_alias).bulk_update(batch, ['response_due_at', 'resolve_due_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0013_ticketstatusevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='talep',
+            name='resolve_due_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Çözüm Son Tarihi'),
+        ),
+        migrations.AddField(
+            model_name='talep',
+            name='response_due_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Yanıt Son Tarihi'),
+        ),
+        migrations.AddField(
+            model_name='talep',
+            name='sla_breached_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='check_sla komutunun ihlali ilk tespit ettiği an', null=True, verbose_name='SLA İhlal Zamanı'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(condition=models.Q(('status__in', ('new', 'seen'))), fields=['response_due_at'], name='talep_response_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='talep',
+            index=models.Index(condition=models.Q(('status__in', ('new', 'seen', 'open', 'pending', 'in_progress'))), fields=['resolve_due_at'], name='talep_resolve_due_idx'),
+        ),
+        migrations.RunPython(backfill_sla_deadlines, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_membership_group_index'),
+        ('tickets', '0014_talep_sla_deadlines'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='TicketVisibility',
+        ),
+    ]
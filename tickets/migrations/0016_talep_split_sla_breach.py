@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:05
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def split_sla_breach(apps, schema_editor):
+    """Tek ihlal işaretini, işaretlendiği anda süresi dolmuş son tarih(ler)e dağıt"""
+    Talep = apps.get_model('tickets', 'Talep')
+    breached = Talep.objects.using(schema_editor.connection.alias).filter(sla_breached_at__isnull=False)
+    breached.filter(response_due_at__lt=F('sla_breached_at')).update(response_breached_at=F('sla_breached_at'))
+    breached.filter(resolve_due_at__lt=F('sla_breached_at')).update(resolve_breached_at=F('sla_breached_at'))
+
+
+def merge_sla_breach(apps, schema_editor):
+    Talep = apps.get_model('tickets', 'Talep')
+    tickets = Talep.objects.using(schema_editor.connection.alias)
+    tickets.filter(response_breached_at__isnull=False).update(sla_breached_at=F('response_breached_at'))
+    tickets.filter(sla_breached_at__isnull=True, resolve_breached_at__isnull=False).update(
+        sla_breached_at=F('resolve_breached_at')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0015_delete_ticketvisibility'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='talep',
+            name='resolve_breached_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='check_sla komutunun çözüm süresi ihlalini ilk tespit ettiği an', null=True, verbose_name='Çözüm SLA İhlal Zamanı'),
+        ),
+        migrations.AddField(
+            model_name='talep',
+            name='response_breached_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='check_sla komutunun yanıt süresi ihlalini ilk tespit ettiği an', null=True, verbose_name='Yanıt SLA İhlal Zamanı'),
+        ),
+        migrations.RunPython(split_sla_breach, merge_sla_breach),
+        migrations.RemoveField(
+            model_name='talep',
+            name='sla_breached_at',
+        ),
+    ]
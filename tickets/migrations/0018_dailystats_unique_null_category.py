@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:17
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_null_category_duplicates(apps, schema_editor):
+    """Kısıt eklenmeden önce aynı kategorisiz kovadaki satırları tek satırda topla"""
+    TicketDailyStats = apps.get_model('tickets', 'TicketDailyStats')
+    rows = TicketDailyStats.objects.using(schema_editor.connection.alias).filter(category__isnull=True)
+    duplicates = (
+        rows.values('date', 'status', 'priority')
+        .annotate(rows=Count('id'), keep=Min('id'), created=Sum('created_count'), closed=Sum('closed_count'))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for bucket in duplicates:
+        same = rows.filter(date=bucket['date'], status=bucket['status'], priority=bucket['priority'])
+        same.filter(pk=bucket['keep']).update(created_count=bucket['created'], closed_count=bucket['closed'])
+        same.exclude(pk=bucket['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0017_ticketstatusevent_actor_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_null_category_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ticketdailystats',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', True)), fields=('date', 'status', 'priority'), name='tickets_dailystats_unique_null_category'),
+        ),
+    ]
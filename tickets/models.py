@@ -8,11 +8,15 @@ Bu modül ticket sisteminin temel veri modellerini içerir:
 - SLA: Servis düzeyi anlaşmaları ve yanıt süreleri
 - Talep: Ana ticket modeli - talepler ve durumları
 - Comment: Ticket yorumları ve mesajlaşma sistemi
+- TicketStatusEvent: Durum değişikliği geçmişi (süre ve çözüm metrikleri için)
+- TicketDailyStats: Günlük ticket istatistikleri (rapor rollup tablosu)
+- TicketNumberCounter: Talep numarası sayacı (sequence olmayan veritabanları için)
 """
 
 # Django temel importları
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 # Aktif kullanıcı modelini al (CustomUser)
 User = get_user_model()
@@ -74,6 +78,13 @@ class SLA(models.Model):
         help_text="Sorunu çözmek için verilen maksimum süre (saat cinsinden)"
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Yüklenen süreleri sakla (değişirse açık taleplerin son tarihleri yeniden hesaplanır)"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_hours = (instance.__dict__.get('response_time'), instance.__dict__.get('resolve_time'))
+        return instance
+
     def __str__(self):
         return f"{self.name} (Yanıt: {self.response_time}sa, Çözüm: {self.resolve_time}sa)"
 
@@ -86,6 +97,24 @@ class SLA(models.Model):
 # Talep (Ticket) Modeli
 # ================================================================================
 
+# Henüz çözülmemiş (aktif) talep durumları
+OPEN_STATUSES = ('new', 'seen', 'open', 'pending', 'in_progress')
+
+# Henüz ilk yanıtı verilmemiş talep durumları (SLA yanıt süresi bu durumlarda işler)
+RESPONSE_PENDING_STATUSES = ('new', 'seen')
+
+# İzin verilen durum geçişleri (admin durum butonları ve toplu durum değiştirme)
+STATUS_TRANSITIONS = {
+    'new': ['seen', 'open', 'wrong_section'],
+    'seen': ['open', 'pending', 'wrong_section'],
+    'open': ['in_progress', 'pending', 'resolved'],
+    'pending': ['open', 'in_progress'],
+    'in_progress': ['resolved', 'pending'],
+    'resolved': ['closed', 'open'],
+    'closed': ['open'],
+    'wrong_section': ['new', 'open']
+}
+
 class Talep(models.Model):
     """
     Ana ticket modeli - kullanıcı taleplerini ve durumlarını yönetir
@@ -162,6 +191,7 @@ class Talep(models.Model):
         User, 
         on_delete=models.CASCADE, 
         related_name="talepler", 
+        db_index=False,  # talep_user_created_idx kapsıyor
         verbose_name="Oluşturan Kullanıcı",
         help_text="Ticket'ı oluşturan kullanıcı"
     )
@@ -171,6 +201,7 @@ class Talep(models.Model):
         null=True, 
         blank=True, 
         related_name="atanan_talepler", 
+        db_index=False,  # talep_assigned_status_idx kapsıyor
         verbose_name="Atanan Kullanıcı",
         help_text="Ticket'ı çözecek olan kullanıcı"
     )
@@ -185,6 +216,34 @@ class Talep(models.Model):
         verbose_name="Güncellenme Tarihi"
     )
     
+    # SLA son tarihleri (tickets.sla tarafından hesaplanır)
+    response_due_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Yanıt Son Tarihi"
+    )
+    resolve_due_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Çözüm Son Tarihi"
+    )
+    response_breached_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Yanıt SLA İhlal Zamanı",
+        help_text="check_sla komutunun yanıt süresi ihlalini ilk tespit ettiği an"
+    )
+    resolve_breached_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Çözüm SLA İhlal Zamanı",
+        help_text="check_sla komutunun çözüm süresi ihlalini ilk tespit ettiği an"
+    )
+    
     # Benzersiz ticket numarası
     talep_numarasi = models.PositiveIntegerField(
         unique=True, 
@@ -194,18 +253,63 @@ class Talep(models.Model):
         help_text="Sistem tarafından otomatik atanan benzersiz numara"
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Veritabanından yüklenen ticket'ın rollup anlık görüntüsünü sakla
+        (save sırasında eski/yeni katkı farkı hesaplanabilsin diye)
+        """
+        from .rollups import ticket_snapshot
+
+        instance = super().from_db(db, field_names, values)
+        instance._rollup_snapshot = ticket_snapshot(instance)
+        # SLA değişikliğinde son tarihler yeniden hesaplanır
+        instance._loaded_sla_id = instance.__dict__.get('sla_id')
+        return instance
+
     def save(self, *args, **kwargs):
         """
-        Kaydetme işlemi - otomatik talep numarası ataması
+        Kaydetme işlemi - otomatik talep numarası ataması, günlük istatistik
+        (TicketDailyStats) güncellemesi, durum geçmişi (TicketStatusEvent) ve
+        SLA son tarihleri (oluşturmada ve SLA değiştiğinde).
+        Durumu değiştiren kullanıcı `_status_actor` ile verilebilir
+        (verilmezse oluşturmada talep sahibi, güncellemede boş kalır).
         """
-        # Talep numarasını otomatik oluştur
+        from .rollups import apply_ticket_change, ticket_snapshot
+        from .status_history import record_status_change
+
+        # Talep numarasını sequence'ten al (kilitsiz, çakışmasız)
         if not self.talep_numarasi:
-            last_talep = Talep.objects.order_by('-talep_numarasi').first()
-            if last_talep and last_talep.talep_numarasi:
-                self.talep_numarasi = last_talep.talep_numarasi + 1
-            else:
-                self.talep_numarasi = 1
-        super().save(*args, **kwargs)
+            from .numbering import allocate_ticket_number
+            self.talep_numarasi = allocate_ticket_number(using=kwargs.get('using'))
+
+        is_new = self._state.adding
+
+        # SLA son tarihleri: yeni talepte ya da SLA değiştiğinde (sla_id ertelenmişse dokunulmaz)
+        if 'sla_id' in self.__dict__ and (is_new or self.sla_id != getattr(self, '_loaded_sla_id', self.sla_id)):
+            from .sla import apply_deadlines
+            changed_fields = apply_deadlines(self)
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], *changed_fields}
+        old_snapshot = None if is_new else getattr(self, '_rollup_snapshot', None)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            new_snapshot = ticket_snapshot(self)
+            # Deferred alanlarla yüklenen kayıtlar atlanır, reconcile komutu düzeltir
+            if is_new or old_snapshot is not None:
+                apply_ticket_change(old_snapshot, new_snapshot)
+            old_status = old_snapshot['status'] if old_snapshot else ''
+            if is_new or (old_snapshot is not None and old_status != self.status):
+                actor = getattr(self, '_status_actor', None)
+                record_status_change(
+                    self.pk, old_status, self.status,
+                    actor=actor if actor is not None or not is_new else self.user_id,
+                    at=self.created_at if is_new else self.updated_at,
+                )
+        self._rollup_snapshot = new_snapshot
+        if 'sla_id' in self.__dict__:
+            self._loaded_sla_id = self.sla_id
 
     def __str__(self):
         return f"[{self.talep_numarasi}] {self.title}"
@@ -221,6 +325,39 @@ class Talep(models.Model):
         verbose_name = "Talep"
         verbose_name_plural = "Talepler"
         ordering = ['-created_at']  # En yeni ticket'lar önce
+        indexes = [
+            # Liste sıralaması ve keyset sayfalama: ORDER BY created_at, id
+            models.Index(fields=['created_at', 'id'], name='talep_created_id_idx'),
+            # Durum filtresi + tarih sıralaması / durum sayaçları
+            models.Index(fields=['status', 'created_at'], name='talep_status_created_idx'),
+            # Destek personelinin kendisine atanan talepleri (user FK indeksinin yerine)
+            models.Index(fields=['assigned_to', 'status'], name='talep_assigned_status_idx'),
+            # Müşteri görünürlüğü: user_id IN (...) ORDER BY created_at (user FK indeksinin yerine)
+            models.Index(fields=['user', 'created_at'], name='talep_user_created_idx'),
+            # Yalnızca çözülmemiş talepler - tablonun küçük ve sık okunan kısmı
+            models.Index(
+                fields=['created_at'],
+                name='talep_open_created_idx',
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
+            # SLA ihlal sorguları - yalnızca yanıt bekleyen / çözülmemiş talepler
+            models.Index(
+                fields=['response_due_at'],
+                name='talep_response_due_idx',
+                condition=models.Q(status__in=RESPONSE_PENDING_STATUSES),
+            ),
+            models.Index(
+                fields=['resolve_due_at'],
+                name='talep_resolve_due_idx',
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
+            # Çözüm süresi metrikleri ve kapanış raporları
+            models.Index(
+                fields=['updated_at'],
+                name='talep_closed_updated_idx',
+                condition=models.Q(status='closed'),
+            ),
+        ]
 
 # ================================================================================
 # Yorum (Comment) Modeli
@@ -237,6 +374,7 @@ class Comment(models.Model):
         Talep, 
         on_delete=models.CASCADE, 
         related_name="yorumlar", 
+        db_index=False,  # comment_talep_created_idx kapsıyor
         verbose_name="Talep",
         null=True, 
         blank=True,
@@ -269,4 +407,147 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Yorum"
         verbose_name_plural = "Yorumlar"
-        ordering = ['created_at']  # Eski yorumlar önce
\ No newline at end of file
+        ordering = ['created_at']  # Eski yorumlar önce
+        indexes = [
+            # Ticket detayındaki yorum listesi (talep FK indeksinin yerine)
+            models.Index(fields=['talep', 'created_at'], name='comment_talep_created_idx'),
+        ]
+
+# ================================================================================
+# Durum Geçmişi Modeli
+# ================================================================================
+
+class TicketStatusEvent(models.Model):
+    """
+    Ticket durum değişikliklerinin yapılandırılmış kaydı (kim, ne zaman, hangi
+    durumdan hangi duruma). Oluşturma anı from_status='' ile kaydedilir.
+    Tüm durum değiştirme yolları (save, koşullu UPDATE, toplu işlemler)
+    tickets.status_history üzerinden yazar; süre/ilk yanıt/çözüm metrikleri
+    bu tablodan küme tabanlı sorgularla hesaplanır.
+    """
+
+    talep = models.ForeignKey(
+        Talep,
+        on_delete=models.CASCADE,
+        related_name="status_events",
+        db_index=False,  # status_event_talep_created_idx kapsıyor
+        verbose_name="Talep"
+    )
+    from_status = models.CharField(
+        max_length=20,
+        choices=Talep.STATUS_CHOICES,
+        blank=True,
+        default='',
+        verbose_name="Önceki Durum"
+    )
+    to_status = models.CharField(
+        max_length=20,
+        choices=Talep.STATUS_CHOICES,
+        verbose_name="Yeni Durum"
+    )
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Değiştiren Kullanıcı"
+    )
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Değişiklik Zamanı"
+    )
+
+    def __str__(self):
+        return f"#{self.talep_id}: {self.from_status or '-'} → {self.to_status}"
+
+    class Meta:
+        verbose_name = "Talep Durum Değişikliği"
+        verbose_name_plural = "Talep Durum Değişiklikleri"
+        ordering = ['created_at']
+        indexes = [
+            # Ticket bazında sıralı geçmiş: durumda kalma süresi (bir sonraki olay),
+            # ilk yanıt ve ilk çözüm anı
+            models.Index(fields=['talep', 'created_at'], name='status_event_talep_created_idx'),
+            # Tarih aralığında belirli duruma geçişler (çözülen/kapanan talepler)
+            models.Index(fields=['to_status', 'created_at'], name='status_event_to_created_idx'),
+        ]
+
+# ================================================================================
+# Günlük Ticket İstatistikleri (Rollup) Modeli
+# ================================================================================
+
+class TicketDailyStats(models.Model):
+    """
+    Rapor sayfaları için önceden toplanmış günlük ticket sayaçları.
+    Her satır (tarih, durum, öncelik, kategori) kombinasyonudur:
+    - created_count: O gün açılmış ve şu an bu durumda olan ticket sayısı
+    - closed_count: Son güncellemesi o gün olan kapatılmış ticket sayısı
+    Talep.save ile artımlı güncellenir, rebuild_ticket_stats komutu ile
+    yeniden hesaplanır/uzlaştırılır. Kategori silinirken satırları
+    kategorisiz kovalarla birleştirilir (rollups.merge_category_stats).
+    """
+
+    date = models.DateField(verbose_name="Tarih")
+    status = models.CharField(
+        max_length=20,
+        choices=Talep.STATUS_CHOICES,
+        verbose_name="Durum"
+    )
+    priority = models.CharField(
+        max_length=20,
+        choices=Talep.PRIORITY_CHOICES,
+        verbose_name="Öncelik"
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="daily_stats",
+        verbose_name="Kategori"
+    )
+    created_count = models.IntegerField(default=0, verbose_name="Açılan Talep")
+    closed_count = models.IntegerField(default=0, verbose_name="Kapatılan Talep")
+
+    def __str__(self):
+        return f"{self.date} {self.status}/{self.priority}: +{self.created_count} / -{self.closed_count}"
+
+    class Meta:
+        verbose_name = "Günlük Talep İstatistiği"
+        verbose_name_plural = "Günlük Talep İstatistikleri"
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'status', 'priority', 'category'],
+                name='tickets_dailystats_unique_bucket'
+            ),
+            # NULL değerler yukarıdaki kısıtta birbirinden farklı sayılır;
+            # kategorisiz kova için ayrı kısmi kısıt
+            models.UniqueConstraint(
+                fields=['date', 'status', 'priority'],
+                condition=models.Q(category__isnull=True),
+                name='tickets_dailystats_unique_null_category'
+            ),
+        ]
+
+# ================================================================================
+# Talep Numarası Sayacı
+# ================================================================================
+
+class TicketNumberCounter(models.Model):
+    """
+    PostgreSQL sequence'i olmayan veritabanlarında (SQLite testleri vb.)
+    talep numarası üretmek için kullanılan sayaç tablosu.
+    value: şimdiye kadar dağıtılan en büyük numara
+    """
+
+    name = models.CharField(max_length=50, primary_key=True, verbose_name="Sayaç Adı")
+    value = models.BigIntegerField(default=0, verbose_name="Son Değer")
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+    class Meta:
+        verbose_name = "Talep Numarası Sayacı"
+        verbose_name_plural = "Talep Numarası Sayaçları"
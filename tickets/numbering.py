@@ -0,0 +1,109 @@
+# tickets/numbering.py
+"""
+Yardım Masası - Talep Numarası Dağıtımı
+=======================================
+
+Talep numaraları tablonun en büyük değeri okunarak değil, bir sayaçtan alınır:
+- PostgreSQL: tickets_talep_numarasi_seq sequence'i (nextval kilit tutmaz,
+  transaction'dan bağımsızdır, eşzamanlı worker'lar birbirini beklemez)
+- Diğer veritabanları: TicketNumberCounter tablosunda atomik UPDATE
+
+settings.TICKET_NUMBER_BLOCK_SIZE > 1 ise her process tek seferde bir blok
+numara ayırır ve sonraki talepleri veritabanına gitmeden bu bloktan verir.
+Bu durumda numaralar process'ler arasında oluşturulma sırasını birebir
+izlemeyebilir ve kapanan process'in kullanılmamış numaraları boşluk bırakır.
+"""
+
+import os
+import threading
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F, Max
+
+from .models import Talep, TicketNumberCounter
+
+SEQUENCE_NAME = 'tickets_talep_numarasi_seq'
+COUNTER_NAME = 'talep_numarasi'
+
+# ================================================================================
+# Veritabanı Seviyesi Dağıtım
+# ================================================================================
+
+def _reserve_from_sequence(connection, count):
+    """PostgreSQL sequence'inden tek sorguda `count` numara al"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT nextval(%s) FROM generate_series(1, %s)',
+            [SEQUENCE_NAME, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+def _reserve_from_counter(using, count):
+    """Sayaç tablosunu atomik olarak `count` kadar artır ve ayrılan aralığı döndür"""
+    with transaction.atomic(using=using):
+        counters = TicketNumberCounter.objects.using(using)
+        if not counters.filter(name=COUNTER_NAME).update(value=F('value') + count):
+            # Sayaç ilk kez kullanılıyor: mevcut en büyük numaradan başlat
+            current = Talep.objects.using(using).aggregate(m=Max('talep_numarasi'))['m'] or 0
+            counters.get_or_create(name=COUNTER_NAME, defaults={'value': current})
+            counters.filter(name=COUNTER_NAME).update(value=F('value') + count)
+        last = counters.values_list('value', flat=True).get(name=COUNTER_NAME)
+    return list(range(last - count + 1, last + 1))
+
+def reserve_ticket_numbers(count, using=None):
+    """Veritabanından `count` adet yeni talep numarası ayır"""
+    using = using or router.db_for_write(Talep)
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return _reserve_from_sequence(connection, count)
+    return _reserve_from_counter(using, count)
+
+# ================================================================================
+# Process İçi Blok Havuzu
+# ================================================================================
+
+class TicketNumberAllocator:
+    """
+    Process başına numara havuzu.
+    Havuz boşaldığında veritabanından TICKET_NUMBER_BLOCK_SIZE kadar numara alır.
+    fork sonrası havuz paylaşılmasın diye process id kontrol edilir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools = {}
+        self._pid = os.getpid()
+
+    @property
+    def block_size(self):
+        return max(1, int(getattr(settings, 'TICKET_NUMBER_BLOCK_SIZE', 1)))
+
+    def allocate(self, count=1, using=None):
+        """`count` adet numara döndür (havuzdan, gerekirse yeni blok ayırarak)"""
+        using = using or router.db_for_write(Talep)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pools = {}
+                self._pid = os.getpid()
+
+            pool = self._pools.setdefault(using, [])
+            if len(pool) < count:
+                pool.extend(reserve_ticket_numbers(max(self.block_size, count - len(pool)), using=using))
+            numbers, self._pools[using] = pool[:count], pool[count:]
+        return numbers
+
+    def reset(self):
+        """Havuzdaki kullanılmamış numaraları bırak"""
+        with self._lock:
+            self._pools = {}
+
+allocator = TicketNumberAllocator()
+
+def allocate_ticket_number(using=None):
+    """Yeni bir talep için numara al"""
+    return allocator.allocate(1, using=using)[0]
+
+def allocate_ticket_numbers(count, using=None):
+    """bulk_create gibi toplu oluşturmalar için `count` adet numara al"""
+    return allocator.allocate(count, using=using)
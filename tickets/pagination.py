@@ -0,0 +1,112 @@
+# tickets/pagination.py
+"""
+Yardım Masası Ticket Listesi - Keyset (Cursor) Sayfalama
+========================================================
+
+OFFSET yerine (created_at, id) anahtarı ile sayfalama yapar.
+Her sayfa, önceki sayfanın son kaydından sonrasını indeksli bir
+WHERE koşulu ile okuduğu için geçmişin ne kadar derinine gidilirse
+gidilsin maliyet sabit kalır.
+
+- ?after=<cursor>  : cursor'dan sonraki (daha eski) kayıtlar
+- ?before=<cursor> : cursor'dan önceki (daha yeni) kayıtlar
+"""
+
+import base64
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+# Varsayılan sayfa boyutu ve izin verilen üst sınır
+# (settings.TICKET_LIST_PAGE_SIZE / TICKET_LIST_MAX_PAGE_SIZE ile değiştirilebilir)
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+# ================================================================================
+# Cursor Kodlama
+# ================================================================================
+
+def encode_cursor(obj):
+    """Kaydın (created_at, id) anahtarını URL güvenli cursor'a çevir"""
+    raw = f"{obj.created_at.isoformat()}|{obj.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Cursor'ı (created_at, id) ikilisine çevir, geçersizse None döndür"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, pk = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+def get_page_size(value=None):
+    """İstekten gelen sayfa boyutunu doğrula ve sınırla"""
+    default_size = getattr(settings, 'TICKET_LIST_PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    max_size = getattr(settings, 'TICKET_LIST_MAX_PAGE_SIZE', MAX_PAGE_SIZE)
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default_size
+    return max(1, min(size, max_size))
+
+# ================================================================================
+# Sayfa Nesnesi
+# ================================================================================
+
+class KeysetPage:
+    """Tek bir keyset sayfası (template'te liste gibi kullanılabilir)"""
+
+    def __init__(self, items, has_next, has_previous):
+        self.object_list = items
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self.has_next and self.object_list else None
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self.object_list[0]) if self.has_previous and self.object_list else None
+
+def keyset_paginate(queryset, after=None, before=None, page_size=None):
+    """
+    Queryset'i (-created_at, -id) sırasıyla keyset sayfalamasına göre böl.
+    Tek sorguda page_size + 1 kayıt okunur; fazladan kayıt sonraki sayfanın
+    varlığını gösterir.
+    """
+    page_size = page_size or get_page_size()
+    after_key = decode_cursor(after)
+    before_key = decode_cursor(before)
+
+    if before_key:
+        # Önceki sayfa: cursor'dan daha yeni kayıtlar, artan sırada okunup çevrilir
+        created_at, pk = before_key
+        rows = list(
+            queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk))
+            .order_by('created_at', 'pk')[:page_size + 1]
+        )
+        has_previous = len(rows) > page_size
+        items = rows[:page_size]
+        items.reverse()
+        return KeysetPage(items, has_next=True, has_previous=has_previous)
+
+    if after_key:
+        created_at, pk = after_key
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+
+    rows = list(queryset.order_by('-created_at', '-pk')[:page_size + 1])
+    return KeysetPage(rows[:page_size], has_next=len(rows) > page_size, has_previous=after_key is not None)
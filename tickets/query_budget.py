@@ -0,0 +1,90 @@
+# tickets/query_budget.py
+"""
+Yardım Masası - View Sorgu Bütçeleri
+====================================
+
+Sayfaların veritabanı sorgu sayısının kayıt sayısından bağımsız kalmasını
+(N+1 regresyonu olmamasını) kontrol eden yardımcılar:
+- assert_max_queries: bir kod bloğundaki sorgu sayısını sınırlar
+- VIEW_QUERY_BUDGETS: view başına izin verilen en fazla sorgu sayısı
+- check_view_budgets: view'ları test client ile çağırıp bütçeleri
+  assert_max_queries ile doğrular (check_query_budgets komutu)
+"""
+
+from contextlib import contextmanager
+
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# ================================================================================
+# Sorgu Sayısı Kontrolü
+# ================================================================================
+
+class QueryBudgetExceeded(AssertionError):
+    """Bir kod bloğu izin verilenden fazla sorgu çalıştırdığında fırlatılır"""
+
+    def __init__(self, label, limit, queries):
+        self.label = label
+        self.limit = limit
+        self.queries = queries
+        sql = '\n'.join(f"  {i}. {query['sql']}" for i, query in enumerate(queries, start=1))
+        super().__init__(f"{label}: {len(queries)} sorgu çalıştı (izin verilen: {limit})\n{sql}")
+
+@contextmanager
+def assert_max_queries(limit, using='default', label='Kod bloğu'):
+    """Blok içinde en fazla `limit` sorgu çalıştırılmasına izin ver"""
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+    if len(context.captured_queries) > limit:
+        raise QueryBudgetExceeded(label, limit, context.captured_queries)
+
+# ================================================================================
+# View Bütçeleri
+# ================================================================================
+
+# (url adı, rol, en fazla sorgu) - oturum/kullanıcı yükleme sorguları dahildir.
+# Bütçeler sabittir; kayıt sayısı arttıkça sorgu sayısı artmamalıdır.
+VIEW_QUERY_BUDGETS = [
+    ('ticket_list', 'admin', 10),
+    ('ticket_list', 'support', 10),
+    ('ticket_list', 'customer', 10),
+    ('ticket_detail', 'admin', 10),
+    ('ticket_detail', 'support', 10),
+]
+
+def check_view_budgets(users_by_role, ticket, budgets=None):
+    """
+    Bütçe tanımlı view'ları ilgili rolün kullanıcısı ile çağır.
+    Dönüş: [{'view', 'role', 'limit', 'queries', 'status_code', 'ok', 'error'}]
+    Bütçe aşılırsa 'error' çalışan sorguların listesini içerir.
+    """
+    results = []
+    for url_name, role, limit in budgets or VIEW_QUERY_BUDGETS:
+        user = users_by_role.get(role)
+        if user is None:
+            continue
+
+        kwargs = {'pk': ticket.pk} if url_name == 'ticket_detail' else {}
+        client = Client()
+        client.force_login(user)
+        exceeded = None
+        try:
+            with assert_max_queries(limit, label=f'{url_name} ({role})') as context:
+                response = client.get(reverse(url_name, kwargs=kwargs))
+        except QueryBudgetExceeded as e:
+            exceeded = e
+        finally:
+            client.logout()
+
+        results.append({
+            'view': url_name,
+            'role': role,
+            'limit': limit,
+            'queries': len(context.captured_queries),
+            'status_code': response.status_code,
+            'ok': exceeded is None and response.status_code < 400,
+            'error': str(exceeded) if exceeded else None,
+        })
+    return results
@@ -0,0 +1,329 @@
+# tickets/rollups.py
+"""
+Yardım Masası Ticket İstatistikleri - Rollup Yönetimi
+=====================================================
+
+TicketDailyStats tablosunun artımlı güncellenmesi, yeniden hesaplanması
+ve rapor sayfaları için okunması bu modülde toplanmıştır.
+
+Bir ticket'ın rollup'a katkısı şu alanlardan türetilir:
+status, priority, category_id, created_at, updated_at.
+Kayıt değiştiğinde eski katkı çıkarılır, yeni katkı eklenir.
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from .models import Talep, TicketDailyStats
+
+# Rollup katkısını belirleyen Talep alanları
+SNAPSHOT_FIELDS = ('status', 'priority', 'category_id', 'created_at', 'updated_at')
+
+# ================================================================================
+# Artımlı Güncelleme
+# ================================================================================
+
+def ticket_snapshot(ticket):
+    """
+    Ticket'ın rollup'ı etkileyen alanlarının anlık görüntüsü.
+    Alanlardan biri yüklenmemişse (deferred) None döner.
+    """
+    values = ticket.__dict__
+    if any(field not in values for field in SNAPSHOT_FIELDS):
+        return None
+    return {field: values[field] for field in SNAPSHOT_FIELDS}
+
+def _local_date(value):
+    """Zaman damgasını aktif zaman dilimindeki tarihe çevir (created_at__date ile aynı)"""
+    if value is None:
+        return None
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+def day_start(day):
+    """
+    Aktif zaman dilimindeki günün başlangıç anı.
+    created_at__date=... yerine created_at__gte/__lt aralığı indeksleri kullanabilir.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+def day_range(first_day, last_day=None):
+    """[first_day 00:00, last_day + 1 gün 00:00) aralığı"""
+    return day_start(first_day), day_start((last_day or first_day) + timedelta(days=1))
+
+def on_day(field, day):
+    """`field` zaman damgası `day` gününe düşen kayıtlar için indeks dostu filtre"""
+    start, end = day_range(day)
+    return Q(**{f'{field}__gte': start, f'{field}__lt': end})
+
+def _contributions(snapshot, sign, deltas):
+    """Bir anlık görüntünün katkısını deltas sözlüğüne ekle/çıkar"""
+    if not snapshot or snapshot['created_at'] is None:
+        return
+
+    created_key = (
+        _local_date(snapshot['created_at']),
+        snapshot['status'],
+        snapshot['priority'],
+        snapshot['category_id'],
+    )
+    deltas[created_key][0] += sign
+
+    if snapshot['status'] == 'closed' and snapshot['updated_at'] is not None:
+        closed_key = (
+            _local_date(snapshot['updated_at']),
+            'closed',
+            snapshot['priority'],
+            snapshot['category_id'],
+        )
+        deltas[closed_key][1] += sign
+
+def _bump(key, created_delta, closed_delta):
+    """Tek bir rollup satırını atomik olarak artır, yoksa oluştur"""
+    date, status, priority, category_id = key
+    bucket = TicketDailyStats.objects.filter(
+        date=date, status=status, priority=priority, category_id=category_id
+    )
+    changes = {
+        'created_count': F('created_count') + created_delta,
+        'closed_count': F('closed_count') + closed_delta,
+    }
+    if bucket.update(**changes):
+        return
+
+    try:
+        with transaction.atomic():
+            TicketDailyStats.objects.create(
+                date=date,
+                status=status,
+                priority=priority,
+                category_id=category_id,
+                created_count=created_delta,
+                closed_count=closed_delta,
+            )
+    except IntegrityError:
+        # Eşzamanlı bir istek satırı bizden önce oluşturdu
+        bucket.update(**changes)
+
+def apply_snapshot_changes(pairs):
+    """
+    (eski, yeni) anlık görüntü çiftlerini rollup tablosuna uygula.
+    Aynı satıra düşen değişiklikler tek UPDATE ile yazılır.
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    for old, new in pairs:
+        _contributions(old, -1, deltas)
+        _contributions(new, 1, deltas)
+
+    for key, (created_delta, closed_delta) in deltas.items():
+        if created_delta or closed_delta:
+            _bump(key, created_delta, closed_delta)
+
+def apply_ticket_change(old_snapshot, new_snapshot):
+    """Tek bir ticket kaydının değişikliğini rollup'a uygula"""
+    apply_snapshot_changes([(old_snapshot, new_snapshot)])
+
+def update_queryset(queryset, actor=None, **changes):
+    """
+    queryset.update() ile yapılan toplu değişiklikleri rollup ile birlikte uygula.
+    Admin toplu işlemleri gibi save() çağırmayan yollar için kullanılır.
+    Durum değişiyorsa durum geçmişi (actor adına) tek bulk_create ile yazılır.
+    Güncellenen kayıt sayısını döndürür.
+    """
+    from .status_history import record_status_changes
+
+    with transaction.atomic():
+        rows = list(queryset.values('pk', *SNAPSHOT_FIELDS))
+        if not rows:
+            return 0
+        updated = Talep.objects.filter(pk__in=[row['pk'] for row in rows]).update(**changes)
+        if 'status' in changes:
+            record_status_changes([(row['pk'], row['status'], changes['status']) for row in rows], actor=actor)
+
+        pairs = []
+        for row in rows:
+            old = {field: row[field] for field in SNAPSHOT_FIELDS}
+            new = dict(old)
+            for field, value in changes.items():
+                key = 'category_id' if field == 'category' else field
+                if key in new:
+                    new[key] = getattr(value, 'pk', value)
+            pairs.append((old, new))
+        apply_snapshot_changes(pairs)
+    return updated
+
+def remove_ticket(ticket):
+    """Silinen ticket'ın katkısını rollup'tan çıkar"""
+    snapshot = getattr(ticket, '_rollup_snapshot', None) or ticket_snapshot(ticket)
+    if snapshot is not None:
+        apply_ticket_change(snapshot, None)
+
+def merge_category_stats(category_id):
+    """
+    Silinecek kategorinin satırlarını kategorisiz kovalara taşı (küme tabanlı).
+    SET_NULL ile bırakılsaydı aynı (tarih, durum, öncelik, NULL) kovası
+    ikinci kez oluşur ve kısmi benzersizlik kısıtı silmeyi engellerdi.
+    """
+    def same_bucket(**filters):
+        return TicketDailyStats.objects.filter(
+            date=OuterRef('date'), status=OuterRef('status'), priority=OuterRef('priority'), **filters
+        )
+
+    source = same_bucket(category_id=category_id)
+    with transaction.atomic():
+        # 1. Kategorisiz karşılığı olan satırların sayaçları karşılığa eklenir
+        TicketDailyStats.objects.filter(Exists(source), category__isnull=True).update(
+            created_count=F('created_count') + Subquery(source.values('created_count')[:1]),
+            closed_count=F('closed_count') + Subquery(source.values('closed_count')[:1]),
+        )
+        # 2. Karşılığı olmayanlar kategorisiz kovaya dönüşür, kalanlar (eklenmiş olanlar) silinir
+        rows = TicketDailyStats.objects.filter(category_id=category_id)
+        rows.exclude(Exists(same_bucket(category__isnull=True))).update(category=None)
+        rows.delete()
+
+# ================================================================================
+# Yeniden Hesaplama (Backfill / Reconcile)
+# ================================================================================
+
+def compute_expected_rows(start=None, end=None):
+    """
+    Talep tablosundan beklenen rollup değerlerini hesapla.
+    Dönüş: {(date, status, priority, category_id): [created, closed]}
+    """
+    expected = defaultdict(lambda: [0, 0])
+
+    created = Talep.objects.all()
+    closed = Talep.objects.filter(status='closed')
+    if start:
+        created = created.filter(created_at__gte=day_start(start))
+        closed = closed.filter(updated_at__gte=day_start(start))
+    if end:
+        created = created.filter(created_at__lt=day_start(end + timedelta(days=1)))
+        closed = closed.filter(updated_at__lt=day_start(end + timedelta(days=1)))
+
+    created_rows = (
+        created.annotate(day=TruncDate('created_at'))
+        .values('day', 'status', 'priority', 'category_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    for row in created_rows:
+        key = (row['day'], row['status'], row['priority'], row['category_id'])
+        expected[key][0] += row['count']
+
+    closed_rows = (
+        closed.annotate(day=TruncDate('updated_at'))
+        .values('day', 'priority', 'category_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    for row in closed_rows:
+        key = (row['day'], 'closed', row['priority'], row['category_id'])
+        expected[key][1] += row['count']
+
+    return expected
+
+def reconcile_daily_stats(start=None, end=None, dry_run=False):
+    """
+    Verilen tarih aralığındaki rollup satırlarını Talep tablosu ile uzlaştır.
+    Aralık verilmezse tüm tablo yeniden oluşturulur (backfill).
+    Farklı çıkan satır sayısını döndürür.
+    """
+    expected = compute_expected_rows(start, end)
+
+    existing_qs = TicketDailyStats.objects.all()
+    if start:
+        existing_qs = existing_qs.filter(date__gte=start)
+    if end:
+        existing_qs = existing_qs.filter(date__lte=end)
+
+    current = defaultdict(lambda: [0, 0])
+    row_counts = defaultdict(int)
+    for row in existing_qs.values('date', 'status', 'priority', 'category_id', 'created_count', 'closed_count'):
+        key = (row['date'], row['status'], row['priority'], row['category_id'])
+        current[key][0] += row['created_count']
+        current[key][1] += row['closed_count']
+        row_counts[key] += 1
+
+    keys = set(expected) | set(current)
+    # Aynı kovada birden fazla satır (toplamı doğru olsa bile) yeniden yazılır
+    mismatches = sum(
+        1 for key in keys
+        if expected.get(key, [0, 0]) != current.get(key, [0, 0]) or row_counts.get(key, 0) > 1
+    )
+
+    if mismatches and not dry_run:
+        with transaction.atomic():
+            existing_qs.delete()
+            TicketDailyStats.objects.bulk_create(
+                [
+                    TicketDailyStats(
+                        date=date,
+                        status=status,
+                        priority=priority,
+                        category_id=category_id,
+                        created_count=created_count,
+                        closed_count=closed_count,
+                    )
+                    for (date, status, priority, category_id), (created_count, closed_count) in expected.items()
+                    if created_count or closed_count
+                ],
+                batch_size=1000,
+            )
+
+    return mismatches
+
+# ================================================================================
+# Rapor Okuma Yardımcıları
+# ================================================================================
+
+def daily_counts(start, end):
+    """
+    [start, end] aralığındaki günlük açılan/kapatılan ticket sayıları.
+    Dönüş: {date: {'created': n, 'closed': m}}
+    """
+    rows = (
+        TicketDailyStats.objects.filter(date__gte=start, date__lte=end)
+        .values('date')
+        .annotate(created=Sum('created_count'), closed=Sum('closed_count'))
+        .order_by()
+    )
+    return {row['date']: {'created': row['created'], 'closed': row['closed']} for row in rows}
+
+def monthly_counts(start, end):
+    """
+    [start, end] aralığındaki aylık açılan/kapatılan ticket sayıları.
+    Dönüş: {(yıl, ay): {'created': n, 'closed': m}}
+    """
+    rows = (
+        TicketDailyStats.objects.filter(date__gte=start, date__lte=end)
+        .annotate(month=TruncMonth('date'))
+        .values('month')
+        .annotate(created=Sum('created_count'), closed=Sum('closed_count'))
+        .order_by()
+    )
+    return {
+        (row['month'].year, row['month'].month): {'created': row['created'], 'closed': row['closed']}
+        for row in rows
+    }
+
+def distribution(field, limit=None):
+    """
+    Mevcut ticket'ların verilen alana göre dağılımı (status, priority, category__name).
+    Talep tablosu yerine rollup satırları toplanır.
+    """
+    rows = (
+        TicketDailyStats.objects.values(field)
+        .annotate(count=Sum('created_count'))
+        .filter(count__gt=0)
+        .order_by('-count')
+    )
+    if limit:
+        rows = rows[:limit]
+    return list(rows)
@@ -0,0 +1,34 @@
+# tickets/signals.py
+# ================================================================================
+# Ticket Sinyalleri
+# Model yaşam döngüsü olaylarını rollup ve SLA alanlarına yansıtır.
+# ================================================================================
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import OPEN_STATUSES, SLA, Category, Talep
+from .rollups import merge_category_stats, remove_ticket
+from .sla import recompute_deadlines
+
+
+@receiver(post_delete, sender=Talep)
+def talep_deleted(sender, instance, **kwargs):
+    """Silinen ticket'ın günlük istatistiklere katkısını geri al"""
+    remove_ticket(instance)
+
+
+@receiver(pre_delete, sender=Category)
+def category_deleting(sender, instance, **kwargs):
+    """Kategorinin günlük istatistik satırlarını kategorisiz kovalarla birleştir (SET_NULL'dan önce)"""
+    merge_category_stats(instance.pk)
+
+
+@receiver(post_save, sender=SLA)
+def sla_saved(sender, instance, created, raw=False, **kwargs):
+    """SLA süreleri değiştiyse bu SLA'daki açık taleplerin son tarihlerini yeniden hesapla"""
+    hours = (instance.response_time, instance.resolve_time)
+    if not created and not raw and getattr(instance, '_loaded_hours', hours) != hours:
+        recompute_deadlines(Talep.objects.filter(sla=instance, status__in=OPEN_STATUSES))
+    instance._loaded_hours = hours
+
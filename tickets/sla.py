@@ -0,0 +1,155 @@
+# tickets/sla.py
+"""
+Yardım Masası - SLA Hesaplama
+=============================
+
+Talep.sla atanmış taleplerin yanıt ve çözüm son tarihleri talep üzerinde
+saklanır (response_due_at, resolve_due_at):
+- Talep oluşturulurken ve talebin SLA'sı değiştiğinde Talep.save hesaplar
+- Bir SLA'nın süreleri değiştiğinde o SLA'daki açık talepler toplu güncellenir
+  (signals.sla_saved → recompute_deadlines)
+- Süreler SLA_BUSINESS_HOURS açıkken mesai saati olarak işler
+  (tickets.business_hours); takvim değiştiğinde `check_sla --recompute`
+
+İhlal sorguları kısmi indeksleri kullanır, tüm tabloyu taramaz:
+- talep_response_due_idx : response_due_at, yalnızca yanıt bekleyen talepler
+- talep_resolve_due_idx  : resolve_due_at, yalnızca çözülmemiş talepler
+
+check_sla komutu periyodik olarak yeni ihlalleri bu indekslerden bulur ve
+response_breached_at / resolve_breached_at alanlarını ayrı ayrı işaretler;
+yanıt süresi ihlal edilen talep, çözüm süresi de dolduğunda yeniden raporlanır.
+Bir ihlal işareti yalnızca ilgili son tarih değiştiğinde temizlenir.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .business_hours import get_calendar
+from .models import OPEN_STATUSES, RESPONSE_PENDING_STATUSES, SLA, Talep
+
+# Toplu yeniden hesaplamada tek bulk_update ile yazılan talep sayısı
+RECOMPUTE_BATCH_SIZE = 1000
+
+# Son tarih alanı → o son tarihin ihlal işareti
+DEADLINE_FIELDS = {
+    'response_due_at': 'response_breached_at',
+    'resolve_due_at': 'resolve_breached_at',
+}
+
+# ================================================================================
+# Son Tarih Hesaplama
+# ================================================================================
+
+def compute_deadlines(start, sla, calendar=None):
+    """
+    (yanıt son tarihi, çözüm son tarihi) - SLA yoksa (None, None).
+    SLA_BUSINESS_HOURS açıkken süreler iş takviminde (mesai saati) ilerletilir.
+    """
+    if sla is None or start is None:
+        return None, None
+    if getattr(settings, 'SLA_BUSINESS_HOURS', True):
+        calendar = calendar or get_calendar()
+        return calendar.add_hours(start, sla.response_time), calendar.add_hours(start, sla.resolve_time)
+    return start + timedelta(hours=sla.response_time), start + timedelta(hours=sla.resolve_time)
+
+def apply_deadlines(ticket, sla=None, calendar=None):
+    """
+    Talebin son tarihlerini SLA'sına göre hesapla (kaydetmez).
+    Son tarihi değişen ihlal işareti temizlenir (ihlal yeniden değerlendirilir).
+    Dönüş: değişen alanlar
+    """
+    if sla is None and ticket.sla_id is not None:
+        sla = ticket.sla
+    start = ticket.created_at or timezone.now()
+    deadlines = dict(zip(DEADLINE_FIELDS, compute_deadlines(start, sla, calendar)))
+
+    changed = []
+    for due_field, breached_field in DEADLINE_FIELDS.items():
+        if getattr(ticket, due_field) != deadlines[due_field]:
+            setattr(ticket, due_field, deadlines[due_field])
+            setattr(ticket, breached_field, None)
+            changed += [due_field, breached_field]
+    return changed
+
+def recompute_deadlines(queryset, batch_size=RECOMPUTE_BATCH_SIZE):
+    """
+    Sorgu kümesindeki taleplerin son tarihlerini yeniden hesapla
+    (SLA süresi değiştiğinde). Yalnızca gereken alanlar okunur,
+    partiler halinde bulk_update ile yazılır; son tarihi değişmeyen talepler
+    (ve ihlal işaretleri) olduğu gibi kalır. Güncellenen talep sayısını döndürür.
+    """
+    slas = {sla.pk: sla for sla in SLA.objects.all()}
+    # Tüm partiler aynı önceden hesaplanmış takvim indeksini kullanır
+    calendar = get_calendar()
+    fields = ['pk', 'sla_id', 'created_at', *DEADLINE_FIELDS, *DEADLINE_FIELDS.values()]
+    tickets = queryset.order_by('pk').only(*fields)
+    updated = 0
+    batch = []
+    for ticket in tickets.iterator(chunk_size=batch_size):
+        if not apply_deadlines(ticket, slas.get(ticket.sla_id), calendar):
+            continue
+        batch.append(ticket)
+        if len(batch) >= batch_size:
+            updated += _write_deadlines(batch)
+            batch = []
+    if batch:
+        updated += _write_deadlines(batch)
+    return updated
+
+def _write_deadlines(tickets):
+    with transaction.atomic():
+        Talep.objects.bulk_update(tickets, [*DEADLINE_FIELDS, *DEADLINE_FIELDS.values()])
+    return len(tickets)
+
+# ================================================================================
+# İhlal Sorguları
+# ================================================================================
+
+def response_breached(now=None):
+    """Yanıt süresi dolmuş, hâlâ yanıt bekleyen talepler"""
+    return Talep.objects.filter(status__in=RESPONSE_PENDING_STATUSES, response_due_at__lt=now or timezone.now())
+
+def resolve_breached(now=None):
+    """Çözüm süresi dolmuş, hâlâ çözülmemiş talepler"""
+    return Talep.objects.filter(status__in=OPEN_STATUSES, resolve_due_at__lt=now or timezone.now())
+
+def breached(now=None):
+    """Yanıt ya da çözüm süresi dolmuş talepler (iki kısmi indeks, BitmapOr)"""
+    now = now or timezone.now()
+    return Talep.objects.filter(
+        Q(status__in=RESPONSE_PENDING_STATUSES, response_due_at__lt=now)
+        | Q(status__in=OPEN_STATUSES, resolve_due_at__lt=now)
+    )
+
+def breaching_within(hours, now=None):
+    """Önümüzdeki `hours` saat içinde yanıt ya da çözüm süresi dolacak talepler"""
+    now = now or timezone.now()
+    until = now + timedelta(hours=hours)
+    return Talep.objects.filter(
+        Q(status__in=RESPONSE_PENDING_STATUSES, response_due_at__gte=now, response_due_at__lt=until)
+        | Q(status__in=OPEN_STATUSES, resolve_due_at__gte=now, resolve_due_at__lt=until)
+    )
+
+def mark_breaches(now=None, dry_run=False):
+    """
+    Yanıt ve çözüm süresini yeni ihlal eden talepleri ayrı ayrı işaretle
+    (response_breached_at / resolve_breached_at boş olanlar).
+    Dönüş: {'response': [id], 'resolve': [id]}
+    """
+    now = now or timezone.now()
+    pending = {
+        'response': response_breached(now).filter(response_breached_at__isnull=True),
+        'resolve': resolve_breached(now).filter(resolve_breached_at__isnull=True),
+    }
+    found = {kind: list(queryset.order_by().values_list('pk', flat=True)) for kind, queryset in pending.items()}
+    if not dry_run:
+        # Durum/son tarih arada değiştiyse işaretlenmez (koşul UPDATE içinde tekrar edilir)
+        if found['response']:
+            pending['response'].filter(pk__in=found['response']).update(response_breached_at=now)
+        if found['resolve']:
+            pending['resolve'].filter(pk__in=found['resolve']).update(resolve_breached_at=now)
+    return found
@@ -0,0 +1,133 @@
+# tickets/status_history.py
+"""
+Yardım Masası Ticket Durum Geçmişi
+==================================
+
+TicketStatusEvent tablosunun yazılması ve bu tablodan türetilen metrikler.
+
+Yazma: her durum değiştirme yolu bu modülü çağırır
+- Talep.save                         : record_status_change
+- koşullu UPDATE (transitions)       : record_status_change
+- toplu durum değiştirme / admin
+  toplu işlemleri (update_queryset)  : record_status_changes (tek bulk_create)
+
+Metrikler tek sorgu ile (küme tabanlı) hesaplanır:
+- time_in_status    : her olayın bir sonraki olaya (yoksa şimdiye) kadar süresi
+- first_response    : oluşturmadan talep sahibi dışındaki ilk durum değişikliğine kadar
+- resolution        : oluşturmadan ilk 'resolved'/'closed' geçişine kadar
+
+Metrikler admin analitik sayfasında (son 30 gün) gösterilir.
+"""
+
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Talep, TicketStatusEvent
+
+# Çözüm sayılan durumlar
+RESOLVED_STATUSES = ('resolved', 'closed')
+
+# ================================================================================
+# Yazma
+# ================================================================================
+
+def _actor_id(actor):
+    return getattr(actor, 'pk', actor)
+
+def record_status_change(ticket_id, from_status, to_status, actor=None, at=None):
+    """Tek bir durum değişikliğini kaydet"""
+    return TicketStatusEvent.objects.create(
+        talep_id=ticket_id,
+        from_status=from_status or '',
+        to_status=to_status,
+        actor_id=_actor_id(actor),
+        created_at=at or timezone.now(),
+    )
+
+def record_status_changes(changes, actor=None, at=None):
+    """
+    Birden çok durum değişikliğini tek bulk_create ile kaydet.
+    changes: [(ticket_id, from_status, to_status)] - durum değişmeyenler atlanır
+    """
+    at = at or timezone.now()
+    actor_id = _actor_id(actor)
+    events = [
+        TicketStatusEvent(
+            talep_id=ticket_id,
+            from_status=from_status or '',
+            to_status=to_status,
+            actor_id=actor_id,
+            created_at=at,
+        )
+        for ticket_id, from_status, to_status in changes
+        if from_status != to_status
+    ]
+    return TicketStatusEvent.objects.bulk_create(events, batch_size=1000)
+
+# ================================================================================
+# Metrikler
+# ================================================================================
+
+def _duration(end, start):
+    return ExpressionWrapper(F(end) - F(start), output_field=DurationField())
+
+def time_in_status(start=None, end=None, now=None):
+    """
+    Durum bazında bekleme süreleri. [start, end) aralığında başlayan
+    her durum dönemi, bir sonraki olaya (yoksa `now` anına) kadar sayılır.
+    Dönüş: {durum: {'count': n, 'avg': timedelta, 'total': timedelta}}
+    """
+    now = now or timezone.now()
+    next_event = TicketStatusEvent.objects.filter(
+        talep_id=OuterRef('talep_id'),
+        created_at__gt=OuterRef('created_at'),
+    ).order_by('created_at').values('created_at')[:1]
+
+    events = TicketStatusEvent.objects.all()
+    if start:
+        events = events.filter(created_at__gte=start)
+    if end:
+        events = events.filter(created_at__lt=end)
+
+    rows = (
+        events.annotate(left_at=Coalesce(Subquery(next_event), Value(now)))
+        .annotate(duration=_duration('left_at', 'created_at'))
+        .values('to_status')
+        .annotate(count=Count('id'), avg=Avg('duration'), total=Sum('duration'))
+        .order_by()
+    )
+    return {row['to_status']: {'count': row['count'], 'avg': row['avg'], 'total': row['total']} for row in rows}
+
+def _first_event_at(condition):
+    return Subquery(
+        TicketStatusEvent.objects.filter(condition, talep_id=OuterRef('pk'))
+        .order_by('created_at')
+        .values('created_at')[:1]
+    )
+
+def _average_since_created(tickets, condition):
+    return (
+        tickets.annotate(reached_at=_first_event_at(condition))
+        .filter(reached_at__isnull=False)
+        .aggregate(count=Count('id'), avg=Avg(_duration('reached_at', 'created_at')))
+    )
+
+def first_response(tickets=None):
+    """
+    İlk yanıt süresi: oluşturmadan, talep sahibi dışında biri tarafından
+    yapılan ilk durum değişikliğine kadar geçen süre.
+    Dönüş: {'count': yanıtlanan talep, 'avg': timedelta}
+    """
+    tickets = Talep.objects.all() if tickets is None else tickets
+    # Değiştireni bilinmeyen (geriye dönük doldurulmuş) olaylar yanıt sayılır
+    condition = ~Q(from_status='') & (Q(actor_id__isnull=True) | ~Q(actor_id=OuterRef('user_id')))
+    return _average_since_created(tickets, condition)
+
+def resolution(tickets=None):
+    """
+    Çözüm süresi: oluşturmadan ilk 'resolved'/'closed' geçişine kadar geçen süre.
+    Dönüş: {'count': çözülen talep, 'avg': timedelta}
+    """
+    tickets = Talep.objects.all() if tickets is None else tickets
+    return _average_since_created(tickets, Q(to_status__in=RESOLVED_STATUSES))
@@ -0,0 +1,296 @@
+# tickets/synthetic.py
+"""
+Yardım Masası - Sentetik Veri Üretimi
+=====================================
+
+Performans ölçümleri için büyük veri seti üretir. Tüm kayıtlar bulk_create
+ile parti parti yazılır; save() atlandığı için yan etkiler toplu olarak
+uygulanır:
+- Talep numaraları allocate_ticket_numbers ile bloklar halinde alınır
+- Günlük istatistikler (TicketDailyStats) sonda reconcile ile kurulur
+- Durum geçmişi (TicketStatusEvent) taleplerle birlikte toplu yazılır
+
+Üretilen kullanıcı ve grupların adları SYNTHETIC_PREFIX ile başlar.
+"""
+
+import random
+import secrets
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.utils import timezone
+
+from accounts.models import CustomAuthToken, SystemLog
+from .business_hours import get_calendar
+from .models import SLA, Category, Comment, Talep, TicketStatusEvent
+from .numbering import allocate_ticket_numbers
+from .rollups import reconcile_daily_stats
+from .sla import compute_deadlines
+
+User = get_user_model()
+
+SYNTHETIC_PREFIX = 'synthetic_'
+
+# Ağırlıklı durum / öncelik / log seviyesi dağılımları
+STATUS_WEIGHTS = {
+    'new': 10, 'seen': 5, 'open': 15, 'pending': 5, 'in_progress': 10,
+    'resolved': 15, 'closed': 38, 'wrong_section': 2,
+}
+PRIORITY_WEIGHTS = {'low': 25, 'normal': 50, 'high': 20, 'urgent': 5}
+LOG_LEVEL_WEIGHTS = {'DEBUG': 10, 'INFO': 70, 'WARNING': 12, 'ERROR': 7, 'CRITICAL': 1}
+LOG_ACTIONS = ('LOGIN', 'LOGOUT', 'TICKET_CREATE', 'TICKET_UPDATE', 'TOKEN_CREATE', 'SETTINGS_UPDATE')
+
+# (ad, yanıt süresi, çözüm süresi) - saat cinsinden
+SLA_LEVELS = (
+    ('kritik', 1, 4),
+    ('yuksek', 4, 24),
+    ('normal', 8, 72),
+    ('dusuk', 24, 168),
+)
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+@contextmanager
+def explicit_timestamps(model, *field_names):
+    """bulk_create sırasında auto_now / auto_now_add alanlarına elle değer verilebilsin"""
+    fields = [model._meta.get_field(name) for name in field_names]
+    saved = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, saved):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+def _choices(rng, weights, k):
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+def _batches(total, batch_size):
+    for start in range(0, total, batch_size):
+        yield min(batch_size, total - start)
+
+# ================================================================================
+# Üreticiler
+# ================================================================================
+
+def create_users(role, count, batch_size=1000):
+    """`count` adet `role` rolünde kullanıcı oluştur (girişe kapalı parola)"""
+    offset = User.objects.filter(username__startswith=f'{SYNTHETIC_PREFIX}{role}_').count()
+    password = make_password(None)
+    created = []
+    for size in _batches(count, batch_size):
+        start = offset + len(created)
+        created.extend(User.objects.bulk_create([
+            User(
+                username=f'{SYNTHETIC_PREFIX}{role}_{start + i}',
+                email=f'{SYNTHETIC_PREFIX}{role}_{start + i}@example.com',
+                password=password,
+                role=role,
+            )
+            for i in range(size)
+        ]))
+    return created
+
+def create_groups(customers, group_count):
+    """Müşterileri `group_count` gruba sırayla dağıt"""
+    if not customers or group_count <= 0:
+        return []
+    offset = Group.objects.filter(name__startswith=SYNTHETIC_PREFIX).count()
+    groups = Group.objects.bulk_create([
+        Group(name=f'{SYNTHETIC_PREFIX}group_{offset + i}') for i in range(group_count)
+    ])
+    Membership = User.groups.through
+    Membership.objects.bulk_create(
+        [
+            Membership(customuser_id=user.pk, group_id=groups[i % group_count].pk)
+            for i, user in enumerate(customers)
+        ],
+        batch_size=5000,
+    )
+    return groups
+
+def create_categories(count):
+    return [
+        Category.objects.get_or_create(name=f'{SYNTHETIC_PREFIX}kategori_{i}')[0]
+        for i in range(count)
+    ]
+
+def create_slas():
+    return [
+        SLA.objects.get_or_create(
+            name=f'{SYNTHETIC_PREFIX}{name}',
+            defaults={'response_time': response_time, 'resolve_time': resolve_time},
+        )[0]
+        for name, response_time, resolve_time in SLA_LEVELS
+    ]
+
+def create_tickets(count, owners, assignees, categories, slas=(), days=365, comments_per_ticket=2,
+                   batch_size=5000, rng=None, progress=None):
+    """
+    `count` adet talebi son `days` güne yayarak oluştur, her talebe
+    ortalama `comments_per_ticket` yorum ekle. Oluşturulan talep sayısını döndürür.
+    """
+    rng = rng or random.Random()
+    now = timezone.now()
+    span = days * 86400
+    created = 0
+    calendar = get_calendar()
+
+    with explicit_timestamps(Talep, 'created_at', 'updated_at'), \
+            explicit_timestamps(Comment, 'created_at'):
+        for size in _batches(count, batch_size):
+            numbers = allocate_ticket_numbers(size)
+            statuses = _choices(rng, STATUS_WEIGHTS, size)
+            priorities = _choices(rng, PRIORITY_WEIGHTS, size)
+
+            tickets = []
+            for i in range(size):
+                created_at = now - timedelta(seconds=rng.randrange(span))
+                updated_at = min(now, created_at + timedelta(minutes=rng.randrange(1, 14 * 24 * 60)))
+                sla = rng.choice(slas) if slas else None
+                response_due_at, resolve_due_at = compute_deadlines(created_at, sla, calendar)
+                tickets.append(Talep(
+                    title=f'Sentetik talep {numbers[i]}',
+                    description='Performans ölçümü için üretilmiş talep.',
+                    status=statuses[i],
+                    priority=priorities[i],
+                    category=rng.choice(categories) if categories else None,
+                    sla=sla,
+                    response_due_at=response_due_at,
+                    resolve_due_at=resolve_due_at,
+                    user=rng.choice(owners),
+                    assigned_to=rng.choice(assignees) if assignees and rng.random() < 0.8 else None,
+                    talep_numarasi=numbers[i],
+                    created_at=created_at,
+                    updated_at=updated_at,
+                ))
+            tickets = Talep.objects.bulk_create(tickets)
+
+            comments = []
+            for ticket in tickets:
+                for _ in range(rng.randint(0, comments_per_ticket * 2)):
+                    comments.append(Comment(
+                        talep_id=ticket.pk,
+                        user=rng.choice((ticket.user, ticket.assigned_to or ticket.user)),
+                        message='Sentetik yorum.',
+                        created_at=ticket.created_at + (ticket.updated_at - ticket.created_at) * rng.random(),
+                    ))
+            Comment.objects.bulk_create(comments, batch_size=batch_size)
+
+            # Durum geçmişi: oluşturma + (yeni değilse) mevcut duruma tek geçiş
+            events = []
+            for ticket in tickets:
+                events.append(TicketStatusEvent(
+                    talep_id=ticket.pk, from_status='', to_status='new',
+                    actor_id=ticket.user_id, created_at=ticket.created_at,
+                ))
+                if ticket.status != 'new':
+                    events.append(TicketStatusEvent(
+                        talep_id=ticket.pk, from_status='new', to_status=ticket.status,
+                        actor_id=ticket.assigned_to_id, created_at=ticket.updated_at,
+                    ))
+            TicketStatusEvent.objects.bulk_create(events, batch_size=batch_size)
+
+            created += size
+            if progress:
+                progress(f'{created}/{count} talep')
+    return created
+
+def create_tokens(users, per_user=1, days=90, batch_size=5000, rng=None):
+    """Her kullanıcı için `per_user` adet (bir kısmı süresi dolmuş/pasif) token oluştur"""
+    rng = rng or random.Random()
+    now = timezone.now()
+    span = days * 86400
+    tokens = []
+
+    with explicit_timestamps(CustomAuthToken, 'created'):
+        for user in users:
+            for i in range(per_user):
+                created = now - timedelta(seconds=rng.randrange(span))
+                tokens.append(CustomAuthToken(
+                    key=secrets.token_urlsafe(48),
+                    user=user,
+                    device_name=f'{SYNTHETIC_PREFIX}device_{i}',
+                    created=created,
+                    expires_at=created + timedelta(days=30),
+                    last_used=created + (now - created) * rng.random() if rng.random() < 0.7 else None,
+                    is_active=rng.random() < 0.9,
+                ))
+        CustomAuthToken.objects.bulk_create(tokens, batch_size=batch_size)
+    return len(tokens)
+
+def create_system_logs(count, users, days=90, batch_size=5000, rng=None):
+    """`count` adet SystemLog kaydını son `days` güne yayarak oluştur"""
+    rng = rng or random.Random()
+    now = timezone.now()
+    span = days * 86400
+
+    with explicit_timestamps(SystemLog, 'timestamp'):
+        for size in _batches(count, batch_size):
+            levels = _choices(rng, LOG_LEVEL_WEIGHTS, size)
+            SystemLog.objects.bulk_create([
+                SystemLog(
+                    timestamp=now - timedelta(seconds=rng.randrange(span)),
+                    level=levels[i],
+                    user=rng.choice(users) if users else None,
+                    ip_address=f'10.0.{rng.randrange(256)}.{rng.randrange(1, 255)}',
+                    action=rng.choice(LOG_ACTIONS),
+                    message=f'Sentetik {levels[i].lower()} kaydı',
+                )
+                for i in range(size)
+            ])
+    return count
+
+def generate_dataset(tickets=100000, customers=500, support=20, admins=2, groups=25,
+                     categories=8, comments_per_ticket=2, tokens_per_user=1, logs=50000, days=365,
+                     batch_size=5000, seed=42, progress=None):
+    """
+    Tam bir sentetik veri seti üret ve türetilmiş tabloları güncelle.
+    Dönüş: oluşturulan kayıt sayıları
+    """
+    rng = random.Random(seed)
+    say = progress or (lambda message: None)
+
+    say('Kullanıcılar oluşturuluyor')
+    customer_users = create_users('customer', customers)
+    support_users = create_users('support', support)
+    admin_users = create_users('admin', admins)
+    group_list = create_groups(customer_users, groups)
+
+    category_list = create_categories(categories)
+    sla_list = create_slas()
+
+    say('Talepler ve yorumlar oluşturuluyor')
+    owners = customer_users or list(User.objects.filter(role='customer')[:100])
+    ticket_count = create_tickets(
+        tickets, owners, support_users + admin_users, category_list, sla_list,
+        days=days, comments_per_ticket=comments_per_ticket,
+        batch_size=batch_size, rng=rng, progress=say,
+    ) if owners else 0
+
+    say('Token\'lar oluşturuluyor')
+    token_count = create_tokens(
+        customer_users + support_users + admin_users, tokens_per_user, batch_size=batch_size, rng=rng,
+    ) if tokens_per_user > 0 else 0
+
+    say('Sistem logları oluşturuluyor')
+    log_count = create_system_logs(logs, customer_users + support_users, batch_size=batch_size, rng=rng)
+
+    say('Günlük istatistikler yeniden hesaplanıyor')
+    reconcile_daily_stats()
+
+    return {
+        'users': len(customer_users) + len(support_users) + len(admin_users),
+        'groups': len(group_list),
+        'categories': len(category_list),
+        'slas': len(sla_list),
+        'tickets': ticket_count,
+        'tokens': token_count,
+        'logs': log_count,
+    }
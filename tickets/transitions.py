@@ -0,0 +1,201 @@
+# tickets/transitions.py
+"""
+Yardım Masası Ticket Durum Geçişleri
+====================================
+
+Çok sayıda ticket'ın durumu tek istekle değiştirilir:
+
+- Ticket'lar tek SELECT ile okunur (işlem boyunca kilitli)
+- Her geçiş STATUS_TRANSITIONS haritasına göre doğrulanır
+- Geçerli olanlar tek UPDATE ile güncellenir (yalnızca status, updated_at)
+- Durum değişikliği yorumları ve durum geçmişi birer bulk_create ile yazılır
+- Rollup (TicketDailyStats) aynı işlem içinde güncellenir
+
+Sonuç ticket bazında döner; geçersiz ya da bulunamayan ticket'lar
+diğerlerinin güncellenmesini engellemez.
+
+Tekil durum/atama değişiklikleri de save() yerine koşullu UPDATE kullanır:
+ticket yalnızca gereken alanlarla (description olmadan) okunur ve
+UPDATE ... WHERE status = <okunan durum> ile yalnızca değişen alanlar ve
+updated_at yazılır. Arada başka bir istek kaydı değiştirdiyse UPDATE
+hiçbir satırı etkilemez ve çağıran çakışma (409) döndürür.
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import STATUS_TRANSITIONS, Comment, Talep
+from .rollups import SNAPSHOT_FIELDS, apply_snapshot_changes, ticket_snapshot
+from .status_history import record_status_change, record_status_changes
+
+# Tek istekte değiştirilebilecek en fazla ticket (settings.TICKET_BULK_STATUS_MAX_IDS)
+DEFAULT_MAX_IDS = 500
+
+STATUS_LABELS = dict(Talep.STATUS_CHOICES)
+
+# Durum/atama değişikliği için okunan alanlar (rollup anlık görüntüsü + atama)
+WRITE_FIELDS = ('status', 'priority', 'category_id', 'created_at', 'updated_at', 'assigned_to_id')
+
+# change_assignment: istemci mevcut atamayı bildirmedi (kontrol yapılmaz).
+# None ise "atanmamış olmalı" anlamına gelir.
+UNCHECKED = object()
+
+# ================================================================================
+# Yardımcı Fonksiyonlar
+# ================================================================================
+
+def max_bulk_ids():
+    return getattr(settings, 'TICKET_BULK_STATUS_MAX_IDS', DEFAULT_MAX_IDS)
+
+def can_transition(old_status, new_status):
+    """`old_status` → `new_status` geçişine izin var mı?"""
+    return new_status in STATUS_TRANSITIONS.get(old_status, [])
+
+def source_statuses(new_status):
+    """`new_status` durumuna geçilebilen durumlar"""
+    return [status for status, targets in STATUS_TRANSITIONS.items() if new_status in targets]
+
+def status_change_message(old_status, new_status):
+    """Durum değişikliği yorumu (tekil durum değiştirme ile aynı biçim)"""
+    return (
+        f"🔄 Durum değiştirildi: {STATUS_LABELS.get(old_status, old_status)} → "
+        f"{STATUS_LABELS.get(new_status, new_status)}"
+    )
+
+# ================================================================================
+# Tekil Değişiklikler (Koşullu UPDATE)
+# ================================================================================
+
+def tickets_for_update(with_assignee=False):
+    """Durum/atama değişikliği için ertelenmiş (deferred) alanlarla ticket sorgusu"""
+    queryset = Talep.objects.only(*WRITE_FIELDS)
+    if with_assignee:
+        queryset = queryset.select_related('assigned_to').only(*WRITE_FIELDS, 'assigned_to__username')
+    return queryset
+
+def conditional_update(ticket, expected, actor=None, comment=None, **changes):
+    """
+    UPDATE ... SET <changes>, updated_at = now WHERE pk = ticket.pk AND <expected>
+    Satır güncellendiyse ticket nesnesi, rollup ve durum geçmişi güncellenir,
+    `comment` verildiyse actor adına yorum yazılır (hepsi aynı işlemde), True döner.
+    Kayıt arada değiştiyse (expected tutmuyorsa) hiçbir şey yazılmaz, False döner.
+    """
+    changes['updated_at'] = timezone.now()
+    with transaction.atomic():
+        if not Talep.objects.filter(pk=ticket.pk, **expected).update(**changes):
+            return False
+
+        old_status = ticket.status
+        if 'status' in changes and changes['status'] != old_status:
+            record_status_change(ticket.pk, old_status, changes['status'], actor=actor, at=changes['updated_at'])
+        if comment:
+            Comment.objects.create(talep_id=ticket.pk, user=actor, message=comment)
+
+        old_snapshot = getattr(ticket, '_rollup_snapshot', None) or ticket_snapshot(ticket)
+        for field, value in changes.items():
+            setattr(ticket, field, value)
+        new_snapshot = ticket_snapshot(ticket)
+        if old_snapshot is not None and new_snapshot is not None:
+            apply_snapshot_changes([(old_snapshot, new_snapshot)])
+        ticket._rollup_snapshot = new_snapshot
+    return True
+
+def change_status(ticket, new_status, expected_status=None, actor=None, comment=None):
+    """
+    Ticket durumunu koşullu UPDATE ile değiştir.
+    expected_status: istemcinin gördüğü durum (verilmezse okunan durum)
+    actor: değişikliği yapan kullanıcı (durum geçmişine ve yoruma yazılır)
+    """
+    expected_status = expected_status or ticket.status
+    if expected_status != ticket.status:
+        return False
+    return conditional_update(ticket, {'status': expected_status}, actor=actor, comment=comment, status=new_status)
+
+def change_assignment(ticket, assignee, expected_assignee_id=UNCHECKED, actor=None, comment=None):
+    """
+    Ticket atamasını koşullu UPDATE ile değiştir (assignee None: atama kaldırılır).
+    expected_assignee_id: istemcinin gördüğü atanan kullanıcı id'si (int);
+    None: atanmamış olmalı, UNCHECKED: okunan değer kullanılır
+    """
+    current = ticket.assigned_to_id
+    if expected_assignee_id is not UNCHECKED and expected_assignee_id != current:
+        return False
+    return conditional_update(ticket, {'assigned_to': current}, actor=actor, comment=comment, assigned_to=assignee)
+
+# ================================================================================
+# Toplu Durum Değiştirme
+# ================================================================================
+
+def bulk_change_status(ticket_ids, new_status, user):
+    """
+    `ticket_ids` ticket'larını `new_status` durumuna geçir.
+    Dönüş: {'updated': n, 'results': [{'id', 'result', 'old_status', 'new_status', 'message'}]}
+    result: 'updated' | 'unchanged' | 'invalid_transition' | 'not_found'
+    """
+    ticket_ids = list(dict.fromkeys(ticket_ids))
+    results = {}
+    changed = []
+
+    with transaction.atomic():
+        rows = {
+            row['pk']: row
+            for row in Talep.objects.select_for_update()
+            .filter(pk__in=ticket_ids)
+            .order_by()
+            .values('pk', *SNAPSHOT_FIELDS)
+        }
+
+        for ticket_id in ticket_ids:
+            row = rows.get(ticket_id)
+            if row is None:
+                results[ticket_id] = ('not_found', None, 'Talep bulunamadı.')
+            elif row['status'] == new_status:
+                results[ticket_id] = ('unchanged', row['status'], 'Talep zaten bu durumda.')
+            elif not can_transition(row['status'], new_status):
+                results[ticket_id] = (
+                    'invalid_transition',
+                    row['status'],
+                    f'"{STATUS_LABELS.get(row["status"], row["status"])}" durumundan '
+                    f'"{STATUS_LABELS.get(new_status, new_status)}" durumuna geçilemez.',
+                )
+            else:
+                results[ticket_id] = ('updated', row['status'], 'Durum güncellendi.')
+                changed.append(row)
+
+        updated = 0
+        if changed:
+            now = timezone.now()
+            # Satırlar kilitli; durum koşulu yine de okunan durumdan geçişi garanti eder
+            updated = Talep.objects.filter(
+                pk__in=[row['pk'] for row in changed],
+                status__in=source_statuses(new_status),
+            ).update(status=new_status, updated_at=now)
+
+            Comment.objects.bulk_create([
+                Comment(talep_id=row['pk'], user=user, message=status_change_message(row['status'], new_status))
+                for row in changed
+            ])
+            record_status_changes(
+                [(row['pk'], row['status'], new_status) for row in changed], actor=user, at=now,
+            )
+
+            pairs = []
+            for row in changed:
+                old = {field: row[field] for field in SNAPSHOT_FIELDS}
+                pairs.append((old, dict(old, status=new_status, updated_at=now)))
+            apply_snapshot_changes(pairs)
+
+    return {
+        'updated': updated,
+        'results': [
+            {
+                'id': ticket_id,
+                'result': result,
+                'old_status': old_status,
+                'new_status': new_status if result == 'updated' else old_status,
+                'message': message,
+            }
+            for ticket_id, (result, old_status, message) in results.items()
+        ],
+    }
@@ -28,6 +28,12 @@ urlpatterns = [
     # Sadece Admin/Support kullanıcılar tarafından erişilebilir
     # --------------------------------------------------------------------------
     path("<int:pk>/change-status/", views.change_ticket_status, name="change_ticket_status"),
+
+    # --------------------------------------------------------------------------
+    # Toplu Durum Değiştirme (AJAX)
+    # Birden çok ticket tek UPDATE + tek toplu yorum ekleme ile güncellenir
+    # --------------------------------------------------------------------------
+    path("bulk-change-status/", views.bulk_change_ticket_status, name="bulk_change_ticket_status"),
     
     # --------------------------------------------------------------------------
     # Ticket Atama Güncelleme (AJAX)
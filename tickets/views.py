@@ -16,13 +16,18 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.contrib import messages
 from django import forms
-from django.db.models import Count
+from django.db.models import Count, Q
 import json
 
 # Local imports
 from .models import Talep, Comment, Category, SLA
 from .forms import TicketForm, CommentForm
 from accounts.models import CustomUser
+from .pagination import get_page_size, keyset_paginate
+from .transitions import (
+    UNCHECKED, change_assignment, change_status, status_change_message, tickets_for_update,
+)
+from .visibility import can_view_ticket, visible_tickets
 
 User = get_user_model()
 
@@ -48,23 +53,46 @@ def is_support_user(user):
     """Support kullanıcı kontrolü (admin + support)"""
     return is_admin_user(user) or getattr(user, 'role', None) == 'support'
 
+def parse_id(value):
+    """
+    JSON'dan gelen id değerini doğrula: bool olmayan int ya da yalnızca
+    rakamlardan oluşan string. Diğer her şey (1.9, true, " 7 ") ValueError.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        return int(value)
+    raise ValueError(f'Geçersiz id: {value!r}')
+
+def status_conflict_response(pk):
+    """Koşullu durum güncellemesi başka bir değişiklikle çakıştığında 409 yanıtı"""
+    current_status = Talep.objects.filter(pk=pk).values_list('status', flat=True).first()
+    return JsonResponse({
+        'status': 'error',
+        'conflict': True,
+        'message': 'Talep bu arada başka bir kullanıcı tarafından güncellendi. Sayfayı yenileyip tekrar deneyin.',
+        'current_status': current_status
+    }, status=409)
+
+def assignment_conflict_response(pk):
+    """Koşullu atama güncellemesi başka bir değişiklikle çakıştığında 409 yanıtı"""
+    current = Talep.objects.filter(pk=pk).values_list('assigned_to__username', flat=True).first()
+    return JsonResponse({
+        'status': 'error',
+        'conflict': True,
+        'message': 'Talep ataması bu arada başka bir kullanıcı tarafından değiştirildi. Sayfayı yenileyip tekrar deneyin.',
+        'assigned_to': current
+    }, status=409)
+
 def get_user_tickets_queryset(user):
-    """Kullanıcı rolüne göre ticket'ları filtrele"""
-    if is_admin_user(user):
-        return Talep.objects.all()
-    elif is_support_user(user):
-        return Talep.objects.all()
-    else:
-        # Normal kullanıcılar için: kendi talepleri + aynı gruptaki kullanıcıların talepleri
-        user_groups = user.groups.all()
-        if user_groups.exists():
-            # Aynı grupta olan kullanıcıları bul
-            group_users = CustomUser.objects.filter(groups__in=user_groups).distinct()
-            # Bu kullanıcıların taleplerini getir
-            return Talep.objects.filter(user__in=group_users)
-        else:
-            # Grubu yoksa sadece kendi taleplerini görsün
-            return Talep.objects.filter(user=user)
+    """
+    Kullanıcı rolüne göre ticket'ları filtrele
+    Listede gösterilen ilişkiler (user, category, assigned_to) tek sorguda yüklenir
+    Müşteriler: kendi talepleri + aynı gruptaki kullanıcıların talepleri
+    (grup üyelik tablosu üzerinden, tickets.visibility)
+    """
+    tickets = Talep.objects.select_related('user', 'category', 'assigned_to')
+    return visible_tickets(user, tickets)
 
 # ================================================================================
 # Ana View'lar
@@ -111,13 +139,36 @@ def ticket_list(request):
     else:
         support_users = []
 
-    # İstatistikler
-    total_tickets = tickets.count()
-    open_tickets = tickets.filter(status__in=['open', 'in_progress']).count()
-    closed_tickets = tickets.filter(status='closed').count()
+    # İstatistikler (tek aggregate sorgusu)
+    ticket_counts = tickets.aggregate(
+        total=Count('id'),
+        open=Count('id', filter=Q(status__in=['open', 'in_progress'])),
+        closed=Count('id', filter=Q(status='closed')),
+    )
+    total_tickets = ticket_counts['total']
+    open_tickets = ticket_counts['open']
+    closed_tickets = ticket_counts['closed']
+
+    # Keyset sayfalama: (created_at, id) cursor'ı ile sabit maliyetli sayfa okuma
+    page_size = get_page_size(request.GET.get('page_size'))
+    page = keyset_paginate(
+        tickets,
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        page_size=page_size,
+    )
+
+    # Sayfa linkleri için filtreleri koru, cursor parametrelerini çıkar
+    query_params = request.GET.copy()
+    query_params.pop('after', None)
+    query_params.pop('before', None)
+    base_query = query_params.urlencode()
 
     context = {
-        'tickets': tickets,
+        'tickets': page,
+        'page': page,
+        'page_size': page_size,
+        'base_query': base_query,
         'user_role': user_role,
         'categories': categories,
         'support_users': support_users,
@@ -135,11 +186,11 @@ def ticket_list(request):
 @login_required
 def ticket_detail(request, pk):
     """Ticket detay sayfası ve yorum ekleme"""
-    ticket = get_object_or_404(Talep, pk=pk)
+    ticket = get_object_or_404(Talep.objects.select_related('user', 'category', 'assigned_to'), pk=pk)
     user = request.user
     
-    # Yetki kontrolü
-    if not is_support_user(user) and ticket.user != user:
+    # Yetki kontrolü (liste ile aynı görünürlük kuralı)
+    if not can_view_ticket(user, ticket):
         messages.error(request, 'Bu talebe erişim yetkiniz bulunmuyor.')
         return redirect('ticket_list')
     
@@ -165,7 +216,7 @@ def ticket_detail(request, pk):
             return redirect('ticket_detail', pk=pk)
 
     # Yorumları getir
-    comments = Comment.objects.filter(talep=ticket).order_by('created_at')
+    comments = Comment.objects.filter(talep=ticket).select_related('user').order_by('created_at')
     
     # Atanabilir kullanıcılar (sadece admin/support görebilir)
     if is_support_user(user):
@@ -236,7 +287,8 @@ def change_ticket_status(request, pk):
             'message': 'Bu işlem için yetkiniz bulunmuyor.'
         }, status=403)
 
-    ticket = get_object_or_404(Talep, pk=pk)
+    # Yalnızca durum/rollup alanları okunur (description vb. yüklenmez)
+    ticket = get_object_or_404(tickets_for_update(), pk=pk)
     
     try:
         data = json.loads(request.body)
@@ -251,17 +303,15 @@ def change_ticket_status(request, pk):
                 'message': 'Geçersiz durum değeri.'
             })
         
-        old_status = ticket.status
-        ticket.status = new_status
-        ticket.save()
+        # UPDATE ... WHERE status = <eski durum>: arada değiştiyse çakışma
+        # Durum değişikliği yorumu aynı işlemde yazılır
+        if not change_status(
+            ticket, new_status, expected_status=data.get('expected_status'), actor=request.user,
+            comment=status_change_message(ticket.status, new_status),
+        ):
+            return status_conflict_response(pk)
         
-        # Durum değişikliği yorumu ekle
         status_display = dict(ticket.STATUS_CHOICES).get(new_status, new_status)
-        Comment.objects.create(
-            talep=ticket,
-            user=request.user,
-            message=f"🔄 Durum değiştirildi: {dict(ticket.STATUS_CHOICES).get(old_status, old_status)} → {status_display}"
-        )
         
         return JsonResponse({
             'status': 'success',
@@ -280,6 +330,82 @@ def change_ticket_status(request, pk):
             'message': f'Bir hata oluştu: {str(e)}'
         }, status=500)
 
+@require_POST
+@login_required
+def bulk_change_ticket_status(request):
+    """
+    Birden çok ticket'ın durumunu tek istekte değiştir (AJAX)
+    İstek: {"ticket_ids": [1, 2, ...], "status": "open"}
+    Geçişler STATUS_TRANSITIONS haritasına göre ticket bazında doğrulanır
+    """
+    from .transitions import bulk_change_status, max_bulk_ids
+
+    # Sadece admin/support kullanıcıları
+    if not is_support_user(request.user):
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Bu işlem için yetkiniz bulunmuyor.'
+        }, status=403)
+
+    try:
+        data = json.loads(request.body)
+        if not isinstance(data, dict):
+            return JsonResponse({
+                'status': 'error',
+                'message': 'İstek gövdesi bir JSON nesnesi olmalıdır.'
+            }, status=400)
+
+        new_status = data.get('status')
+        ticket_ids = data.get('ticket_ids')
+
+        if new_status not in dict(Talep.STATUS_CHOICES):
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Geçersiz durum değeri.'
+            }, status=400)
+
+        if not isinstance(ticket_ids, list) or not ticket_ids:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'ticket_ids boş olmayan bir liste olmalıdır.'
+            }, status=400)
+
+        try:
+            ticket_ids = [parse_id(ticket_id) for ticket_id in ticket_ids]
+        except ValueError:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'ticket_ids yalnızca sayı içermelidir.'
+            }, status=400)
+
+        if len(ticket_ids) > max_bulk_ids():
+            return JsonResponse({
+                'status': 'error',
+                'message': f'Tek istekte en fazla {max_bulk_ids()} talep güncellenebilir.'
+            }, status=400)
+
+        result = bulk_change_status(ticket_ids, new_status, request.user)
+        status_display = dict(Talep.STATUS_CHOICES).get(new_status, new_status)
+
+        return JsonResponse({
+            'status': 'success',
+            'message': f'{result["updated"]} talebin durumu "{status_display}" olarak güncellendi.',
+            'new_status': new_status,
+            'updated': result['updated'],
+            'results': result['results'],
+        })
+
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Geçersiz JSON verisi.'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Bir hata oluştu: {str(e)}'
+        }, status=500)
+
 @require_POST
 @login_required
 def update_ticket_assignment(request, pk):
@@ -291,29 +417,43 @@ def update_ticket_assignment(request, pk):
             'message': 'Bu işlem için yetkiniz bulunmuyor.'
         }, status=403)
 
-    ticket = get_object_or_404(Talep, pk=pk)
+    # Yalnızca atama/rollup alanları ve mevcut atananın kullanıcı adı okunur
+    ticket = get_object_or_404(tickets_for_update(with_assignee=True), pk=pk)
     
     try:
         data = json.loads(request.body)
-        assigned_to_id = data.get('assigned_to_id')
+        if not isinstance(data, dict):
+            return JsonResponse({
+                'status': 'error',
+                'message': 'İstek gövdesi bir JSON nesnesi olmalıdır.'
+            }, status=400)
+
+        # expected_assigned_to_id: gönderilmezse kontrol yapılmaz, null ise talep atanmamış olmalı
+        try:
+            assigned_to_id = parse_id(data['assigned_to_id']) if data.get('assigned_to_id') else None
+            expected_assignee_id = data.get('expected_assigned_to_id', UNCHECKED)
+            if expected_assignee_id not in (None, UNCHECKED):
+                expected_assignee_id = parse_id(expected_assignee_id)
+        except ValueError:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Kullanıcı id değerleri sayı olmalıdır.'
+            }, status=400)
         
         if assigned_to_id:
             assigned_user = get_object_or_404(User, pk=assigned_to_id)
             old_assigned = ticket.assigned_to
-            ticket.assigned_to = assigned_user
-            ticket.save()
-            
-            # Atama değişikliği yorumu ekle
+
+            # Atama değişikliği yorumu (atama ile aynı işlemde yazılır)
             if old_assigned:
                 message = f"👤 Atama değiştirildi: {old_assigned.username} → {assigned_user.username}"
             else:
                 message = f"👤 Talep atandı: {assigned_user.username}"
-                
-            Comment.objects.create(
-                talep=ticket,
-                user=request.user,
-                message=message
-            )
+
+            if not change_assignment(
+                ticket, assigned_user, expected_assignee_id, actor=request.user, comment=message,
+            ):
+                return assignment_conflict_response(pk)
             
             return JsonResponse({
                 'status': 'success',
@@ -322,15 +462,9 @@ def update_ticket_assignment(request, pk):
             })
         else:
             old_assigned = ticket.assigned_to
-            ticket.assigned_to = None
-            ticket.save()
-            
-            if old_assigned:
-                Comment.objects.create(
-                    talep=ticket,
-                    user=request.user,
-                    message=f"👤 Atama kaldırıldı: {old_assigned.username}"
-                )
+            message = f"👤 Atama kaldırıldı: {old_assigned.username}" if old_assigned else None
+            if not change_assignment(ticket, None, expected_assignee_id, actor=request.user, comment=message):
+                return assignment_conflict_response(pk)
             
             return JsonResponse({
                 'status': 'success',
@@ -481,8 +615,8 @@ def update_ticket_status(request):
         if not ticket_id or not new_status:
             return JsonResponse({'success': False, 'message': 'Eksik bilgi gönderildi.'}, status=400)
         
-        # Ticket'ı bul
-        ticket = get_object_or_404(Talep, pk=ticket_id)
+        # Ticket'ı bul (yalnızca durum/rollup alanları)
+        ticket = get_object_or_404(tickets_for_update(), pk=ticket_id)
         
         # Geçerli status seçenekleri
         valid_statuses = [choice[0] for choice in Talep.STATUS_CHOICES]
@@ -492,9 +626,16 @@ def update_ticket_status(request):
         # Eski durum
         old_status = ticket.get_status_display()
         
-        # Durumu güncelle
-        ticket.status = new_status
-        ticket.save()
+        # Durumu güncelle - UPDATE ... WHERE status = <eski durum>
+        if not change_status(ticket, new_status, expected_status=data.get('expected_status'), actor=request.user):
+            current_status = Talep.objects.filter(pk=ticket_id).values_list('status', flat=True).first()
+            return JsonResponse({
+                'success': False,
+                'message': 'Talep bu arada başka bir kullanıcı tarafından güncellendi. Sayfayı yenileyip tekrar deneyin.',
+                'conflict': True,
+                'current_status': current_status,
+                'ticket_id': ticket_id
+            }, status=409)
         
         # Yeni durum
         new_status_display = ticket.get_status_display()
@@ -0,0 +1,69 @@
+# tickets/visibility.py
+"""
+Yardım Masası - Talep Görünürlüğü
+=================================
+
+Müşteriler kendi taleplerini ve aynı gruptaki kullanıcıların taleplerini
+görür. Görünürlük ayrı bir (viewer → owner) tablosunda saklanmaz; her
+zaman grup üyelik tablosundan (accounts_customuser_groups) okunur:
+
+    talep.user_id IN (
+        SELECT customuser_id FROM üyelik
+        WHERE group_id IN (SELECT group_id FROM üyelik WHERE customuser_id = X)
+        UNION ALL SELECT X
+    )
+
+- DISTINCT yok; alt sorgu semi-join olarak çalışır
+- accounts_membership_group_user_idx (group_id, customuser_id) indeksi
+  grubun üyelerini yalnızca indeksten okur
+- Üyelik değişikliğinde bakım gerekmez (yalnızca üyelik satırı yazılır);
+  grup büyüklüğü ne olursa olsun ek yazma maliyeti yoktur
+
+Liste, detay yetki kontrolü ve müşteri paneli aynı fonksiyonları kullanır.
+"""
+
+from django.contrib.auth import get_user_model
+
+from .models import Talep
+
+User = get_user_model()
+Membership = User.groups.through
+
+# ================================================================================
+# Sorgu Yolu
+# ================================================================================
+
+def sees_all_tickets(user):
+    """Admin ve support kullanıcıları tüm talepleri görür"""
+    return user.is_superuser or getattr(user, 'role', None) in ('admin', 'support')
+
+def user_group_ids(user):
+    """Kullanıcının grupları (subquery)"""
+    return Membership.objects.filter(customuser_id=user.pk).values('group_id')
+
+def visible_owner_ids(user):
+    """Kullanıcının taleplerini görebildiği sahiplerin id'leri: kendisi + grup arkadaşları (subquery)"""
+    group_mates = Membership.objects.filter(group_id__in=user_group_ids(user)).values('customuser_id')
+    return group_mates.union(User.objects.filter(pk=user.pk).values('pk'), all=True)
+
+def group_visible_tickets(user, queryset=None):
+    """Kullanıcının kendi ve grup arkadaşlarının talepleri (rolden bağımsız)"""
+    if queryset is None:
+        queryset = Talep.objects.all()
+    return queryset.filter(user_id__in=visible_owner_ids(user))
+
+def visible_tickets(user, queryset=None):
+    """Kullanıcının rolüne göre görebildiği talepler"""
+    if queryset is None:
+        queryset = Talep.objects.all()
+    if sees_all_tickets(user):
+        return queryset
+    return group_visible_tickets(user, queryset)
+
+def can_view_ticket(user, ticket):
+    """Tek bir talep için görüntüleme yetkisi"""
+    if sees_all_tickets(user) or ticket.user_id == user.pk:
+        return True
+    return Membership.objects.filter(
+        customuser_id=ticket.user_id, group_id__in=user_group_ids(user),
+    ).exists()